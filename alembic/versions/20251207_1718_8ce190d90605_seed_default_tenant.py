@@ -18,11 +18,12 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Insert default tenant
+    # Insert default tenant (idempotent on both PostgreSQL and SQLite)
     op.execute(
         """
         INSERT INTO tenants (id, name, cognito_user_pool_id, created_at, updated_at)
         VALUES ('default-tenant', 'Default Tenant', NULL, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+        ON CONFLICT (id) DO NOTHING
         """
     )
 
@@ -18,9 +18,12 @@ depends_on = None
 
 def upgrade() -> None:
     # Add final_test_loss column to fine_tune_jobs table
-    op.add_column('fine_tune_jobs', sa.Column('final_test_loss', sa.Float(), nullable=True))
+    # (recreate='auto' only rebuilds the table on SQLite when ALTER can't be used)
+    with op.batch_alter_table('fine_tune_jobs', recreate='auto') as batch_op:
+        batch_op.add_column(sa.Column('final_test_loss', sa.Float(), nullable=True, server_default=None))
 
 
 def downgrade() -> None:
     # Remove final_test_loss column from fine_tune_jobs table
-    op.drop_column('fine_tune_jobs', 'final_test_loss')
+    with op.batch_alter_table('fine_tune_jobs', recreate='auto') as batch_op:
+        batch_op.drop_column('final_test_loss')
@@ -0,0 +1,28 @@
+"""add_tenant_created_indexes
+
+Revision ID: b7e2c4f1a9d3
+Revises: 3dcad8ebe15e
+Create Date: 2026-10-15 09:30:12.281904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2c4f1a9d3'
+down_revision = '3dcad8ebe15e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Composite indexes for tenant-scoped keyset pagination on list endpoints
+    op.create_index('ix_datasets_tenant_created', 'datasets', ['tenant_id', 'created_at', 'id'])
+    op.create_index('ix_deployments_tenant_created', 'deployments', ['tenant_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    # Remove composite pagination indexes
+    op.drop_index('ix_deployments_tenant_created', table_name='deployments')
+    op.drop_index('ix_datasets_tenant_created', table_name='datasets')
@@ -0,0 +1,30 @@
+"""add_tenant_lookup_indexes
+
+Revision ID: c4a8d2e6f1b5
+Revises: b7e2c4f1a9d3
+Create Date: 2026-10-15 11:00:41.517203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4a8d2e6f1b5'
+down_revision = 'b7e2c4f1a9d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Composite indexes for tenant-scoped lookups used by inference and job sync
+    op.create_index('ix_adapters_tenant_name_model', 'adapters', ['tenant_id', 'name', 'base_model_id'])
+    op.create_index('ix_deployments_tenant_adapter_status', 'deployments', ['tenant_id', 'adapter_id', 'status'])
+    op.create_index('ix_fine_tune_jobs_tenant_status', 'fine_tune_jobs', ['tenant_id', 'status'])
+
+
+def downgrade() -> None:
+    # Remove composite lookup indexes
+    op.drop_index('ix_fine_tune_jobs_tenant_status', table_name='fine_tune_jobs')
+    op.drop_index('ix_deployments_tenant_adapter_status', table_name='deployments')
+    op.drop_index('ix_adapters_tenant_name_model', table_name='adapters')
@@ -0,0 +1,26 @@
+"""add_deployment_status_last_used_index
+
+Revision ID: d9f3b1a7c2e4
+Revises: c4a8d2e6f1b5
+Create Date: 2026-10-15 23:00:12.804119
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9f3b1a7c2e4'
+down_revision = 'c4a8d2e6f1b5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Index for the stale-deployment scan (status = ACTIVE, by last use)
+    op.create_index('ix_deployments_status_last_used', 'deployments', ['status', 'last_used_at'])
+
+
+def downgrade() -> None:
+    # Remove stale-deployment scan index
+    op.drop_index('ix_deployments_status_last_used', table_name='deployments')
@@ -0,0 +1,25 @@
+"""add_deployment_model_name
+
+Revision ID: e1a4c7b9d2f6
+Revises: d9f3b1a7c2e4
+Create Date: 2026-10-15 23:30:41.215307
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1a4c7b9d2f6'
+down_revision = 'd9f3b1a7c2e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # SageMaker model name, recorded so teardown can skip the Describe calls
+    op.add_column('deployments', sa.Column('model_name', sa.String(length=255), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('deployments', 'model_name')
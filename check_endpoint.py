@@ -1,9 +1,8 @@
-import boto3
-from fastuner.config import get_settings
+from fastuner.utils.aws_clients import get_client
+from botocore.exceptions import WaiterError
 from datetime import datetime, timezone
 
-settings = get_settings()
-sagemaker = boto3.client('sagemaker', region_name=settings.aws_region)
+sagemaker = get_client('sagemaker')
 
 import sys
 
@@ -12,15 +11,28 @@ endpoint_name = sys.argv[1] if len(sys.argv) > 1 else "ft-default-sentiment-adap
 
 try:
     response = sagemaker.describe_endpoint(EndpointName=endpoint_name)
+
+    # Block on the SageMaker waiter (30s backoff, up to 30 min) instead of
+    # re-running this script in a shell loop
+    if response['EndpointStatus'] in ('Creating', 'Updating'):
+        print(f"⏳ Endpoint {endpoint_name} is {response['EndpointStatus']}. "
+              "ML instances can take 15-25 minutes; waiting...")
+        waiter = sagemaker.get_waiter('endpoint_in_service')
+        try:
+            waiter.wait(
+                EndpointName=endpoint_name,
+                WaiterConfig={'Delay': 30, 'MaxAttempts': 60},
+            )
+        except WaiterError as we:
+            print(f"Waiter stopped: {we}")
+        response = sagemaker.describe_endpoint(EndpointName=endpoint_name)
+
     print(f"Endpoint: {endpoint_name}")
     print(f"Status: {response['EndpointStatus']}")
     print(f"Creation Time: {response['CreationTime']}")
 
-    # Calculate time elapsed
-    creation_time = response['CreationTime']
-    if creation_time.tzinfo is None:
-        creation_time = creation_time.replace(tzinfo=timezone.utc)
-    elapsed = datetime.now(timezone.utc) - creation_time
+    # Calculate time elapsed (botocore returns timezone-aware timestamps)
+    elapsed = datetime.now(timezone.utc) - response['CreationTime']
     print(f"Time Elapsed: {elapsed.total_seconds() / 60:.1f} minutes")
 
     if response.get('FailureReason'):
@@ -31,21 +43,21 @@ try:
     if config_name:
         print(f"\nEndpoint Config: {config_name}")
         config = sagemaker.describe_endpoint_config(EndpointConfigName=config_name)
-        model_name = config['ProductionVariants'][0]['ModelName']
+        variants = config.get('ProductionVariants') or []
+        model_name = variants[0]['ModelName'] if variants else None
         print(f"Model Name: {model_name}")
 
         # Get model details to see if there are any issues
-        try:
-            model = sagemaker.describe_model(ModelName=model_name)
-            print(f"\nModel Image: {model['PrimaryContainer']['Image']}")
-            print(f"Model Environment:")
-            for k, v in model['PrimaryContainer']['Environment'].items():
-                print(f"  {k}: {v}")
-        except Exception as me:
-            print(f"Could not get model details: {me}")
-
-    if response['EndpointStatus'] == 'Creating':
-        print("\n⏳ Endpoint is still being created. ML instances can take 15-25 minutes.")
+        if model_name:
+            try:
+                model = sagemaker.describe_model(ModelName=model_name)
+                container = model.get('PrimaryContainer') or {}
+                print(f"\nModel Image: {container.get('Image')}")
+                print(f"Model Environment:")
+                for k, v in (container.get('Environment') or {}).items():
+                    print(f"  {k}: {v}")
+            except Exception as me:
+                print(f"Could not get model details: {me}")
 
 except Exception as e:
     print(f"Error: {e}")
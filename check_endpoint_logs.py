@@ -1,18 +1,18 @@
-import boto3
-from fastuner.config import get_settings
+from fastuner.utils.aws_clients import get_client
+from fastuner.utils.cloudwatch import fetch_log_events
 
-settings = get_settings()
-logs = boto3.client('logs', region_name=settings.aws_region)
+logs = get_client('logs')
 
 import sys
 
 # Get endpoint name from command line or use default
 endpoint_name = sys.argv[1] if len(sys.argv) > 1 else "ft-default-sentiment-adapt-dep-98cc"
+log_group = '/aws/sagemaker/Endpoints/' + endpoint_name
 
 try:
     # Get log streams for this endpoint
     streams = logs.describe_log_streams(
-        logGroupName='/aws/sagemaker/Endpoints/' + endpoint_name,
+        logGroupName=log_group,
         descending=True,
         limit=5
     )
@@ -26,14 +26,7 @@ try:
         print("="*80)
 
         # Get the last 100 log events
-        events = logs.get_log_events(
-            logGroupName='/aws/sagemaker/Endpoints/' + endpoint_name,
-            logStreamName=stream_name,
-            limit=100,
-            startFromHead=False
-        )
-
-        for event in events['events']:
+        for event in fetch_log_events(log_group, stream_name, tail=100):
             print(event['message'])
     else:
         print("No log streams found yet")
@@ -45,7 +38,7 @@ except Exception as e:
     # Try AllTraffic variant logs
     try:
         streams = logs.describe_log_streams(
-            logGroupName='/aws/sagemaker/Endpoints/' + endpoint_name,
+            logGroupName=log_group,
             logStreamNamePrefix='AllTraffic',
             descending=True,
             limit=5
@@ -56,14 +49,7 @@ except Exception as e:
             print(f"Reading from: {stream_name}\n")
             print("="*80)
 
-            events = logs.get_log_events(
-                logGroupName='/aws/sagemaker/Endpoints/' + endpoint_name,
-                logStreamName=stream_name,
-                limit=100,
-                startFromHead=False
-            )
-
-            for event in events['events']:
+            for event in fetch_log_events(log_group, stream_name, tail=100):
                 print(event['message'])
     except Exception as e2:
         print(f"Error: {e2}")
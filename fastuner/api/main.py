@@ -1,12 +1,17 @@
 """Main FastAPI application"""
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 
 from fastuner.config import get_settings
 from fastuner.api.v0 import router as v0_router
+from fastuner.utils.aws_clients import warm_clients
+from fastuner.core.inference import last_used_tracker
 
 settings = get_settings()
 
@@ -17,6 +22,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown"""
+    # Shared boto3 clients live for the process; build them before serving
+    warm_clients()
+    flusher = asyncio.create_task(last_used_tracker.run(settings.last_used_flush_interval))
+    yield
+    flusher.cancel()
+    try:
+        await flusher
+    except asyncio.CancelledError:
+        pass
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Fastuner API",
@@ -24,6 +43,8 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -40,7 +61,7 @@ app.add_middleware(
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler for unhandled errors"""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -0,0 +1,45 @@
+"""Response helpers for API endpoints"""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache()
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter for List[schema], built once per schema"""
+    return TypeAdapter(List[schema])
+
+
+def orm_list_response(
+    schema: Type[BaseModel],
+    rows: Sequence[Any],
+    headers: Optional[Dict[str, str]] = None,
+) -> ORJSONResponse:
+    """
+    Serialize ORM rows to JSON in one pydantic-core pass.
+
+    FastAPI would validate the return value against response_model, dump it
+    and then run jsonable_encoder over the result. Here the whole list is
+    validated and dumped to JSON-ready data by a single cached TypeAdapter
+    call, so the payload matches what the single-object routes return
+    (datetimes, enums and floats formatted by Pydantic), and orjson only
+    writes out plain types. Keeping response_model on the route preserves
+    the OpenAPI schema.
+
+    Args:
+        schema: Response schema (must allow from_attributes)
+        rows: ORM objects
+        headers: Optional response headers
+
+    Returns:
+        ORJSONResponse with a JSON array of objects
+    """
+    adapter = _list_adapter(schema)
+    content = adapter.dump_python(
+        adapter.validate_python(rows, from_attributes=True),
+        mode="json",
+    )
+    return ORJSONResponse(content=content, headers=headers)
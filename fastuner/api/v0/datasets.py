@@ -1,17 +1,22 @@
 """Dataset API endpoints"""
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Form
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from typing import List, Optional
+import asyncio
 import logging
 import random
 
-from fastuner.database import get_db
+from fastuner.database import get_async_db
+from fastuner.api.responses import orm_list_response
 from fastuner.schemas.dataset import DatasetResponse, DatasetCreate
 from fastuner.models.dataset import Dataset, TaskType
-from fastuner.core.dataset import DatasetValidator, ValidationError, DatasetSplitter
+from fastuner.core.dataset import DatasetValidator, ValidationError, DatasetSplitter, iter_split
 from fastuner.utils.s3 import get_s3_client
 from fastuner.utils.id_generator import generate_dataset_id
+from fastuner.utils.pagination import apply_keyset, next_cursor, NEXT_CURSOR_HEADER
 from fastuner.config import get_settings
 
 router = APIRouter()
@@ -25,7 +30,7 @@ async def create_dataset(
     name: str = Form(...),
     task_type: str = Form(...),
     tenant_id: str = Form(...),  # TODO: Extract from JWT token
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Upload and validate a dataset.
@@ -39,25 +44,21 @@ async def create_dataset(
     6. Returns dataset metadata
     """
     try:
-        # Read file content
-        content = await file.read()
-        file_content = content.decode("utf-8")
-
-        # Step 1 & 2: Validate and parse JSONL
+        # Step 1 & 2: Validate and parse JSONL from the spooled upload (in a
+        # worker thread, since the spool may live on disk; large files are
+        # further spread across processes)
         logger.info(f"Validating dataset '{name}' for tenant {tenant_id}")
         try:
-            records = DatasetValidator.validate_jsonl(file_content)
+            records = await asyncio.to_thread(DatasetValidator.validate_file, file.file)
         except ValidationError as e:
             raise HTTPException(status_code=400, detail=f"Validation error: {str(e)}")
 
         # Step 3 & 4: Split dataset
         split_seed = random.randint(1, 1000000)
         try:
-            splits = DatasetSplitter.split(
-                records=records,
-                task_type=task_type,
-                seed=split_seed,
-            )
+            # Index arrays only; each split's records are gathered lazily
+            # while it is serialized for upload
+            splits = DatasetSplitter.split_indices(len(records), seed=split_seed)
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Splitting error: {str(e)}")
 
@@ -66,22 +67,30 @@ async def create_dataset(
         s3_client = get_s3_client()
 
         raw_key = f"{tenant_id}/datasets/{dataset_id}/raw.jsonl"
-        train_key = f"{tenant_id}/datasets/{dataset_id}/train.jsonl"
-        val_key = f"{tenant_id}/datasets/{dataset_id}/val.jsonl"
-        test_key = f"{tenant_id}/datasets/{dataset_id}/test.jsonl"
+        train_key = f"{tenant_id}/datasets/{dataset_id}/train.jsonl.gz"
+        val_key = f"{tenant_id}/datasets/{dataset_id}/val.jsonl.gz"
+        test_key = f"{tenant_id}/datasets/{dataset_id}/test.jsonl.gz"
+
+        uploads = [
+            (train_key, iter_split(records, splits["train"])),
+            (val_key, iter_split(records, splits["val"])),
+            (test_key, iter_split(records, splits["test"])),
+        ]
 
         try:
-            raw_s3_path = s3_client.upload_jsonl(
-                settings.s3_datasets_bucket, raw_key, records
-            )
-            train_s3_path = s3_client.upload_jsonl(
-                settings.s3_datasets_bucket, train_key, splits["train"]
-            )
-            val_s3_path = s3_client.upload_jsonl(
-                settings.s3_datasets_bucket, val_key, splits["val"]
-            )
-            test_s3_path = s3_client.upload_jsonl(
-                settings.s3_datasets_bucket, test_key, splits["test"]
+            # Upload all four files concurrently; the raw file is streamed
+            # straight from the spooled upload instead of being re-serialized
+            await asyncio.to_thread(file.file.seek, 0)
+            raw_s3_path, train_s3_path, val_s3_path, test_s3_path = await asyncio.gather(
+                asyncio.to_thread(
+                    s3_client.upload_fileobj, settings.s3_datasets_bucket, raw_key, file.file
+                ),
+                *(
+                    s3_client.upload_jsonl_async(
+                        settings.s3_datasets_bucket, key, recs, compress=True
+                    )
+                    for key, recs in uploads
+                ),
             )
         except Exception as e:
             logger.error(f"S3 upload failed: {e}")
@@ -107,8 +116,7 @@ async def create_dataset(
         )
 
         db.add(dataset)
-        db.commit()
-        db.refresh(dataset)
+        await db.commit()
 
         logger.info(f"Dataset {dataset_id} created successfully")
         return dataset
@@ -123,35 +131,45 @@ async def create_dataset(
 @router.get("/", response_model=List[DatasetResponse])
 async def list_datasets(
     tenant_id: str,  # TODO: Extract from JWT token
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """List all datasets for a tenant"""
-    datasets = (
-        db.query(Dataset)
-        .filter(Dataset.tenant_id == tenant_id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    """
+    List datasets for a tenant, newest first.
+
+    Pass the X-Next-Cursor response header back as `cursor` to fetch the
+    next page; the header is absent on the last page.
+    """
+    # DatasetResponse only reads columns; never lazy-load relationships per row
+    query = (
+        select(Dataset)
+        .options(raiseload("*"))
+        .where(Dataset.tenant_id == tenant_id)
     )
-    return datasets
+    try:
+        query = apply_keyset(query, Dataset, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    result = await db.execute(query)
+    datasets = result.scalars().all()
+
+    cursor_out = next_cursor(datasets, limit)
+    headers = {NEXT_CURSOR_HEADER: cursor_out} if cursor_out else None
+    return orm_list_response(DatasetResponse, datasets, headers=headers)
 
 
 @router.get("/{dataset_id}", response_model=DatasetResponse)
 async def get_dataset(
     dataset_id: str,
     tenant_id: str,  # TODO: Extract from JWT token
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get dataset metadata by ID"""
-    dataset = (
-        db.query(Dataset)
-        .filter(Dataset.id == dataset_id, Dataset.tenant_id == tenant_id)
-        .first()
-    )
+    dataset = await db.get(Dataset, dataset_id, options=[raiseload("*")])
 
-    if not dataset:
+    if not dataset or dataset.tenant_id != tenant_id:
         raise HTTPException(status_code=404, detail="Dataset not found")
 
     return dataset
@@ -161,23 +179,27 @@ async def get_dataset(
 async def delete_dataset(
     dataset_id: str,
     tenant_id: str,  # TODO: Extract from JWT token
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Delete a dataset"""
-    dataset = (
-        db.query(Dataset)
-        .filter(Dataset.id == dataset_id, Dataset.tenant_id == tenant_id)
-        .first()
-    )
+    """Delete a dataset (S3 files are removed after the response is sent)"""
+    dataset = await db.get(Dataset, dataset_id)
 
-    if not dataset:
+    if not dataset or dataset.tenant_id != tenant_id:
         raise HTTPException(status_code=404, detail="Dataset not found")
 
     # Delete from database
-    db.delete(dataset)
-    db.commit()
+    await db.delete(dataset)
+    await db.commit()
+
+    # Delete S3 files once the 204 has been sent
+    background_tasks.add_task(_delete_dataset_files, tenant_id, dataset_id)
 
-    # Delete S3 files
+    return None
+
+
+def _delete_dataset_files(tenant_id: str, dataset_id: str) -> None:
+    """Delete a dataset's S3 files (runs as a background task)"""
     try:
         s3_client = get_s3_client()
         prefix = f"{tenant_id}/datasets/{dataset_id}/"
@@ -185,6 +207,3 @@ async def delete_dataset(
         logger.info(f"Deleted S3 files for dataset {dataset_id}")
     except Exception as e:
         logger.error(f"Failed to delete S3 files: {e}")
-        # Continue even if S3 deletion fails
-
-    return None
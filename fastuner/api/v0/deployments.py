@@ -1,62 +1,81 @@
 """Deployment API endpoints"""
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from typing import List, Optional
+import asyncio
 import logging
-from datetime import datetime
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
 
-from fastuner.database import get_db
+from fastuner.database import get_async_db, get_db_context
+from fastuner.api.responses import orm_list_response
 from fastuner.schemas.deployment import DeploymentResponse, DeploymentCreate
 from fastuner.models.deployment import Deployment, DeploymentStatus
 from fastuner.models.adapter import Adapter
-from fastuner.core.inference import InferenceOrchestrator
+from fastuner.core.inference import get_inference_orchestrator
 from fastuner.utils.id_generator import generate_deployment_id
+from fastuner.utils.aws_cache import cached_describe_endpoint, invalidate_endpoint
+from fastuner.utils.pagination import apply_keyset, next_cursor, NEXT_CURSOR_HEADER
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
-inference_orchestrator = InferenceOrchestrator()
+inference_orchestrator = get_inference_orchestrator()
 
+# SageMaker resource names allow only alphanumerics and single hyphens
+_NON_ALNUM = re.compile(r"[^A-Za-z0-9-]+")
+_DASHES = re.compile(r"-{2,}")
 
-@router.post("/", response_model=DeploymentResponse, status_code=201)
+_DELETION_STATUSES = (DeploymentStatus.DELETING, DeploymentStatus.DELETED)
+
+
+def _sanitize(s: str) -> str:
+    """Sanitize a string for use in a SageMaker resource name"""
+    return _DASHES.sub("-", _NON_ALNUM.sub("-", s)).strip("-")
+
+
+@lru_cache(maxsize=1024)
+def _endpoint_prefix(tenant_id: str, adapter_name: str) -> str:
+    """Sanitized 'ft-<tenant>-<adapter>' prefix; repeats per tenant/adapter pair"""
+    return f"ft-{_sanitize(tenant_id[:8])}-{_sanitize(adapter_name[:15])}"
+
+
+@router.post("/", response_model=DeploymentResponse, status_code=202)
 async def create_deployment(
     deployment_request: DeploymentCreate,
     tenant_id: str,  # TODO: Extract from JWT token
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Create a new deployment (inference endpoint).
 
     This endpoint:
     1. Validates adapter exists
-    2. Creates SageMaker endpoint with adapter
-    3. Stores deployment metadata
-    4. Returns deployment details
+    2. Stores deployment metadata with status CREATING
+    3. Schedules SageMaker endpoint creation in the background
+    4. Returns deployment details immediately (202 Accepted)
+
+    Poll GET /v0/deployments to see the status move to active or failed.
     """
     try:
-        # Step 1: Validate adapter exists
-        adapter = (
-            db.query(Adapter)
-            .filter(Adapter.id == deployment_request.adapter_id, Adapter.tenant_id == tenant_id)
-            .first()
+        # Step 1: Validate adapter exists (only the columns needed below)
+        result = await db.execute(
+            select(Adapter.name, Adapter.base_model_id, Adapter.s3_path).where(
+                Adapter.id == deployment_request.adapter_id, Adapter.tenant_id == tenant_id
+            )
         )
+        adapter = result.one_or_none()
 
         if not adapter:
             raise HTTPException(status_code=404, detail="Adapter not found")
 
         # Step 2: Create deployment record
         deployment_id = generate_deployment_id()
-        # Sanitize names for SageMaker (alphanumeric and single hyphens only)
-        def sanitize(s):
-            result = "".join(c if c.isalnum() or c == "-" else "-" for c in s)
-            while "--" in result:
-                result = result.replace("--", "-")
-            return result.strip("-")
-
-        sanitized_tenant = sanitize(tenant_id[:8])
-        sanitized_name = sanitize(adapter.name[:15])
-        sanitized_dep_id = sanitize(deployment_id[:8])
-        endpoint_name = f"ft-{sanitized_tenant}-{sanitized_name}-{sanitized_dep_id}"
+        endpoint_name = f"{_endpoint_prefix(tenant_id, adapter.name)}-{_sanitize(deployment_id[:8])}"
 
         deployment = Deployment(
             id=deployment_id,
@@ -67,133 +86,249 @@ async def create_deployment(
             instance_count=deployment_request.instance_count,
             status=DeploymentStatus.CREATING,
             ttl_seconds=deployment_request.ttl_seconds,
-            last_used_at=datetime.utcnow(),
+            last_used_at=datetime.now(timezone.utc),
         )
 
         db.add(deployment)
-        db.commit()
+        await db.commit()
 
-        # Step 3: Create SageMaker endpoint
-        try:
-            endpoint_result = inference_orchestrator.create_or_get_endpoint(
-                tenant_id=tenant_id,
-                base_model_id=adapter.base_model_id,
-                adapter_s3_path=adapter.s3_path,
-                endpoint_name=endpoint_name,
-                instance_type=deployment_request.instance_type,
-                instance_count=deployment_request.instance_count,
-            )
+        # Step 3: Create SageMaker endpoint after the response is sent
+        background_tasks.add_task(
+            _provision_endpoint,
+            deployment_id=deployment_id,
+            tenant_id=tenant_id,
+            base_model_id=adapter.base_model_id,
+            adapter_s3_path=adapter.s3_path,
+            endpoint_name=endpoint_name,
+            instance_type=deployment_request.instance_type,
+            instance_count=deployment_request.instance_count,
+        )
+
+        logger.info(f"Accepted deployment {deployment_id} for endpoint {endpoint_name}")
+        return deployment
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error creating deployment: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+def _provision_endpoint(
+    deployment_id: str,
+    tenant_id: str,
+    base_model_id: str,
+    adapter_s3_path: str,
+    endpoint_name: str,
+    instance_type: str,
+    instance_count: int,
+) -> None:
+    """
+    Create the SageMaker endpoint for a deployment (runs as a background task).
+
+    Uses its own database session since the request's session is closed by
+    the time this runs. Records endpoint details on success, or marks the
+    deployment FAILED. The deployment is re-read before and after creation so
+    a DELETE issued while provisioning wins: creation is skipped, or the new
+    endpoint is torn down and the deletion status is left untouched.
+    """
+    with get_db_context() as db:
+        deployment = db.get(Deployment, deployment_id)
+        if not deployment or deployment.status in _DELETION_STATUSES:
+            logger.info(f"Deployment {deployment_id} was deleted before provisioning started")
+            return
+
+    try:
+        endpoint_result = inference_orchestrator.create_or_get_endpoint(
+            tenant_id=tenant_id,
+            base_model_id=base_model_id,
+            adapter_s3_path=adapter_s3_path,
+            endpoint_name=endpoint_name,
+            instance_type=instance_type,
+            instance_count=instance_count,
+            # Endpoint names embed the new deployment's id, so none exists yet
+            assume_new=True,
+        )
+    except Exception as e:
+        logger.error(f"Failed to create endpoint for deployment {deployment_id}: {e}")
+        endpoint_result = None
 
+    invalidate_endpoint(endpoint_name)
+
+    with get_db_context() as db:
+        deployment = db.get(Deployment, deployment_id)
+        if not deployment or deployment.status in _DELETION_STATUSES:
+            logger.info(f"Deployment {deployment_id} was deleted while provisioning")
+            if endpoint_result is not None:
+                _discard_endpoint(endpoint_name, endpoint_result)
+            return
+
+        if endpoint_result is None:
+            deployment.status = DeploymentStatus.FAILED
+        else:
             # Update deployment with endpoint details
             deployment.endpoint_arn = endpoint_result.get("endpoint_arn")
             deployment.endpoint_config_name = endpoint_result.get("config_name")
-
-            db.commit()
-            db.refresh(deployment)
-
+            deployment.model_name = endpoint_result.get("model_name")
             logger.info(f"Created deployment {deployment_id} with endpoint {endpoint_name}")
 
-        except Exception as e:
-            # Update deployment status to failed
-            deployment.status = DeploymentStatus.FAILED
-            db.commit()
-            raise HTTPException(status_code=500, detail=f"Failed to create endpoint: {str(e)}")
+        db.commit()
 
-        return deployment
 
-    except HTTPException:
-        raise
+def _discard_endpoint(endpoint_name: str, endpoint_result: dict) -> None:
+    """Tear down an endpoint created for a deployment that was deleted meanwhile."""
+    try:
+        inference_orchestrator.delete_endpoint(
+            endpoint_name,
+            config_name=endpoint_result.get("config_name"),
+            model_name=endpoint_result.get("model_name"),
+        )
     except Exception as e:
-        logger.error(f"Unexpected error creating deployment: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+        logger.error(f"Failed to tear down orphaned endpoint {endpoint_name}: {e}")
+    invalidate_endpoint(endpoint_name)
 
 
 @router.get("/", response_model=List[DeploymentResponse])
 async def list_deployments(
     tenant_id: str,  # TODO: Extract from JWT token
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """List all deployments for a tenant and sync status from SageMaker"""
-    deployments = (
-        db.query(Deployment)
-        .filter(Deployment.tenant_id == tenant_id)
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
-
-    # Sync status for creating deployments
-    for deployment in deployments:
-        if deployment.status == DeploymentStatus.CREATING:
-            try:
-                endpoint_status = inference_orchestrator.get_endpoint_status(deployment.endpoint_name)
+    """
+    List deployments for a tenant (newest first) and sync status from SageMaker.
 
-                # Map SageMaker status to our status
-                sagemaker_status = endpoint_status["status"]
-                if sagemaker_status == "InService":
-                    deployment.status = DeploymentStatus.ACTIVE
-                elif sagemaker_status in ["Failed"]:
-                    deployment.status = DeploymentStatus.FAILED
+    Pass the X-Next-Cursor response header back as `cursor` to fetch the
+    next page; the header is absent on the last page.
+    """
+    # DeploymentResponse only reads columns; never lazy-load relationships per row
+    query = (
+        select(Deployment)
+        .options(raiseload("*"))
+        .where(Deployment.tenant_id == tenant_id)
+    )
+    try:
+        query = apply_keyset(query, Deployment, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    result = await db.execute(query)
+    deployments = result.scalars().all()
+
+    # Sync status for creating deployments, fanning the describe calls out
+    # to worker threads so they run concurrently and off the event loop
+    to_sync = [d for d in deployments if d.status == DeploymentStatus.CREATING]
+    results = await asyncio.gather(
+        *(asyncio.to_thread(cached_describe_endpoint, d.endpoint_name) for d in to_sync),
+        return_exceptions=True,
+    )
 
-            except Exception as e:
-                logger.warning(f"Failed to sync SageMaker status for deployment {deployment.id}: {e}")
+    # Apply updates here so session access stays on a single thread
+    for deployment, endpoint in zip(to_sync, results):
+        if isinstance(endpoint, Exception):
+            logger.warning(f"Failed to sync SageMaker status for deployment {deployment.id}: {endpoint}")
+            continue
+
+        # Map SageMaker status to our status
+        sagemaker_status = endpoint["EndpointStatus"]
+        if sagemaker_status == "InService":
+            deployment.status = DeploymentStatus.ACTIVE
+        elif sagemaker_status in ["Failed"]:
+            deployment.status = DeploymentStatus.FAILED
 
-    db.commit()
+    await db.commit()
 
-    return deployments
+    cursor_out = next_cursor(deployments, limit)
+    headers = {NEXT_CURSOR_HEADER: cursor_out} if cursor_out else None
+    return orm_list_response(DeploymentResponse, deployments, headers=headers)
 
 
 @router.get("/{deployment_id}", response_model=DeploymentResponse)
 async def get_deployment(
     deployment_id: str,
     tenant_id: str,  # TODO: Extract from JWT token
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get deployment details by ID"""
-    deployment = (
-        db.query(Deployment)
-        .filter(Deployment.id == deployment_id, Deployment.tenant_id == tenant_id)
-        .first()
-    )
+    deployment = await db.get(Deployment, deployment_id, options=[raiseload("*")])
 
-    if not deployment:
+    if not deployment or deployment.tenant_id != tenant_id:
         raise HTTPException(status_code=404, detail="Deployment not found")
 
     return deployment
 
 
-@router.delete("/{deployment_id}", status_code=204)
+@router.delete("/{deployment_id}", status_code=202)
 async def delete_deployment(
     deployment_id: str,
     tenant_id: str,  # TODO: Extract from JWT token
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Delete a deployment and tear down the endpoint"""
-    deployment = (
-        db.query(Deployment)
-        .filter(Deployment.id == deployment_id, Deployment.tenant_id == tenant_id)
-        .first()
-    )
+    """
+    Delete a deployment and tear down the endpoint.
+
+    Marks the deployment DELETING and returns 202 immediately; the SageMaker
+    endpoint, config and model are deleted in a background task, which then
+    marks the deployment DELETED. If that teardown fails (or the process
+    exits first) the deployment stays DELETING and the next cleanup cycle
+    retries it. Repeated calls are no-ops.
+    """
+    deployment = await db.get(Deployment, deployment_id)
 
-    if not deployment:
+    if not deployment or deployment.tenant_id != tenant_id:
         raise HTTPException(status_code=404, detail="Deployment not found")
 
-    # Delete SageMaker endpoint
+    if deployment.status in _DELETION_STATUSES:
+        return None
+
+    deployment.status = DeploymentStatus.DELETING
+    await db.commit()
+
+    background_tasks.add_task(
+        _teardown_endpoint,
+        deployment_id=deployment_id,
+        endpoint_name=deployment.endpoint_name,
+        config_name=deployment.endpoint_config_name,
+        model_name=deployment.model_name,
+    )
+
+    return None
+
+
+def _teardown_endpoint(
+    deployment_id: str,
+    endpoint_name: str,
+    config_name: Optional[str] = None,
+    model_name: Optional[str] = None,
+) -> None:
+    """
+    Delete the SageMaker endpoint for a deployment (runs as a background task).
+
+    Uses its own database session since the request's session is closed by
+    the time this runs. The deployment is marked DELETED once teardown
+    succeeds; on failure it stays DELETING and the cleanup cycle retries it.
+    """
     try:
         inference_orchestrator.delete_endpoint(
-            endpoint_name=deployment.endpoint_name,
+            endpoint_name=endpoint_name,
             delete_config=True,
             delete_model=True,
+            config_name=config_name,
+            model_name=model_name,
         )
-        logger.info(f"Deleted SageMaker endpoint {deployment.endpoint_name}")
+        logger.info(f"Deleted SageMaker endpoint {endpoint_name}")
     except Exception as e:
-        logger.error(f"Failed to delete endpoint: {e}")
-        # Continue even if deletion fails
-
-    # Update deployment status
-    deployment.status = DeploymentStatus.DELETED
-    db.commit()
-
-    return None
+        logger.error(f"Failed to delete endpoint, leaving it to the cleanup cycle: {e}")
+        return
+    finally:
+        invalidate_endpoint(endpoint_name)
+
+    with get_db_context() as db:
+        deployment = db.get(Deployment, deployment_id)
+        if not deployment:
+            logger.warning(f"Deployment {deployment_id} disappeared before teardown finished")
+            return
+
+        deployment.status = DeploymentStatus.DELETED
+        db.commit()
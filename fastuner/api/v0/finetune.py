@@ -1,27 +1,41 @@
 """Fine-tune job API endpoints"""
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload
 from typing import List, Dict, Optional
+import asyncio
 import logging
-import boto3
 import json
 
-from fastuner.database import get_db
+from fastuner.database import get_async_db, get_db_context
+from fastuner.api.responses import orm_list_response
 from fastuner.schemas.finetune import FineTuneJobResponse, FineTuneJobCreate
 from fastuner.models.fine_tune_job import FineTuneJob, FineTuneMethod, JobStatus
 from fastuner.models.dataset import Dataset
 from fastuner.models.adapter import Adapter
-from fastuner.core.training import TrainingOrchestrator
+from fastuner.core.training import get_training_orchestrator
 from fastuner.utils.id_generator import generate_job_id, generate_adapter_id
 from fastuner.config import get_settings
+from fastuner.utils.aws_clients import get_client
 
 settings = get_settings()
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
-training_orchestrator = TrainingOrchestrator()
-s3_client = boto3.client('s3')
+training_orchestrator = get_training_orchestrator()
+s3_client = get_client("s3")
+
+# Request fields forwarded to the training job as hyperparameters
+_CORE_HYPERPARAMETERS = {
+    "learning_rate",
+    "num_epochs",
+    "batch_size",
+    "lora_rank",
+    "lora_alpha",
+    "lora_dropout",
+}
 
 
 def retrieve_metrics_from_s3(job_name: str, output_s3_path: str) -> Optional[Dict]:
@@ -68,28 +82,32 @@ def retrieve_metrics_from_s3(job_name: str, output_s3_path: str) -> Optional[Dic
         return None
 
 
-@router.post("/", response_model=FineTuneJobResponse, status_code=201)
+@router.post("/", response_model=FineTuneJobResponse, status_code=202)
 async def create_fine_tune_job(
     job_request: FineTuneJobCreate,
     tenant_id: str,  # TODO: Extract from JWT token
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Create a new fine-tuning job.
 
     This endpoint:
     1. Validates the request parameters
-    2. Creates a SageMaker training job
-    3. Stores job metadata in the database
-    4. Returns job details
+    2. Stores job metadata with status PENDING
+    3. Schedules SageMaker training job creation in the background
+    4. Returns job details immediately (202 Accepted)
+
+    Poll GET /v0/fine-tune-jobs/{job_id} to see the status move to running.
     """
     try:
-        # Step 1: Validate dataset exists
-        dataset = (
-            db.query(Dataset)
-            .filter(Dataset.id == job_request.dataset_id, Dataset.tenant_id == tenant_id)
-            .first()
+        # Step 1: Validate dataset exists (only the split paths are needed)
+        result = await db.execute(
+            select(Dataset.train_s3_path, Dataset.val_s3_path, Dataset.test_s3_path).where(
+                Dataset.id == job_request.dataset_id, Dataset.tenant_id == tenant_id
+            )
         )
+        dataset = result.one_or_none()
 
         if not dataset:
             raise HTTPException(status_code=404, detail="Dataset not found")
@@ -97,17 +115,10 @@ async def create_fine_tune_job(
         # Step 2: Create job record
         job_id = generate_job_id()
 
-        hyperparameters = {
-            "learning_rate": job_request.learning_rate,
-            "num_epochs": job_request.num_epochs,
-            "batch_size": job_request.batch_size,
-            "lora_rank": job_request.lora_rank,
-            "lora_alpha": job_request.lora_alpha,
-            "lora_dropout": job_request.lora_dropout,
-        }
-
-        if job_request.hyperparameters:
-            hyperparameters.update(job_request.hyperparameters)
+        # Explicit overrides in job_request.hyperparameters win over the core fields
+        hyperparameters = job_request.model_dump(include=_CORE_HYPERPARAMETERS) | (
+            job_request.hyperparameters or {}
+        )
 
         fine_tune_job = FineTuneJob(
             id=job_id,
@@ -128,50 +139,97 @@ async def create_fine_tune_job(
         )
 
         db.add(fine_tune_job)
-        db.commit()
+        await db.commit()
 
-        # Step 3: Create SageMaker training job
-        try:
-            dataset_s3_paths = {
+        # Step 3: Create SageMaker training job off the request path
+        background_tasks.add_task(
+            _launch_training_job,
+            job_id=job_id,
+            tenant_id=tenant_id,
+            base_model_id=job_request.base_model_id,
+            dataset_s3_paths={
                 "train": dataset.train_s3_path,
                 "val": dataset.val_s3_path,
                 "test": dataset.test_s3_path,
-            }
-
-            sagemaker_job = training_orchestrator.create_training_job(
-                job_id=job_id,
-                tenant_id=tenant_id,
-                base_model_id=job_request.base_model_id,
-                dataset_s3_paths=dataset_s3_paths,
-                adapter_name=job_request.adapter_name,
-                method=FineTuneMethod(job_request.method),
-                hyperparameters=hyperparameters,
-            )
+            },
+            adapter_name=job_request.adapter_name,
+            method=FineTuneMethod(job_request.method),
+            hyperparameters=hyperparameters,
+        )
 
+        logger.info(f"Accepted fine-tune job {job_id}")
+        return fine_tune_job
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error creating fine-tune job: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+def _launch_training_job(
+    job_id: str,
+    tenant_id: str,
+    base_model_id: str,
+    dataset_s3_paths: Dict[str, str],
+    adapter_name: str,
+    method: FineTuneMethod,
+    hyperparameters: Dict,
+) -> None:
+    """
+    Create the SageMaker training job for a fine-tune job (runs as a background task).
+
+    Uses its own database session since the request's session is closed by
+    the time this runs. Records SageMaker job details on success, or marks
+    the job FAILED with the error message.
+    """
+    try:
+        sagemaker_job = training_orchestrator.create_training_job(
+            job_id=job_id,
+            tenant_id=tenant_id,
+            base_model_id=base_model_id,
+            dataset_s3_paths=dataset_s3_paths,
+            adapter_name=adapter_name,
+            method=method,
+            hyperparameters=hyperparameters,
+        )
+        error = None
+    except Exception as e:
+        logger.error(f"Failed to create SageMaker job for fine-tune job {job_id}: {e}")
+        sagemaker_job = None
+        error = str(e)
+
+    with get_db_context() as db:
+        fine_tune_job = db.get(FineTuneJob, job_id)
+        if not fine_tune_job:
+            logger.warning(f"Fine-tune job {job_id} disappeared before launch finished")
+            return
+
+        if sagemaker_job is None:
+            fine_tune_job.status = JobStatus.FAILED
+            fine_tune_job.error_message = f"Failed to create SageMaker job: {error}"
+        else:
             # Update job with SageMaker details
             fine_tune_job.sagemaker_job_name = sagemaker_job["job_name"]
             fine_tune_job.sagemaker_job_arn = sagemaker_job["job_arn"]
             fine_tune_job.status = JobStatus.RUNNING
-
-            db.commit()
-            db.refresh(fine_tune_job)
-
             logger.info(f"Created fine-tune job {job_id} with SageMaker job {sagemaker_job['job_name']}")
 
-        except Exception as e:
-            # Update job status to failed
-            fine_tune_job.status = JobStatus.FAILED
-            fine_tune_job.error_message = str(e)
-            db.commit()
-            raise HTTPException(status_code=500, detail=f"Failed to create SageMaker job: {str(e)}")
+        db.commit()
 
-        return fine_tune_job
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error creating fine-tune job: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+# Built once at import so each request only binds parameters; SQLAlchemy's
+# compiled cache then serves the SQL string without re-walking the statement
+_LIST_JOBS_STMT = (
+    select(FineTuneJob)
+    .options(
+        joinedload(FineTuneJob.adapter),  # Eager load adapter relationship
+        raiseload("*"),  # Fail fast on any other per-row lazy load
+    )
+    .where(FineTuneJob.tenant_id == bindparam("tenant_id"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
 
 
 @router.get("/", response_model=List[FineTuneJobResponse])
@@ -179,57 +237,64 @@ async def list_fine_tune_jobs(
     tenant_id: str,  # TODO: Extract from JWT token
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """List all fine-tune jobs for a tenant and sync running job statuses"""
-    jobs = (
-        db.query(FineTuneJob)
-        .options(joinedload(FineTuneJob.adapter))  # Eager load adapter relationship
-        .filter(FineTuneJob.tenant_id == tenant_id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    result = await db.execute(
+        _LIST_JOBS_STMT, {"tenant_id": tenant_id, "skip": skip, "limit": limit}
+    )
+    jobs = result.scalars().all()
+
+    # Sync status for all running/pending jobs, fanning the describe calls
+    # out to worker threads so they overlap instead of running back to back
+    to_sync = [
+        job for job in jobs
+        if job.status in [JobStatus.RUNNING, JobStatus.PENDING] and job.sagemaker_job_name
+    ]
+    statuses = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                training_orchestrator.get_training_job_status, job.sagemaker_job_name, use_cache=True
+            )
+            for job in to_sync
+        ),
+        return_exceptions=True,
     )
 
-    # Sync status for all running/pending jobs
-    for job in jobs:
-        if job.status in [JobStatus.RUNNING, JobStatus.PENDING] and job.sagemaker_job_name:
-            try:
-                sagemaker_status = training_orchestrator.get_training_job_status(job.sagemaker_job_name)
-
-                # Update job status based on SageMaker status
-                if sagemaker_status["status"] == "Completed":
-                    job.status = JobStatus.COMPLETED
-
-                    # Create adapter record if it doesn't exist
-                    existing_adapter = db.query(Adapter).filter(
-                        Adapter.fine_tune_job_id == job.id
-                    ).first()
-
-                    if not existing_adapter and sagemaker_status.get("model_artifacts"):
-                        adapter_id = generate_adapter_id()
-                        adapter_s3_path = sagemaker_status["model_artifacts"]
-
-                        adapter = Adapter(
-                            id=adapter_id,
-                            tenant_id=job.tenant_id,
-                            fine_tune_job_id=job.id,
-                            name=job.adapter_name,
-                            base_model_id=job.base_model_id,
-                            s3_path=adapter_s3_path,
-                            version=1,
-                        )
-                        db.add(adapter)
-                        logger.info(f"Created adapter {adapter_id} for job {job.id}")
-
-                elif sagemaker_status["status"] in ["Failed", "Stopped"]:
-                    job.status = JobStatus.FAILED
-                    job.error_message = sagemaker_status.get("failure_reason")
-
-            except Exception as e:
-                logger.warning(f"Failed to sync SageMaker status for job {job.id}: {e}")
-
-    db.commit()
+    # Apply updates here so session access stays on a single thread
+    for job, sagemaker_status in zip(to_sync, statuses):
+        if isinstance(sagemaker_status, Exception):
+            logger.warning(f"Failed to sync SageMaker status for job {job.id}: {sagemaker_status}")
+            continue
+
+        # Update job status based on SageMaker status
+        if sagemaker_status["status"] == "Completed":
+            job.status = JobStatus.COMPLETED
+
+            # Create adapter record if it doesn't exist (already eager loaded)
+            if not job.adapter and sagemaker_status.get("model_artifacts"):
+                adapter_id = generate_adapter_id()
+                adapter_s3_path = sagemaker_status["model_artifacts"]
+
+                # Setting the relationship also populates job.adapter,
+                # so the adapter_id pass below needs no lazy load
+                adapter = Adapter(
+                    id=adapter_id,
+                    tenant_id=job.tenant_id,
+                    fine_tune_job=job,
+                    name=job.adapter_name,
+                    base_model_id=job.base_model_id,
+                    s3_path=adapter_s3_path,
+                    version=1,
+                )
+                db.add(adapter)
+                logger.info(f"Created adapter {adapter_id} for job {job.id}")
+
+        elif sagemaker_status["status"] in ["Failed", "Stopped"]:
+            job.status = JobStatus.FAILED
+            job.error_message = sagemaker_status.get("failure_reason")
+
+    await db.commit()
 
     # Add adapter_id to all jobs after sync (so newly created adapters are included)
     for job in jobs:
@@ -238,29 +303,32 @@ async def list_fine_tune_jobs(
         else:
             job.adapter_id = None
 
-    return jobs
+    return orm_list_response(FineTuneJobResponse, jobs)
 
 
 @router.get("/{job_id}", response_model=FineTuneJobResponse)
 async def get_fine_tune_job(
     job_id: str,
     tenant_id: str,  # TODO: Extract from JWT token
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get fine-tune job details by ID and sync status from SageMaker"""
-    job = (
-        db.query(FineTuneJob)
-        .filter(FineTuneJob.id == job_id, FineTuneJob.tenant_id == tenant_id)
-        .first()
+    job = await db.get(
+        FineTuneJob, job_id, options=[joinedload(FineTuneJob.adapter), raiseload("*")]
     )
 
-    if not job:
+    if not job or job.tenant_id != tenant_id:
         raise HTTPException(status_code=404, detail="Fine-tune job not found")
 
     # Sync status from SageMaker if job is still running/pending
     if job.status in [JobStatus.RUNNING, JobStatus.PENDING] and job.sagemaker_job_name:
         try:
-            sagemaker_status = training_orchestrator.get_training_job_status(job.sagemaker_job_name)
+            # Blocking boto3 calls run in worker threads, off the event loop
+            sagemaker_status = await asyncio.to_thread(
+                training_orchestrator.get_training_job_status,
+                job.sagemaker_job_name,
+                use_cache=True,
+            )
 
             # Update job status based on SageMaker status
             if sagemaker_status["status"] == "Completed":
@@ -268,9 +336,10 @@ async def get_fine_tune_job(
 
                 # Retrieve and store metrics from S3
                 if sagemaker_status.get("output_data_config"):
-                    metrics = retrieve_metrics_from_s3(
+                    metrics = await asyncio.to_thread(
+                        retrieve_metrics_from_s3,
                         job.sagemaker_job_name,
-                        sagemaker_status["output_data_config"]
+                        sagemaker_status["output_data_config"],
                     )
                     if metrics:
                         job.final_train_loss = metrics.get("train", {}).get("train_loss")
@@ -280,19 +349,15 @@ async def get_fine_tune_job(
                     else:
                         logger.warning(f"Could not retrieve metrics for job {job.id}")
 
-                # Create adapter record if it doesn't exist
-                existing_adapter = db.query(Adapter).filter(
-                    Adapter.fine_tune_job_id == job.id
-                ).first()
-
-                if not existing_adapter and sagemaker_status.get("model_artifacts"):
+                # Create adapter record if it doesn't exist (already eager loaded)
+                if not job.adapter and sagemaker_status.get("model_artifacts"):
                     adapter_id = generate_adapter_id()
                     adapter_s3_path = sagemaker_status["model_artifacts"]
 
                     adapter = Adapter(
                         id=adapter_id,
                         tenant_id=job.tenant_id,
-                        fine_tune_job_id=job.id,
+                        fine_tune_job=job,
                         name=job.adapter_name,
                         base_model_id=job.base_model_id,
                         s3_path=adapter_s3_path,
@@ -305,8 +370,8 @@ async def get_fine_tune_job(
                 job.status = JobStatus.FAILED
                 job.error_message = sagemaker_status.get("failure_reason")
 
-            db.commit()
-            db.refresh(job)
+            await db.commit()
+            await db.refresh(job)
 
         except Exception as e:
             logger.warning(f"Failed to sync SageMaker status for job {job_id}: {e}")
@@ -318,7 +383,7 @@ async def get_fine_tune_job(
 async def cancel_fine_tune_job(
     job_id: str,
     tenant_id: str,  # TODO: Extract from JWT token
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Cancel a running fine-tune job"""
     # TODO: Stop SageMaker training job
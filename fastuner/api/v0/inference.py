@@ -1,78 +1,90 @@
 """Inference API endpoints"""
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
 import logging
-from datetime import datetime
 
-from fastuner.database import get_db
+from fastuner.database import get_async_db
 from fastuner.schemas.inference import InferenceRequest, InferenceResponse
 from fastuner.models.deployment import Deployment, DeploymentStatus
 from fastuner.models.adapter import Adapter
-from fastuner.core.inference import InferenceOrchestrator
+from fastuner.core.inference import get_inference_orchestrator, last_used_tracker
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
-inference_orchestrator = InferenceOrchestrator()
+inference_orchestrator = get_inference_orchestrator()
+
+# Hot-path statements are built once at import so each request only binds
+# parameters; SQLAlchemy's compiled cache then serves the SQL string
+_ADAPTER_MATCH = (
+    Adapter.tenant_id == bindparam("tenant_id"),
+    Adapter.name == bindparam("adapter_name"),
+    Adapter.base_model_id == bindparam("model_id"),
+)
+_ACTIVE_ENDPOINT_STMT = (
+    select(Deployment.id, Deployment.endpoint_name)
+    .join(Adapter, Adapter.id == Deployment.adapter_id)
+    .where(
+        *_ADAPTER_MATCH,
+        Deployment.tenant_id == bindparam("tenant_id"),
+        Deployment.status == DeploymentStatus.ACTIVE,
+    )
+    .limit(1)
+)
+_ADAPTER_EXISTS_STMT = select(Adapter.id).where(*_ADAPTER_MATCH).limit(1)
 
 
 @router.post("/", response_model=InferenceResponse)
 async def run_inference(
     request: InferenceRequest,
     tenant_id: str,  # TODO: Extract from JWT token
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Run inference using a deployed adapter.
 
     This endpoint:
-    1. Finds the appropriate endpoint for the adapter
-    2. Updates last_used_at timestamp
+    1. Finds the active endpoint for the adapter (single joined query)
+    2. Records last_used_at (flushed to the database periodically)
     3. Sends request to SageMaker endpoint
     4. Returns predictions
     """
     try:
-        # Step 1: Find adapter by name and model
-        adapter = (
-            db.query(Adapter)
-            .filter(
-                Adapter.tenant_id == tenant_id,
-                Adapter.name == request.adapter_name,
-                Adapter.base_model_id == request.model_id,
-            )
-            .first()
-        )
-
-        if not adapter:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Adapter '{request.adapter_name}' not found for model '{request.model_id}'"
-            )
-
-        # Step 2: Find active deployment for this adapter
-        deployment = (
-            db.query(Deployment)
-            .filter(
-                Deployment.tenant_id == tenant_id,
-                Deployment.adapter_id == adapter.id,
-                Deployment.status == DeploymentStatus.ACTIVE,
-            )
-            .first()
-        )
+        # Step 1: Find the active deployment for the adapter in one query
+        params = {
+            "tenant_id": tenant_id,
+            "adapter_name": request.adapter_name,
+            "model_id": request.model_id,
+        }
+        result = await db.execute(_ACTIVE_ENDPOINT_STMT, params)
+        deployment = result.first()
 
         if not deployment:
+            # Only on a miss: tell a missing adapter apart from an undeployed one
+            result = await db.execute(_ADAPTER_EXISTS_STMT, params)
+            if result.first() is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Adapter '{request.adapter_name}' not found for model '{request.model_id}'"
+                )
             raise HTTPException(
                 status_code=404,
                 detail=f"No active deployment found for adapter '{request.adapter_name}'. Please create a deployment first."
             )
 
-        # Step 3: Update last_used_at timestamp
-        deployment.last_used_at = datetime.utcnow()
-        db.commit()
+        # Step 2: Record usage; the buffered timestamp is written in bulk later
+        last_used_tracker.touch(deployment.id)
+
+        # Release the connection before the (slow) SageMaker call
+        await db.close()
 
-        # Step 4: Invoke SageMaker endpoint
+        # Step 3: Invoke SageMaker endpoint in a worker thread so the blocking
+        # boto3 call doesn't stall the event loop
         try:
-            result = inference_orchestrator.invoke_endpoint(
+            result = await asyncio.to_thread(
+                inference_orchestrator.invoke_endpoint,
                 endpoint_name=deployment.endpoint_name,
                 inputs=request.inputs,
                 parameters=request.parameters,
@@ -6,11 +6,21 @@ from rich.table import Table
 from rich.panel import Panel
 import json
 
-from fastuner.core.ephemerality import EphemeralityManager
-from fastuner.database import SessionLocal
-
 console = Console()
 
+# (min seconds, divisor, suffix) for idle-time display, largest unit first
+_IDLE_UNITS = ((3600, 3600, "h"), (60, 60, "m"), (0, 1, "s"))
+
+
+def _format_idle(seconds):
+    """Format idle seconds as e.g. '42s', '5m', '3h' ('N/A' if unknown)"""
+    if seconds is None:
+        return "N/A"
+    for threshold, divisor, suffix in _IDLE_UNITS:
+        if seconds >= threshold:
+            return f"{int(seconds / divisor)}{suffix}"
+    return f"{int(seconds)}s"
+
 
 @click.group()
 def cleanup():
@@ -22,8 +32,10 @@ def cleanup():
 @click.option("--dry-run", is_flag=True, help="Only report stale deployments without deleting")
 def run(dry_run):
     """Run cleanup cycle to delete stale deployments"""
+    from fastuner.core.ephemerality import get_ephemerality_manager
+
     try:
-        manager = EphemeralityManager()
+        manager = get_ephemerality_manager()
 
         if dry_run:
             console.print("[yellow]Running in DRY RUN mode - no resources will be deleted[/yellow]\n")
@@ -32,6 +44,10 @@ def run(dry_run):
             summary = manager.run_cleanup_cycle(dry_run=dry_run)
 
         # Display results
+        if summary.get("skipped_reason") == "already_running":
+            console.print("[yellow]Another cleanup cycle is already running, skipped[/yellow]")
+            return
+
         if summary["stale_count"] == 0:
             console.print("[green]✓[/green] No stale deployments found")
             return
@@ -90,67 +106,60 @@ def run(dry_run):
 @click.option("--tenant-id", help="Filter by tenant ID")
 def cost_report(tenant_id):
     """Generate cost report for active deployments"""
+    from fastuner.core.ephemerality import get_ephemerality_manager
+    from fastuner.database import get_db_context
+
     try:
-        db = SessionLocal()
-        manager = EphemeralityManager()
+        manager = get_ephemerality_manager()
 
-        with console.status("[bold blue]Generating cost report...", spinner="dots"):
+        with get_db_context() as db, console.status("[bold blue]Generating cost report...", spinner="dots"):
             report = manager.get_cost_report(db, tenant_id=tenant_id)
 
-        db.close()
-
-        # Display header
-        header = f"💰 Cost Report"
-        if tenant_id:
-            header += f" (Tenant: {tenant_id[:12]}...)"
-
-        console.print(Panel(header, style="bold cyan"))
-
-        # Summary
-        console.print(f"\n[cyan]Active Deployments:[/cyan] {report['active_count']}")
-        console.print(f"[cyan]Total Hourly Cost:[/cyan] ${report['total_hourly_cost']}")
-        console.print(f"[cyan]Est. Monthly Cost:[/cyan] ${report['estimated_monthly_cost']}\n")
-
-        if report["active_count"] == 0:
-            console.print("[dim]No active deployments[/dim]")
-            return
+        # Buffer the report and write it to the terminal once
+        with console:
+            # Display header
+            header = f"💰 Cost Report"
+            if tenant_id:
+                header += f" (Tenant: {tenant_id[:12]}...)"
+
+            console.print(Panel(header, style="bold cyan"))
+
+            # Summary
+            console.print(f"\n[cyan]Active Deployments:[/cyan] {report['active_count']}")
+            console.print(f"[cyan]Total Hourly Cost:[/cyan] ${report['total_hourly_cost']}")
+            console.print(f"[cyan]Est. Monthly Cost:[/cyan] ${report['estimated_monthly_cost']}\n")
+
+            if report["active_count"] == 0:
+                console.print("[dim]No active deployments[/dim]")
+                return
+
+            # Deployment table
+            table = Table(show_header=True, header_style="bold cyan")
+            table.add_column("Endpoint", style="dim")
+            table.add_column("Instance")
+            table.add_column("Count")
+            table.add_column("$/hour", justify="right")
+            table.add_column("Last Used", style="dim")
+            table.add_column("Idle Time")
+
+            for deployment in report["deployments"]:
+                idle_time = _format_idle(deployment["time_since_use_seconds"])
+
+                # Format last used
+                last_used = "Never"
+                if deployment["last_used_at"]:
+                    last_used = deployment["last_used_at"].split("T")[1][:8]  # Show time only
 
-        # Deployment table
-        table = Table(show_header=True, header_style="bold cyan")
-        table.add_column("Endpoint", style="dim")
-        table.add_column("Instance")
-        table.add_column("Count")
-        table.add_column("$/hour", justify="right")
-        table.add_column("Last Used", style="dim")
-        table.add_column("Idle Time")
-
-        for deployment in report["deployments"]:
-            # Format idle time
-            idle_time = "N/A"
-            if deployment["time_since_use_seconds"] is not None:
-                seconds = deployment["time_since_use_seconds"]
-                if seconds < 60:
-                    idle_time = f"{int(seconds)}s"
-                elif seconds < 3600:
-                    idle_time = f"{int(seconds/60)}m"
-                else:
-                    idle_time = f"{int(seconds/3600)}h"
-
-            # Format last used
-            last_used = "Never"
-            if deployment["last_used_at"]:
-                last_used = deployment["last_used_at"].split("T")[1][:8]  # Show time only
-
-            table.add_row(
-                deployment["endpoint_name"][:30],
-                deployment["instance_type"],
-                str(deployment["instance_count"]),
-                f"${deployment['hourly_cost']:.3f}",
-                last_used,
-                idle_time,
-            )
+                table.add_row(
+                    deployment["endpoint_name"][:30],
+                    deployment["instance_type"],
+                    str(deployment["instance_count"]),
+                    f"${deployment['hourly_cost']:.3f}",
+                    last_used,
+                    idle_time,
+                )
 
-        console.print(table)
+            console.print(table)
 
     except Exception as e:
         console.print(f"[red]Error:[/red] {str(e)}")
@@ -158,31 +167,54 @@ def cost_report(tenant_id):
 
 
 @cleanup.command()
-def status():
+@click.option("--list", "list_stale", is_flag=True, help="Also list the stale deployments")
+def status(list_stale):
     """Show cleanup configuration and status"""
+    from fastuner.core.ephemerality import get_ephemerality_manager
+    from fastuner.database import get_db_context
+
     try:
-        db = SessionLocal()
-        manager = EphemeralityManager()
+        manager = get_ephemerality_manager()
 
-        stale_deployments = manager.find_stale_deployments(db)
-        report = manager.get_cost_report(db)
+        with get_db_context() as db:
+            summary = manager.get_status_summary(db)
 
-        db.close()
+            # Only load full stale rows when they will actually be shown
+            stale = []
+            if list_stale and summary["stale_count"] > 0:
+                stale = manager.find_stale_deployments(db)
 
         # Configuration panel
         config_table = Table(show_header=False, box=None)
         config_table.add_column("Key", style="cyan")
         config_table.add_column("Value")
 
-        config_table.add_row("Active Deployments", str(report["active_count"]))
-        config_table.add_row("Stale Deployments", str(len(stale_deployments)))
-        config_table.add_row("Total Hourly Cost", f"${report['total_hourly_cost']}")
+        config_table.add_row("Active Deployments", str(summary["active_count"]))
+        config_table.add_row("Stale Deployments", str(summary["stale_count"]))
+        config_table.add_row("Total Hourly Cost", f"${summary['total_hourly_cost']}")
 
         console.print(Panel(config_table, title="Cleanup Status", style="bold cyan"))
 
-        if len(stale_deployments) > 0:
+        if stale:
+            table = Table(show_header=True, header_style="bold cyan")
+            table.add_column("Deployment ID", style="dim")
+            table.add_column("Endpoint")
+            table.add_column("Last Used")
+            table.add_column("TTL (sec)")
+
+            for deployment in stale:
+                table.add_row(
+                    deployment.id[:12] + "...",
+                    deployment.endpoint_name,
+                    deployment.last_used_at.isoformat() if deployment.last_used_at else "N/A",
+                    str(deployment.ttl_seconds),
+                )
+
+            console.print(table)
+
+        if summary["stale_count"] > 0:
             console.print(
-                f"\n[yellow]⚠[/yellow] {len(stale_deployments)} deployment(s) ready for cleanup. "
+                f"\n[yellow]⚠[/yellow] {summary['stale_count']} deployment(s) ready for cleanup. "
                 f"Run [cyan]fastuner cleanup run[/cyan] to clean them up."
             )
         else:
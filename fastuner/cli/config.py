@@ -1,10 +1,16 @@
 """CLI configuration and utilities"""
 
+import atexit
 import os
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import json
 
+if TYPE_CHECKING:
+    import httpx
+
 # CLI config file location
 CONFIG_DIR = Path.home() / ".fastuner"
 CONFIG_FILE = CONFIG_DIR / "config.json"
@@ -16,6 +22,7 @@ def ensure_config_dir():
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=1)
 def get_api_base_url() -> str:
     """Get API base URL from config or environment"""
     # Check environment variable first
@@ -33,6 +40,26 @@ def get_api_base_url() -> str:
     return "http://localhost:8000"
 
 
+@lru_cache()
+def get_http_client() -> "httpx.Client":
+    """
+    Get the process-wide HTTP client for the Fastuner API.
+
+    Reusing one client keeps the connection pool (and TLS sessions) alive
+    across requests made by the same CLI process.
+    """
+    # Imported here so `--help` and completion don't pay for httpx
+    import httpx
+
+    client = httpx.Client(
+        base_url=get_api_base_url(),
+        timeout=30.0,
+        transport=httpx.HTTPTransport(retries=2),
+    )
+    atexit.register(client.close)
+    return client
+
+
 def set_api_base_url(url: str):
     """Set API base URL in config"""
     ensure_config_dir()
@@ -44,10 +71,27 @@ def set_api_base_url(url: str):
 
     config["api_url"] = url
 
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    # Write to a temp file and swap it in so a crash never leaves a torn config
+    fd, tmp_path = tempfile.mkstemp(dir=CONFIG_DIR, prefix=".config.", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(config, f, indent=2)
+        os.replace(tmp_path, CONFIG_FILE)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    # Next lookup/request should use the new URL
+    get_api_base_url.cache_clear()
+    get_http_client.cache_clear()
+
+    # Responses cached from the previous server must not be served for the new one
+    from .http_cache import clear_cache
+
+    clear_cache()
 
 
+@lru_cache(maxsize=1)
 def get_tenant_id() -> Optional[str]:
     """Get tenant ID from config or environment"""
     # For V0, use environment variable or default
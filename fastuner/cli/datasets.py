@@ -1,13 +1,15 @@
 """Dataset management CLI commands"""
 
 import click
-import httpx
+import orjson
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import BarColumn, DownloadColumn, Progress, SpinnerColumn, TaskID, TextColumn
 from pathlib import Path
+from typing import BinaryIO
 
-from .config import get_api_base_url, get_tenant_id
+from .config import get_http_client, get_tenant_id
+from .http_cache import cached_get, clear_cache, prime_details
 
 console = Console()
 
@@ -18,6 +20,32 @@ def datasets():
     pass
 
 
+class _ProgressReader:
+    """File wrapper that reports bytes read to a rich progress task"""
+
+    def __init__(self, f: BinaryIO, progress: Progress, task: TaskID):
+        self._f = f
+        self._progress = progress
+        self._task = task
+
+    def fileno(self) -> int:
+        return self._f.fileno()
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._f.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._f.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._f.read(size)
+        if chunk:
+            self._progress.update(self._task, completed=self._f.tell())
+        else:
+            self._progress.update(self._task, description="Validating dataset...")
+        return chunk
+
+
 @datasets.command("upload")
 @click.argument("file_path", type=click.Path(exists=True))
 @click.option("--name", required=True, help="Dataset name")
@@ -34,38 +62,48 @@ def upload_dataset(file_path: str, name: str, task_type: str):
     Example:
         fastuner datasets upload data.jsonl --name "sentiment" --task-type classification
     """
-    api_url = get_api_base_url()
+    import httpx
+
     tenant_id = get_tenant_id()
 
     file_path_obj = Path(file_path)
+    file_size = file_path_obj.stat().st_size
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        DownloadColumn(),
         console=console,
+        # No live redraw thread when output is piped or captured
+        disable=not console.is_terminal,
     ) as progress:
-        task = progress.add_task("Uploading and validating dataset...", total=None)
+        task = progress.add_task("Uploading dataset...", total=file_size)
 
         try:
             with open(file_path_obj, "rb") as f:
-                files = {"file": (file_path_obj.name, f, "application/x-ndjson")}
+                # httpx streams file parts in chunks with a Content-Length taken
+                # from fstat, so memory stays flat regardless of file size
+                reader = _ProgressReader(f, progress, task)
+                files = {"file": (file_path_obj.name, reader, "application/x-ndjson")}
                 data = {
                     "name": name,
                     "task_type": task_type,
                     "tenant_id": tenant_id,
                 }
 
-                response = httpx.post(
-                    f"{api_url}/v0/datasets/",
+                response = get_http_client().post(
+                    "/v0/datasets/",
                     files=files,
                     data=data,
                     timeout=300.0,  # 5 min timeout for large files
                 )
                 response.raise_for_status()
+                clear_cache()
 
             progress.update(task, completed=True)
 
-            result = response.json()
+            result = orjson.loads(response.content)
             console.print(f"\n✅ [green]Dataset uploaded successfully![/green]")
             console.print(f"Dataset ID: [cyan]{result['id']}[/cyan]")
             console.print(f"Total samples: {result['total_samples']}")
@@ -88,19 +126,22 @@ def upload_dataset(file_path: str, name: str, task_type: str):
 
 @datasets.command("list")
 @click.option("--limit", default=100, help="Maximum number of datasets to show")
-def list_datasets(limit: int):
+@click.option("--no-cache", is_flag=True, help="Bypass the local response cache")
+def list_datasets(limit: int, no_cache: bool):
     """List all datasets"""
-    api_url = get_api_base_url()
+    import httpx
+
     tenant_id = get_tenant_id()
 
     try:
-        response = httpx.get(
-            f"{api_url}/v0/datasets/",
+        response = cached_get(
+            "/v0/datasets/",
             params={"tenant_id": tenant_id, "limit": limit},
+            use_cache=not no_cache,
             timeout=30.0,
         )
         response.raise_for_status()
-        datasets = response.json()
+        datasets = orjson.loads(response.content)
 
         if not datasets:
             console.print("[yellow]No datasets found[/yellow]")
@@ -123,6 +164,7 @@ def list_datasets(limit: int):
             )
 
         console.print(table)
+        prime_details("/v0/datasets/", {"tenant_id": tenant_id, "limit": limit}, datasets)
 
     except httpx.HTTPStatusError as e:
         console.print(f"❌ [red]Error: {e.response.status_code}[/red]")
@@ -134,32 +176,37 @@ def list_datasets(limit: int):
 
 @datasets.command("get")
 @click.argument("dataset_id")
-def get_dataset(dataset_id: str):
+@click.option("--no-cache", is_flag=True, help="Bypass the local response cache")
+def get_dataset(dataset_id: str, no_cache: bool):
     """Get detailed information about a dataset"""
-    api_url = get_api_base_url()
+    import httpx
+
     tenant_id = get_tenant_id()
 
     try:
-        response = httpx.get(
-            f"{api_url}/v0/datasets/{dataset_id}",
+        response = cached_get(
+            f"/v0/datasets/{dataset_id}",
             params={"tenant_id": tenant_id},
+            use_cache=not no_cache,
             timeout=30.0,
         )
         response.raise_for_status()
-        ds = response.json()
-
-        console.print(f"\n[bold]Dataset: {ds['name']}[/bold]")
-        console.print(f"ID: [cyan]{ds['id']}[/cyan]")
-        console.print(f"Task Type: {ds['task_type']}")
-        console.print(f"Schema Version: {ds['schema_version']}")
-        console.print(f"\n[bold]Samples:[/bold]")
-        console.print(f"  Total: {ds['total_samples']}")
-        console.print(f"  Train: {ds['train_samples']}")
-        console.print(f"  Val: {ds['val_samples']}")
-        console.print(f"  Test: {ds['test_samples']}")
-        console.print(f"\n[bold]Split Configuration:[/bold]")
-        console.print(f"  Seed: {ds['split_seed']}")
-        console.print(f"  Ratios: {ds['split_ratios']}")
+        ds = orjson.loads(response.content)
+
+        # Buffer the detail lines and write them to the terminal once
+        with console:
+            console.print(f"\n[bold]Dataset: {ds['name']}[/bold]")
+            console.print(f"ID: [cyan]{ds['id']}[/cyan]")
+            console.print(f"Task Type: {ds['task_type']}")
+            console.print(f"Schema Version: {ds['schema_version']}")
+            console.print(f"\n[bold]Samples:[/bold]")
+            console.print(f"  Total: {ds['total_samples']}")
+            console.print(f"  Train: {ds['train_samples']}")
+            console.print(f"  Val: {ds['val_samples']}")
+            console.print(f"  Test: {ds['test_samples']}")
+            console.print(f"\n[bold]Split Configuration:[/bold]")
+            console.print(f"  Seed: {ds['split_seed']}")
+            console.print(f"  Ratios: {ds['split_ratios']}")
 
     except httpx.HTTPStatusError as e:
         console.print(f"❌ [red]Error: {e.response.status_code}[/red]")
@@ -174,16 +221,18 @@ def get_dataset(dataset_id: str):
 @click.confirmation_option(prompt="Are you sure you want to delete this dataset?")
 def delete_dataset(dataset_id: str):
     """Delete a dataset"""
-    api_url = get_api_base_url()
+    import httpx
+
     tenant_id = get_tenant_id()
 
     try:
-        response = httpx.delete(
-            f"{api_url}/v0/datasets/{dataset_id}",
+        response = get_http_client().delete(
+            f"/v0/datasets/{dataset_id}",
             params={"tenant_id": tenant_id},
             timeout=30.0,
         )
         response.raise_for_status()
+        clear_cache()
         console.print(f"✅ [green]Dataset {dataset_id} deleted successfully[/green]")
 
     except httpx.HTTPStatusError as e:
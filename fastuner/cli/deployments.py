@@ -1,14 +1,24 @@
 """Deployment management CLI commands"""
 
 import click
-import httpx
+import orjson
 from rich.console import Console
 from rich.table import Table
 
-from .config import get_api_base_url, get_tenant_id
+from .config import get_http_client, get_tenant_id
+from .http_cache import cached_get, clear_cache, prime_details
 
 console = Console()
 
+# Rich color per deployment status in list output
+_STATUS_COLORS = {
+    "creating": "yellow",
+    "active": "green",
+    "updating": "blue",
+    "deleting": "red",
+    "failed": "red",
+}
+
 
 @click.group()
 def deployments():
@@ -18,19 +28,22 @@ def deployments():
 
 @deployments.command("list")
 @click.option("--limit", default=100, help="Maximum number of deployments to show")
-def list_deployments(limit: int):
+@click.option("--no-cache", is_flag=True, help="Bypass the local response cache")
+def list_deployments(limit: int, no_cache: bool):
     """List all active deployments"""
-    api_url = get_api_base_url()
+    import httpx
+
     tenant_id = get_tenant_id()
 
     try:
-        response = httpx.get(
-            f"{api_url}/v0/deployments/",
+        response = cached_get(
+            "/v0/deployments/",
             params={"tenant_id": tenant_id, "limit": limit},
+            use_cache=not no_cache,
             timeout=30.0,
         )
         response.raise_for_status()
-        deployments = response.json()
+        deployments = orjson.loads(response.content)
 
         if not deployments:
             console.print("[yellow]No active deployments found[/yellow]")
@@ -45,13 +58,7 @@ def list_deployments(limit: int):
         table.add_column("TTL (hrs)", justify="right")
 
         for dep in deployments:
-            status_color = {
-                "creating": "yellow",
-                "active": "green",
-                "updating": "blue",
-                "deleting": "red",
-                "failed": "red",
-            }.get(dep["status"], "white")
+            status_color = _STATUS_COLORS.get(dep["status"], "white")
 
             ttl_hours = dep["ttl_seconds"] / 3600
 
@@ -65,6 +72,7 @@ def list_deployments(limit: int):
             )
 
         console.print(table)
+        prime_details("/v0/deployments/", {"tenant_id": tenant_id, "limit": limit}, deployments)
 
     except httpx.HTTPStatusError as e:
         console.print(f"❌ [red]Error: {e.response.status_code}[/red]")
@@ -76,33 +84,38 @@ def list_deployments(limit: int):
 
 @deployments.command("get")
 @click.argument("deployment_id")
-def get_deployment(deployment_id: str):
+@click.option("--no-cache", is_flag=True, help="Bypass the local response cache")
+def get_deployment(deployment_id: str, no_cache: bool):
     """Get detailed information about a deployment"""
-    api_url = get_api_base_url()
+    import httpx
+
     tenant_id = get_tenant_id()
 
     try:
-        response = httpx.get(
-            f"{api_url}/v0/deployments/{deployment_id}",
+        response = cached_get(
+            f"/v0/deployments/{deployment_id}",
             params={"tenant_id": tenant_id},
+            use_cache=not no_cache,
             timeout=30.0,
         )
         response.raise_for_status()
-        dep = response.json()
-
-        console.print(f"\n[bold]Deployment[/bold]")
-        console.print(f"ID: [cyan]{dep['id']}[/cyan]")
-        console.print(f"Endpoint: {dep['endpoint_name']}")
-        console.print(f"Status: {dep['status']}")
-        console.print(f"Adapter ID: {dep['adapter_id']}")
-        console.print(f"\n[bold]Configuration:[/bold]")
-        console.print(f"  Instance Type: {dep['instance_type']}")
-        console.print(f"  Instance Count: {dep['instance_count']}")
-        console.print(f"  TTL: {dep['ttl_seconds']} seconds ({dep['ttl_seconds']/3600:.1f} hours)")
-        console.print(f"\n[bold]Last Used:[/bold] {dep['last_used_at']}")
-
-        if dep.get('endpoint_arn'):
-            console.print(f"\n[bold]AWS ARN:[/bold] {dep['endpoint_arn']}")
+        dep = orjson.loads(response.content)
+
+        # Buffer the detail lines and write them to the terminal once
+        with console:
+            console.print(f"\n[bold]Deployment[/bold]")
+            console.print(f"ID: [cyan]{dep['id']}[/cyan]")
+            console.print(f"Endpoint: {dep['endpoint_name']}")
+            console.print(f"Status: {dep['status']}")
+            console.print(f"Adapter ID: {dep['adapter_id']}")
+            console.print(f"\n[bold]Configuration:[/bold]")
+            console.print(f"  Instance Type: {dep['instance_type']}")
+            console.print(f"  Instance Count: {dep['instance_count']}")
+            console.print(f"  TTL: {dep['ttl_seconds']} seconds ({dep['ttl_seconds']/3600:.1f} hours)")
+            console.print(f"\n[bold]Last Used:[/bold] {dep['last_used_at']}")
+
+            if dep.get('endpoint_arn'):
+                console.print(f"\n[bold]AWS ARN:[/bold] {dep['endpoint_arn']}")
 
     except httpx.HTTPStatusError as e:
         console.print(f"❌ [red]Error: {e.response.status_code}[/red]")
@@ -119,7 +132,8 @@ def get_deployment(deployment_id: str):
 @click.option("--ttl-hours", default=1.0, type=float, help="Time-to-live in hours")
 def create_deployment(adapter_id: str, instance_type: str, instance_count: int, ttl_hours: float):
     """Create a new deployment"""
-    api_url = get_api_base_url()
+    import httpx
+
     tenant_id = get_tenant_id()
 
     payload = {
@@ -130,15 +144,16 @@ def create_deployment(adapter_id: str, instance_type: str, instance_count: int,
     }
 
     try:
-        response = httpx.post(
-            f"{api_url}/v0/deployments/",
+        response = get_http_client().post(
+            "/v0/deployments/",
             json=payload,
             params={"tenant_id": tenant_id},
             timeout=60.0,
         )
         response.raise_for_status()
+        clear_cache()
 
-        result = response.json()
+        result = orjson.loads(response.content)
         console.print(f"✅ [green]Deployment created successfully![/green]")
         console.print(f"Deployment ID: [cyan]{result['id']}[/cyan]")
         console.print(f"Endpoint: {result['endpoint_name']}")
@@ -162,17 +177,19 @@ def create_deployment(adapter_id: str, instance_type: str, instance_count: int,
 @click.confirmation_option(prompt="Are you sure you want to delete this deployment?")
 def delete_deployment(deployment_id: str):
     """Delete a deployment and tear down the endpoint"""
-    api_url = get_api_base_url()
+    import httpx
+
     tenant_id = get_tenant_id()
 
     try:
-        response = httpx.delete(
-            f"{api_url}/v0/deployments/{deployment_id}",
+        response = get_http_client().delete(
+            f"/v0/deployments/{deployment_id}",
             params={"tenant_id": tenant_id},
             timeout=60.0,
         )
         response.raise_for_status()
-        console.print(f"✅ [green]Deployment {deployment_id} deleted successfully[/green]")
+        clear_cache()
+        console.print(f"✅ [green]Deployment {deployment_id} is being deleted[/green]")
 
     except httpx.HTTPStatusError as e:
         console.print(f"❌ [red]Error: {e.response.status_code}[/red]")
@@ -1,15 +1,24 @@
 """Fine-tuning CLI commands"""
 
 import click
-import httpx
+import orjson
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .config import get_api_base_url, get_tenant_id
+from .config import get_http_client, get_tenant_id
+from .http_cache import cached_get, clear_cache, prime_details
 
 console = Console()
 
+# Rich color per job status in list output
+_STATUS_COLORS = {
+    "pending": "yellow",
+    "running": "blue",
+    "completed": "green",
+    "failed": "red",
+}
+
 
 @click.group()
 def finetune():
@@ -51,7 +60,8 @@ def start_finetune(
           --method qlora \\
           --auto-deploy
     """
-    api_url = get_api_base_url()
+    import httpx
+
     tenant_id = get_tenant_id()
 
     payload = {
@@ -71,21 +81,24 @@ def start_finetune(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        # No live redraw thread when output is piped or captured
+        disable=not console.is_terminal,
     ) as progress:
         task = progress.add_task("Creating fine-tune job...", total=None)
 
         try:
-            response = httpx.post(
-                f"{api_url}/v0/fine-tune-jobs/",
+            response = get_http_client().post(
+                "/v0/fine-tune-jobs/",
                 json=payload,
                 params={"tenant_id": tenant_id},
                 timeout=60.0,
             )
             response.raise_for_status()
+            clear_cache()
 
             progress.update(task, completed=True)
 
-            result = response.json()
+            result = orjson.loads(response.content)
             console.print(f"\n✅ [green]Fine-tune job created successfully![/green]")
             console.print(f"Job ID: [cyan]{result['id']}[/cyan]")
             console.print(f"Status: {result['status']}")
@@ -111,19 +124,22 @@ def start_finetune(
 
 @finetune.command("list")
 @click.option("--limit", default=100, help="Maximum number of jobs to show")
-def list_finetune_jobs(limit: int):
+@click.option("--no-cache", is_flag=True, help="Bypass the local response cache")
+def list_finetune_jobs(limit: int, no_cache: bool):
     """List all fine-tune jobs"""
-    api_url = get_api_base_url()
+    import httpx
+
     tenant_id = get_tenant_id()
 
     try:
-        response = httpx.get(
-            f"{api_url}/v0/fine-tune-jobs/",
+        response = cached_get(
+            "/v0/fine-tune-jobs/",
             params={"tenant_id": tenant_id, "limit": limit},
+            use_cache=not no_cache,
             timeout=30.0,
         )
         response.raise_for_status()
-        jobs = response.json()
+        jobs = orjson.loads(response.content)
 
         if not jobs:
             console.print("[yellow]No fine-tune jobs found[/yellow]")
@@ -137,12 +153,7 @@ def list_finetune_jobs(limit: int):
         table.add_column("Method")
 
         for job in jobs:
-            status_color = {
-                "pending": "yellow",
-                "running": "blue",
-                "completed": "green",
-                "failed": "red",
-            }.get(job["status"], "white")
+            status_color = _STATUS_COLORS.get(job["status"], "white")
 
             adapter_id = job.get("adapter_id") or "-"
 
@@ -155,6 +166,7 @@ def list_finetune_jobs(limit: int):
             )
 
         console.print(table)
+        prime_details("/v0/fine-tune-jobs/", {"tenant_id": tenant_id, "limit": limit}, jobs)
 
     except httpx.HTTPStatusError as e:
         console.print(f"❌ [red]Error: {e.response.status_code}[/red]")
@@ -166,42 +178,47 @@ def list_finetune_jobs(limit: int):
 
 @finetune.command("get")
 @click.argument("job_id")
-def get_finetune_job(job_id: str):
+@click.option("--no-cache", is_flag=True, help="Bypass the local response cache")
+def get_finetune_job(job_id: str, no_cache: bool):
     """Get detailed information about a fine-tune job"""
-    api_url = get_api_base_url()
+    import httpx
+
     tenant_id = get_tenant_id()
 
     try:
-        response = httpx.get(
-            f"{api_url}/v0/fine-tune-jobs/{job_id}",
+        response = cached_get(
+            f"/v0/fine-tune-jobs/{job_id}",
             params={"tenant_id": tenant_id},
+            use_cache=not no_cache,
             timeout=30.0,
         )
         response.raise_for_status()
-        job = response.json()
-
-        console.print(f"\n[bold]Fine-Tune Job: {job['adapter_name']}[/bold]")
-        console.print(f"ID: [cyan]{job['id']}[/cyan]")
-        console.print(f"Status: {job['status']}")
-        console.print(f"Base Model: {job['base_model_id']}")
-        console.print(f"Dataset ID: {job['dataset_id']}")
-        console.print(f"\n[bold]Configuration:[/bold]")
-        console.print(f"  Method: {job['method'].upper()}")
-        console.print(f"  Learning Rate: {job['learning_rate']}")
-        console.print(f"  Epochs: {job['num_epochs']}")
-        console.print(f"  Batch Size: {job['batch_size']}")
-        console.print(f"  LoRA Rank: {job['lora_rank']}")
-        console.print(f"  LoRA Alpha: {job['lora_alpha']}")
-
-        if job.get('sagemaker_job_name'):
-            console.print(f"\n[bold]SageMaker:[/bold]")
-            console.print(f"  Job Name: {job['sagemaker_job_name']}")
-
-        if job.get('final_train_loss'):
-            console.print(f"\n[bold]Metrics:[/bold]")
-            console.print(f"  Final Train Loss: {job['final_train_loss']:.4f}")
-            if job.get('final_val_loss'):
-                console.print(f"  Final Val Loss: {job['final_val_loss']:.4f}")
+        job = orjson.loads(response.content)
+
+        # Buffer the detail lines and write them to the terminal once
+        with console:
+            console.print(f"\n[bold]Fine-Tune Job: {job['adapter_name']}[/bold]")
+            console.print(f"ID: [cyan]{job['id']}[/cyan]")
+            console.print(f"Status: {job['status']}")
+            console.print(f"Base Model: {job['base_model_id']}")
+            console.print(f"Dataset ID: {job['dataset_id']}")
+            console.print(f"\n[bold]Configuration:[/bold]")
+            console.print(f"  Method: {job['method'].upper()}")
+            console.print(f"  Learning Rate: {job['learning_rate']}")
+            console.print(f"  Epochs: {job['num_epochs']}")
+            console.print(f"  Batch Size: {job['batch_size']}")
+            console.print(f"  LoRA Rank: {job['lora_rank']}")
+            console.print(f"  LoRA Alpha: {job['lora_alpha']}")
+
+            if job.get('sagemaker_job_name'):
+                console.print(f"\n[bold]SageMaker:[/bold]")
+                console.print(f"  Job Name: {job['sagemaker_job_name']}")
+
+            if job.get('final_train_loss'):
+                console.print(f"\n[bold]Metrics:[/bold]")
+                console.print(f"  Final Train Loss: {job['final_train_loss']:.4f}")
+                if job.get('final_val_loss'):
+                    console.print(f"  Final Val Loss: {job['final_val_loss']:.4f}")
 
     except httpx.HTTPStatusError as e:
         console.print(f"❌ [red]Error: {e.response.status_code}[/red]")
@@ -216,16 +233,18 @@ def get_finetune_job(job_id: str):
 @click.confirmation_option(prompt="Are you sure you want to cancel this job?")
 def cancel_finetune_job(job_id: str):
     """Cancel a running fine-tune job"""
-    api_url = get_api_base_url()
+    import httpx
+
     tenant_id = get_tenant_id()
 
     try:
-        response = httpx.delete(
-            f"{api_url}/v0/fine-tune-jobs/{job_id}",
+        response = get_http_client().delete(
+            f"/v0/fine-tune-jobs/{job_id}",
             params={"tenant_id": tenant_id},
             timeout=30.0,
         )
         response.raise_for_status()
+        clear_cache()
         console.print(f"✅ [green]Fine-tune job {job_id} cancelled[/green]")
 
     except httpx.HTTPStatusError as e:
@@ -0,0 +1,166 @@
+"""On-disk TTL cache for idempotent CLI GET requests"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
+
+import orjson
+
+from .config import CONFIG_DIR, ensure_config_dir, get_http_client
+
+if TYPE_CHECKING:
+    import httpx
+
+CACHE_FILE = CONFIG_DIR / "http_cache.sqlite"
+
+# Re-running `list`/`get` within a few seconds (e.g. watching a job) is served
+# from disk; anything older is revalidated against the API
+DEFAULT_STALE_TIME = 10.0
+
+
+@lru_cache()
+def _connect() -> Optional[sqlite3.Connection]:
+    """Open the cache database, or None if it can't be used"""
+    try:
+        ensure_config_dir()
+        conn = sqlite3.connect(CACHE_FILE)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, etag TEXT, body BLOB, fetched_at REAL)"
+        )
+        return conn
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def _cache_key(path: str, params: Dict[str, Any]) -> str:
+    """Cache key for a GET of path with params (API base URL and tenant_id included)"""
+    raw = f"GET {get_http_client().base_url} {path} {json.dumps(params, sort_keys=True)}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _cached_response(path: str, body: bytes) -> "httpx.Response":
+    """Rebuild a 200 response from a cached body"""
+    import httpx
+
+    request = httpx.Request("GET", get_http_client().base_url.join(path))
+    return httpx.Response(200, content=body, request=request)
+
+
+def cached_get(
+    path: str,
+    params: Dict[str, Any],
+    stale_time: float = DEFAULT_STALE_TIME,
+    use_cache: bool = True,
+    timeout: float = 30.0,
+) -> "httpx.Response":
+    """
+    GET an API path, serving recent 200 responses from the on-disk cache.
+
+    Args:
+        path: API path (e.g. "/v0/datasets/")
+        params: Query parameters (part of the cache key)
+        stale_time: Seconds a cached body is served without contacting the API
+        use_cache: If False, always hit the API (the fresh result is still stored)
+        timeout: Request timeout in seconds
+
+    Returns:
+        httpx.Response (from the API or rebuilt from the cache)
+    """
+    conn = _connect()
+    if conn is None:
+        return get_http_client().get(path, params=params, timeout=timeout)
+
+    key = _cache_key(path, params)
+    try:
+        row = conn.execute(
+            "SELECT etag, body, fetched_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+    except sqlite3.Error:
+        row = None
+
+    headers = {}
+    if row and use_cache:
+        etag, body, fetched_at = row
+        if time.time() - fetched_at < stale_time:
+            return _cached_response(path, body)
+        if etag:
+            headers["If-None-Match"] = etag
+
+    response = get_http_client().get(path, params=params, headers=headers, timeout=timeout)
+
+    try:
+        if response.status_code == 304 and row:
+            conn.execute("UPDATE responses SET fetched_at = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+            return _cached_response(path, row[1])
+
+        if response.status_code == 200:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, body, fetched_at) VALUES (?, ?, ?, ?)",
+                (key, response.headers.get("etag"), response.content, time.time()),
+            )
+            conn.commit()
+    except sqlite3.Error:
+        pass
+
+    return response
+
+
+def prime_details(
+    list_path: str,
+    params: Dict[str, Any],
+    items: Iterable[Dict[str, Any]],
+) -> None:
+    """
+    Seed the cache for `get <id>` from the items of a cached list response.
+
+    List and detail endpoints return the same record schema, so the usual
+    `list` then `get` sequence is served without another round trip. Entries
+    inherit the list's fetched_at, so they go stale together and never
+    overwrite a fresher detail response.
+
+    Args:
+        list_path: List path previously fetched via cached_get (e.g. "/v0/datasets/")
+        params: Query parameters used for the list request
+        items: Records from the list response (each with an "id")
+    """
+    conn = _connect()
+    if conn is None:
+        return
+    try:
+        row = conn.execute(
+            "SELECT fetched_at FROM responses WHERE key = ?", (_cache_key(list_path, params),)
+        ).fetchone()
+        if row is None:
+            return
+
+        detail_params = {"tenant_id": params["tenant_id"]}
+        conn.executemany(
+            "INSERT INTO responses (key, etag, body, fetched_at) VALUES (?, NULL, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET etag = NULL, body = excluded.body, "
+            "fetched_at = excluded.fetched_at WHERE excluded.fetched_at > responses.fetched_at",
+            [
+                (_cache_key(f"{list_path}{item['id']}", detail_params), orjson.dumps(item), row[0])
+                for item in items
+            ],
+        )
+        conn.commit()
+    except sqlite3.Error:
+        pass
+
+
+def clear_cache() -> None:
+    """Drop all cached responses (call after any mutating request)"""
+    conn = _connect()
+    if conn is None:
+        return
+    try:
+        conn.execute("DELETE FROM responses")
+        conn.commit()
+    except sqlite3.Error:
+        pass
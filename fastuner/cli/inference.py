@@ -1,14 +1,16 @@
 """Inference CLI commands"""
 
 import click
-import httpx
+import orjson
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
 
-from .config import get_api_base_url, get_tenant_id
+from .config import get_api_base_url, get_http_client, get_tenant_id
 
 console = Console()
+# `serve` keeps stdout for results, so its errors go to stderr
+error_console = Console(stderr=True)
 
 
 @click.group()
@@ -39,7 +41,8 @@ def run_inference(
           --adapter sentiment_v1 \\
           --input "I love this product!"
     """
-    api_url = get_api_base_url()
+    import httpx
+
     tenant_id = get_tenant_id()
 
     payload = {
@@ -56,12 +59,14 @@ def run_inference(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        # No live redraw thread when output is piped or captured
+        disable=not console.is_terminal,
     ) as progress:
         task = progress.add_task("Running inference...", total=None)
 
         try:
-            response = httpx.post(
-                f"{api_url}/v0/inference/",
+            response = get_http_client().post(
+                "/v0/inference/",
                 json=payload,
                 params={"tenant_id": tenant_id},
                 timeout=120.0,  # 2 min for inference
@@ -70,7 +75,7 @@ def run_inference(
 
             progress.update(task, completed=True)
 
-            result = response.json()
+            result = orjson.loads(response.content)
 
             console.print(f"\n[bold]Input:[/bold]")
             console.print(Panel(input_text, border_style="cyan"))
@@ -103,17 +108,33 @@ def run_inference(
 @click.option("--adapter", required=True, help="Adapter name to use")
 @click.argument("input_file", type=click.Path(exists=True))
 @click.option("--output", type=click.Path(), help="Output file (default: stdout)")
-def run_batch_inference(model_id: str, adapter: str, input_file: str, output: str):
+@click.option("--batch-size", default=32, type=click.IntRange(min=1), help="Inputs per request")
+@click.option("--concurrency", default=4, type=click.IntRange(min=1), help="Maximum requests in flight")
+def run_batch_inference(
+    model_id: str,
+    adapter: str,
+    input_file: str,
+    output: str,
+    batch_size: int,
+    concurrency: int,
+):
     """
     Run batch inference from a file (one input per line).
 
+    Inputs are sent in chunks of --batch-size, with up to --concurrency
+    requests in flight, so one slow chunk doesn't hold up the rest.
+
     Example:
         fastuner inference batch \\
           --model-id meta-llama/Llama-2-7b-chat-hf \\
           --adapter sentiment_v1 \\
           inputs.txt --output results.txt
     """
-    api_url = get_api_base_url()
+    import asyncio
+    import time
+
+    import httpx
+
     tenant_id = get_tenant_id()
 
     # Read inputs
@@ -122,32 +143,49 @@ def run_batch_inference(model_id: str, adapter: str, input_file: str, output: st
 
     console.print(f"Processing {len(inputs)} inputs...")
 
-    payload = {
-        "model_id": model_id,
-        "adapter_name": adapter,
-        "inputs": inputs,
-    }
+    chunks = [inputs[i:i + batch_size] for i in range(0, len(inputs), batch_size)]
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
         console=console,
+        # No live redraw thread when output is piped or captured
+        disable=not console.is_terminal,
     ) as progress:
-        task = progress.add_task("Running batch inference...", total=None)
+        task = progress.add_task("Running batch inference...", total=len(chunks))
 
-        try:
-            response = httpx.post(
-                f"{api_url}/v0/inference/",
-                json=payload,
-                params={"tenant_id": tenant_id},
-                timeout=300.0,  # 5 min for batch
-            )
-            response.raise_for_status()
+        async def _run() -> list:
+            semaphore = asyncio.Semaphore(concurrency)
 
-            progress.update(task, completed=True)
+            async with httpx.AsyncClient(
+                base_url=get_api_base_url(),
+                timeout=300.0,  # 5 min per chunk
+                limits=httpx.Limits(max_connections=concurrency),
+                transport=httpx.AsyncHTTPTransport(retries=2),
+            ) as client:
+
+                async def _send(chunk: list) -> list:
+                    async with semaphore:
+                        response = await client.post(
+                            "/v0/inference/",
+                            json={"model_id": model_id, "adapter_name": adapter, "inputs": chunk},
+                            params={"tenant_id": tenant_id},
+                        )
+                    response.raise_for_status()
+                    progress.advance(task)
+                    return orjson.loads(response.content)["outputs"]
+
+                # gather preserves chunk order, so outputs line up with inputs
+                results = await asyncio.gather(*(_send(chunk) for chunk in chunks))
 
-            result = response.json()
-            outputs = result["outputs"]
+            return [out for chunk_outputs in results for out in chunk_outputs]
+
+        try:
+            start = time.perf_counter()
+            outputs = asyncio.run(_run())
+            elapsed_ms = (time.perf_counter() - start) * 1000
 
             # Write outputs
             if output:
@@ -160,7 +198,7 @@ def run_batch_inference(model_id: str, adapter: str, input_file: str, output: st
                     console.print(f"\n[bold]Output {i+1}:[/bold]")
                     console.print(Panel(out, border_style="green"))
 
-            console.print(f"\n[dim]Total latency: {result['latency_ms']:.2f}ms[/dim]")
+            console.print(f"\n[dim]Total latency: {elapsed_ms:.2f}ms ({len(chunks)} request(s))[/dim]")
 
         except httpx.HTTPStatusError as e:
             progress.stop()
@@ -170,3 +208,94 @@ def run_batch_inference(model_id: str, adapter: str, input_file: str, output: st
             progress.stop()
             console.print(f"\n❌ [red]Error: {e}[/red]")
             raise click.Abort()
+
+
+@inference.command("serve")
+@click.option("--model-id", required=True, help="Base model ID")
+@click.option("--adapter", required=True, help="Adapter name to use")
+@click.option("--batch-size", default=32, type=click.IntRange(min=1), help="Maximum inputs per request")
+@click.option(
+    "--batch-timeout-ms",
+    default=10,
+    type=click.IntRange(min=0),
+    help="How long to wait for more inputs before sending a partial batch",
+)
+def serve_inference(model_id: str, adapter: str, batch_size: int, batch_timeout_ms: int):
+    """
+    Run inference on inputs streamed over stdin (one per line).
+
+    Lines arriving close together are coalesced into one request of up to
+    --batch-size inputs, so the endpoint batches them in a single forward
+    pass. Each result is written to stdout as a JSON line with "input" and
+    "output".
+
+    Example:
+        tail -f prompts.txt | fastuner inference serve \\
+          --model-id meta-llama/Llama-2-7b-chat-hf \\
+          --adapter sentiment_v1
+    """
+    import queue
+    import sys
+    import threading
+    import time
+
+    import httpx
+
+    tenant_id = get_tenant_id()
+    batch_timeout = batch_timeout_ms / 1000
+
+    # A reader thread turns blocking stdin reads into a queue we can poll
+    # with a deadline; None marks end of input
+    lines: "queue.Queue" = queue.Queue()
+
+    def _read_stdin():
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                lines.put(line)
+        lines.put(None)
+
+    threading.Thread(target=_read_stdin, daemon=True).start()
+
+    def _flush(batch: list):
+        response = get_http_client().post(
+            "/v0/inference/",
+            json={"model_id": model_id, "adapter_name": adapter, "inputs": batch},
+            params={"tenant_id": tenant_id},
+            timeout=120.0,
+        )
+        response.raise_for_status()
+        outputs = orjson.loads(response.content)["outputs"]
+        for text, out in zip(batch, outputs):
+            sys.stdout.write(orjson.dumps({"input": text, "output": out}).decode() + "\n")
+        sys.stdout.flush()
+
+    try:
+        eof = False
+        while not eof:
+            # Block for the first input of a batch, then collect more until
+            # the batch is full or the window since the first input closes
+            first = lines.get()
+            if first is None:
+                break
+            batch = [first]
+            deadline = time.monotonic() + batch_timeout
+
+            while len(batch) < batch_size:
+                try:
+                    line = lines.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if line is None:
+                    eof = True
+                    break
+                batch.append(line)
+
+            _flush(batch)
+
+    except httpx.HTTPStatusError as e:
+        error_console.print(f"❌ [red]Error: {e.response.status_code}[/red]")
+        raise click.Abort()
+    except Exception as e:
+        error_console.print(f"❌ [red]Error: {e}[/red]")
+        raise click.Abort()
@@ -1,15 +1,37 @@
 """Training job logs CLI commands"""
 
 import click
-import boto3
 from rich.console import Console
 from rich.syntax import Syntax
+from rich.text import Text
 
 from .config import get_api_base_url, get_tenant_id
-from fastuner.config import get_settings
 
 console = Console()
-settings = get_settings()
+
+# (substrings, style) checked in order to color a log line by level
+_LEVEL_STYLES = (
+    (("ERROR", "Error"), "red"),
+    (("WARNING", "Warning"), "yellow"),
+    (("INFO",), "dim"),
+)
+
+
+# CloudWatch filter patterns for --level; "?" ORs terms, and each level
+# includes the ones above it (same markers as _LEVEL_STYLES)
+_LEVEL_FILTERS = {
+    "error": "?ERROR ?Error",
+    "warning": "?ERROR ?Error ?WARNING ?Warning",
+    "info": "?ERROR ?Error ?WARNING ?Warning ?INFO",
+}
+
+
+def _level_style(message: str) -> str:
+    """Style for a log line based on the level words it contains"""
+    for markers, style in _LEVEL_STYLES:
+        if any(marker in message for marker in markers):
+            return style
+    return ""
 
 
 @click.group()
@@ -21,69 +43,63 @@ def logs():
 @logs.command("training")
 @click.argument("sagemaker_job_name")
 @click.option("--tail", default=100, help="Number of lines to show (default: 100)")
-def training_logs(sagemaker_job_name: str, tail: int):
+@click.option("--since", type=int, help="Only show logs from the last N minutes")
+@click.option(
+    "--level",
+    type=click.Choice(list(_LEVEL_FILTERS)),
+    help="Only show lines at this level or above (filtered by CloudWatch)",
+)
+@click.option("--grep", "filter_pattern", help="CloudWatch filter pattern, e.g. '\"loss\"'")
+def training_logs(sagemaker_job_name: str, tail: int, since: int, level: str, filter_pattern: str):
     """
     Fetch CloudWatch logs for a SageMaker training job.
 
     Example:
         fastuner logs training ft-default--job-6230-20251207-040030
     """
+    if level and filter_pattern:
+        raise click.UsageError("--level and --grep cannot be combined")
+
+    import time
+
+    from fastuner.utils.aws_clients import get_client
+    from fastuner.utils.cloudwatch import fetch_log_events_by_prefix
+
     try:
-        # Get CloudWatch logs
-        logs_client = boto3.client("logs", region_name=settings.aws_region)
+        logs_client = get_client("logs")
 
-        # SageMaker log group and stream naming convention
+        # SageMaker names streams "<job name>/algo-<n>-<timestamp>"
         log_group = f"/aws/sagemaker/TrainingJobs"
-        log_stream = f"{sagemaker_job_name}/algo-1-1702000000000"  # Pattern
 
-        # List log streams for this job
         console.print(f"[yellow]Fetching logs for {sagemaker_job_name}...[/yellow]")
 
+        start_time = int((time.time() - since * 60) * 1000) if since else None
+
         try:
-            streams_response = logs_client.describe_log_streams(
-                logGroupName=log_group,
-                logStreamNamePrefix=sagemaker_job_name,
-                orderBy="LastEventTime",
-                descending=True,
-                limit=5
+            # Fetch logs across all of the job's streams, keeping the most recent lines
+            events = fetch_log_events_by_prefix(
+                log_group,
+                f"{sagemaker_job_name}/",
+                tail=tail,
+                start_time=start_time,
+                filter_pattern=_LEVEL_FILTERS[level] if level else filter_pattern,
             )
 
-            if not streams_response.get("logStreams"):
+            if not events:
                 console.print(f"[red]No logs found for {sagemaker_job_name}[/red]")
                 console.print("[yellow]Job may still be starting or logs not yet available[/yellow]")
                 return
 
-            # Get the most recent log stream
-            log_stream_name = streams_response["logStreams"][0]["logStreamName"]
-            console.print(f"[dim]Log stream: {log_stream_name}[/dim]\n")
-
-            # Fetch logs
-            logs_response = logs_client.get_log_events(
-                logGroupName=log_group,
-                logStreamName=log_stream_name,
-                limit=tail,
-                startFromHead=False  # Get most recent
-            )
-
-            events = logs_response.get("events", [])
-
-            if not events:
-                console.print("[yellow]No log events found[/yellow]")
-                return
-
-            # Display logs
+            # Display logs as one styled Text so the terminal gets a single
+            # write (messages are plain text, never parsed as markup)
             console.print(f"[bold]Last {len(events)} log lines:[/bold]\n")
+            text = Text()
             for event in events:
                 message = event["message"].rstrip()
-                # Color code based on log level
-                if "ERROR" in message or "Error" in message:
-                    console.print(f"[red]{message}[/red]")
-                elif "WARNING" in message or "Warning" in message:
-                    console.print(f"[yellow]{message}[/yellow]")
-                elif "INFO" in message:
-                    console.print(f"[dim]{message}[/dim]")
-                else:
-                    console.print(message)
+                text.append(message, style=_level_style(message))
+                text.append("\n")
+            text.rstrip()
+            console.print(text)
 
         except logs_client.exceptions.ResourceNotFoundException:
             console.print(f"[red]Log group not found: {log_group}[/red]")
@@ -1,7 +1,7 @@
 """Configuration management for Fastuner"""
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 
 class Settings(BaseSettings):
@@ -39,21 +39,34 @@ class Settings(BaseSettings):
 
     # Deployment Configuration
     default_deployment_ttl: int = 3600  # 1 hour in seconds
+    last_used_flush_interval: int = 60  # seconds between last_used_at writes
+    instance_costs_file: str = ""  # optional JSON {instance_type: $/hour} overriding built-in prices
 
     # Environment
     environment: str = "development"
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production"""
         return self.environment.lower() == "production"
 
-    @property
+    @cached_property
+    def async_database_url(self) -> str:
+        """Database URL rewritten to use an asyncio driver"""
+        url = self.database_url
+        if url.startswith("sqlite:"):
+            return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+        for prefix in ("postgresql+psycopg2:", "postgresql:", "postgres:"):
+            if url.startswith(prefix):
+                return url.replace(prefix, "postgresql+asyncpg:", 1)
+        return url
+
+    @cached_property
     def sagemaker_subnet_list(self) -> list[str]:
         """Parse subnet IDs from comma-separated string"""
         return [s.strip() for s in self.sagemaker_subnet_ids.split(",") if s.strip()]
 
-    @property
+    @cached_property
     def sagemaker_security_group_list(self) -> list[str]:
         """Parse security group IDs from comma-separated string"""
         return [s.strip() for s in self.sagemaker_security_group_ids.split(",") if s.strip()]
@@ -1,6 +1,6 @@
 """Dataset validation and splitting logic"""
 
 from .validator import DatasetValidator, ValidationError
-from .splitter import DatasetSplitter
+from .splitter import DatasetSplitter, iter_split
 
-__all__ = ["DatasetValidator", "ValidationError", "DatasetSplitter"]
+__all__ = ["DatasetValidator", "ValidationError", "DatasetSplitter", "iter_split"]
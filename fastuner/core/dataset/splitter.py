@@ -8,9 +8,11 @@ Implements deterministic splitting for text generation tasks:
 - Minimum sample validation (80/10/10 samples minimum)
 """
 
-import random
 import logging
-from typing import List, Dict
+import random
+from typing import Dict, Iterator, List, Sequence
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -52,13 +54,43 @@ class DatasetSplitter:
         Returns:
             Dict with keys "train", "val", "test" containing record lists
 
+        Raises:
+            SplitValidationError: If split fails validation
+        """
+        indices = cls.split_indices(len(records), seed=seed, ratios=ratios)
+
+        return {name: list(iter_split(records, idx)) for name, idx in indices.items()}
+
+    @classmethod
+    def split_indices(
+        cls,
+        total: int,
+        seed: int = 42,
+        ratios: Dict[str, float] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Split record positions without touching the records themselves.
+
+        Callers that only stream each split (e.g. straight into an S3 upload)
+        can gather records lazily with iter_split() instead of building three
+        new lists of dicts. split() returns the same partition for the same
+        seed.
+
+        Args:
+            total: Number of records
+            seed: Random seed for reproducibility
+            ratios: Custom split ratios (defaults to 80/10/10)
+
+        Returns:
+            Dict with keys "train", "val", "test" containing index arrays
+
         Raises:
             SplitValidationError: If split fails validation
         """
         ratios = ratios or cls.DEFAULT_RATIOS
 
         # Random shuffled split for text generation
-        splits = cls._random_split(records, ratios, seed)
+        splits = cls._random_split(total, ratios, seed)
 
         # Validate splits
         cls._validate_splits(splits)
@@ -73,27 +105,29 @@ class DatasetSplitter:
     @classmethod
     def _random_split(
         cls,
-        records: List[Dict[str, str]],
+        total: int,
         ratios: Dict[str, float],
         seed: int,
-    ) -> Dict[str, List[Dict[str, str]]]:
+    ) -> Dict[str, np.ndarray]:
         """Random shuffled split for generation/QA tasks"""
-        random.seed(seed)
-        shuffled = records.copy()
-        random.shuffle(shuffled)
+        # Same permutation the original random.seed(seed) + random.shuffle(records)
+        # produced (shuffle depends only on length), so stored split_seeds keep
+        # reproducing their splits; a local Random leaves global state alone
+        order = list(range(total))
+        random.Random(seed).shuffle(order)
+        order = np.array(order, dtype=np.intp)
 
-        total = len(shuffled)
         train_end = int(total * ratios["train"])
         val_end = train_end + int(total * ratios["val"])
 
         return {
-            "train": shuffled[:train_end],
-            "val": shuffled[train_end:val_end],
-            "test": shuffled[val_end:],
+            "train": order[:train_end],
+            "val": order[train_end:val_end],
+            "test": order[val_end:],
         }
 
     @classmethod
-    def _validate_splits(cls, splits: Dict[str, List[Dict[str, str]]]) -> None:
+    def _validate_splits(cls, splits: Dict[str, Sequence]) -> None:
         """Validate minimum sample requirements"""
         if len(splits["train"]) < cls.MIN_TRAIN_SAMPLES:
             raise SplitValidationError(
@@ -112,3 +146,8 @@ class DatasetSplitter:
                 f"Test split must have ≥{cls.MIN_TEST_SAMPLES} samples, "
                 f"got {len(splits['test'])}"
             )
+
+
+def iter_split(records: List[Dict[str, str]], indices: np.ndarray) -> Iterator[Dict[str, str]]:
+    """Yield the records at the given positions, in index order"""
+    return map(records.__getitem__, indices.tolist())
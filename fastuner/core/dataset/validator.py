@@ -9,14 +9,51 @@ Implements strict JSONL validation according to the design spec:
 - Minimum 100 unique samples
 """
 
-import json
 import hashlib
+import io
 import logging
-from typing import List, Dict, Any, Set
-from io import StringIO
+import mmap
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+from typing import BinaryIO, List, Dict, Any, Set, Iterable, Iterator, Optional, Tuple, Union
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Dedup keys are truncated digests; 128 bits keeps collisions negligible
+DEDUP_KEY_BYTES = 16
+
+# Fields every record must have
+REQUIRED_FIELDS = frozenset({"input_text", "target_text"})
+
+# Files at least this large are validated in chunks across worker processes;
+# below it, process startup and pickling cost more than they save
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+PARALLEL_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """
+    Yield the lines of text one at a time.
+
+    Unlike StringIO(text), which copies the whole string into a 4-byte-per-char
+    buffer, this slices one line at a time out of the original string.
+    """
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find("\n", start)
+        if end == -1:
+            end = length
+        yield text[start:end]
+        start = end + 1
+
 
 class ValidationError(Exception):
     """Custom exception for dataset validation errors"""
@@ -50,45 +87,181 @@ class DatasetValidator:
         Raises:
             ValidationError: If validation fails
         """
+        return cls.validate_lines(_iter_lines(file_content), skip_min_samples=skip_min_samples)
+
+    @classmethod
+    def validate_lines(
+        cls,
+        lines: Iterable[Union[str, bytes]],
+        skip_min_samples: bool = False,
+    ) -> List[Dict[str, str]]:
+        """
+        Validate and parse JSONL records from an iterable of lines.
+
+        Accepts any iterable of str or bytes lines (e.g. a binary file object),
+        so uploads can be validated line-by-line without first decoding the
+        whole file into memory.
+
+        Args:
+            lines: Iterable of JSONL lines (str or UTF-8 bytes)
+            skip_min_samples: Skip minimum sample count validation (for testing)
+
+        Returns:
+            List of validated and deduplicated records
+
+        Raises:
+            ValidationError: If validation fails
+        """
+        records, _ = cls._parse_lines(lines)
+        cls._check_min_samples(records, skip_min_samples)
+        return records
+
+    @classmethod
+    def validate_file(
+        cls,
+        fileobj: BinaryIO,
+        skip_min_samples: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Validate and parse a binary JSONL file from its current position.
+
+        Small files (or a single CPU) go through validate_lines. Files of PARALLEL_MIN_BYTES or
+        more are split at newline boundaries and validated chunk-by-chunk in
+        worker processes (JSON parsing and hashing are CPU-bound and hold the
+        GIL). Workers receive only (path, start, end) byte ranges and read
+        their chunk from the file themselves, so no chunk data is pickled
+        through the pool. Results are merged in file order, so errors, line
+        numbers and dedup behave exactly as in validate_lines.
+
+        Args:
+            fileobj: Binary file object (e.g. an upload's spooled file)
+            skip_min_samples: Skip minimum sample count validation (for testing)
+            max_workers: Worker processes (default: CPU count)
+
+        Returns:
+            List of validated and deduplicated records
+
+        Raises:
+            ValidationError: If validation fails
+        """
+        offset = fileobj.tell()
+        size = fileobj.seek(0, io.SEEK_END) - offset
+        fileobj.seek(offset)
+
+        workers = max_workers or os.cpu_count() or 1
+
+        # Small files stay in memory: handing workers a path means copying an
+        # anonymous file (e.g. a SpooledTemporaryFile) out to disk first
+        if workers < 2 or size == 0 or size < PARALLEL_MIN_BYTES:
+            return cls.validate_lines(fileobj, skip_min_samples=skip_min_samples)
+
+        records: List[Dict[str, str]] = []
+        seen_hashes: Set[bytes] = set()
+
+        with _file_path(fileobj, offset) as (path, start), \
+                open(path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ranges = list(_iter_chunk_ranges(mm, start))
+
+            # Scoped to this call so worker processes never outlive it
+            with _validation_pool(min(workers, len(ranges))) as pool:
+                # map yields in submission order, so the first chunk with an
+                # error raises first, just as a sequential scan would
+                results = pool.map(
+                    _validate_chunk,
+                    repeat(path),
+                    (chunk_start for chunk_start, _ in ranges),
+                    (chunk_end for _, chunk_end in ranges),
+                )
+                line_number = 1
+                for chunk_start, chunk_end in ranges:
+                    try:
+                        chunk_records, chunk_hashes, chunk_lines = next(results)
+                    except ValidationError:
+                        # Workers number lines from 1 within their chunk; parse the
+                        # failing chunk here to raise with the file's line numbers
+                        pool.shutdown(cancel_futures=True)
+                        cls._parse_lines(mm[chunk_start:chunk_end].split(b"\n"), line_number)
+                        raise
+
+                    for record, record_hash in zip(chunk_records, chunk_hashes):
+                        # Chunks dedup locally; drop repeats of earlier chunks
+                        if record_hash not in seen_hashes:
+                            seen_hashes.add(record_hash)
+                            records.append(record)
+                    line_number += chunk_lines
+
+        cls._check_min_samples(records, skip_min_samples)
+        return records
+
+    @classmethod
+    def _parse_lines(
+        cls,
+        lines: Iterable[Union[str, bytes]],
+        first_line_number: int = 1,
+    ) -> Tuple[List[Dict[str, str]], List[bytes]]:
+        """
+        Parse, validate and deduplicate lines.
+
+        Returns:
+            Unique records and their dedup keys (parallel lists)
+        """
         records = []
-        seen_hashes: Set[str] = set()
-        line_number = 0
+        hashes = []
+        seen_hashes: Set[bytes] = set()
+        line_number = first_line_number - 1
+
+        # Resolve per-record helpers once, not on every line
+        loads = orjson.loads
+        validate_schema = cls._validate_record_schema
+        validate_fields = cls._validate_field_constraints
+        compute_hash = cls._compute_hash
 
         try:
-            for line in StringIO(file_content):
+            for line in lines:
                 line_number += 1
-                line = line.strip()
 
-                # Skip empty lines
-                if not line:
+                # Skip blank lines without allocating a stripped copy; orjson
+                # ignores surrounding whitespace (incl. the newline) itself
+                if not line or line.isspace():
                     continue
 
                 # Parse JSON
                 try:
-                    record = json.loads(line)
-                except json.JSONDecodeError as e:
+                    record = loads(line)
+                except orjson.JSONDecodeError as e:
+                    if isinstance(line, bytes):
+                        # Surface encoding problems distinctly from syntax errors
+                        line.decode("utf-8")
                     raise ValidationError(
                         f"Line {line_number}: Invalid JSON - {str(e)}"
                     )
 
                 # Validate schema
-                cls._validate_record_schema(record, line_number)
+                validate_schema(record, line_number)
 
                 # Validate field constraints
-                cls._validate_field_constraints(record, line_number)
+                validate_fields(record, line_number)
 
                 # Deduplicate
-                record_hash = cls._compute_hash(record)
+                record_hash = compute_hash(record)
                 if record_hash in seen_hashes:
                     logger.debug(f"Line {line_number}: Duplicate record, skipping")
                     continue
 
                 seen_hashes.add(record_hash)
                 records.append(record)
+                hashes.append(record_hash)
 
         except UnicodeDecodeError as e:
             raise ValidationError(f"Line {line_number}: Non-UTF-8 encoding - {str(e)}")
 
+        return records, hashes
+
+    @classmethod
+    def _check_min_samples(cls, records: List[Dict[str, str]], skip_min_samples: bool) -> None:
+        """Enforce MIN_UNIQUE_SAMPLES and log the result"""
         # Validate minimum samples (unless skipped for testing)
         if not skip_min_samples and len(records) < cls.MIN_UNIQUE_SAMPLES:
             raise ValidationError(
@@ -96,7 +269,6 @@ class DatasetValidator:
             )
 
         logger.info(f"Validation successful: {len(records)} unique samples")
-        return records
 
     @classmethod
     def _validate_record_schema(cls, record: Any, line_number: int) -> None:
@@ -106,10 +278,10 @@ class DatasetValidator:
                 f"Line {line_number}: Record must be a JSON object, got {type(record).__name__}"
             )
 
-        required_fields = {"input_text", "target_text"}
-        missing_fields = required_fields - set(record.keys())
-
-        if missing_fields:
+        # Subset test against the live keys view; the missing set is only
+        # built on failure
+        if not record.keys() >= REQUIRED_FIELDS:
+            missing_fields = set(REQUIRED_FIELDS - record.keys())
             raise ValidationError(
                 f"Line {line_number}: Missing required fields: {missing_fields}"
             )
@@ -124,13 +296,8 @@ class DatasetValidator:
                 f"Line {line_number}: 'input_text' must be a string, got {type(input_text).__name__}"
             )
 
-        # Check UTF-8 encoding
-        try:
-            input_text.encode("utf-8")
-        except UnicodeEncodeError:
-            raise ValidationError(
-                f"Line {line_number}: 'input_text' contains non-UTF-8 characters"
-            )
+        # No UTF-8 re-encode check needed: orjson.loads rejects invalid UTF-8
+        # and lone surrogates (escaped or not), so parsed strings always encode
 
         # Check length
         if not (cls.MIN_INPUT_LENGTH <= len(input_text) <= cls.MAX_INPUT_LENGTH):
@@ -146,13 +313,6 @@ class DatasetValidator:
                 f"Line {line_number}: 'target_text' must be a string, got {type(target_text).__name__}"
             )
 
-        try:
-            target_text.encode("utf-8")
-        except UnicodeEncodeError:
-            raise ValidationError(
-                f"Line {line_number}: 'target_text' contains non-UTF-8 characters"
-            )
-
         if not (cls.MIN_TARGET_LENGTH <= len(target_text) <= cls.MAX_TARGET_LENGTH):
             raise ValidationError(
                 f"Line {line_number}: 'target_text' length must be between "
@@ -160,7 +320,77 @@ class DatasetValidator:
             )
 
     @staticmethod
-    def _compute_hash(record: Dict[str, str]) -> str:
-        """Compute SHA-256 hash of record for deduplication"""
-        content = record["input_text"] + record["target_text"]
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    def _compute_hash(record: Dict[str, str]) -> bytes:
+        """
+        Compute a 128-bit dedup key for a record (truncated SHA-256).
+
+        The (input_text, target_text) pair is encoded as a JSON array so field
+        boundaries are unambiguous ("ab" + "c" and "a" + "bc" hash differently).
+        Only the first 16 bytes of the digest are kept: 128 bits is ample for
+        dedup and halves the size of the seen-hash set.
+        """
+        content = orjson.dumps((record["input_text"], record["target_text"]))
+        return hashlib.sha256(content).digest()[:DEDUP_KEY_BYTES]
+
+
+@contextmanager
+def _file_path(fileobj: BinaryIO, offset: int) -> Iterator[Tuple[str, int]]:
+    """
+    Yield (path, start offset) of a file workers can open for fileobj's data.
+
+    Files with a real path are used in place. Anonymous files (e.g. an
+    upload's SpooledTemporaryFile) are copied from offset to a named
+    temporary file, removed on exit.
+    """
+    name = getattr(fileobj, "name", None)
+    if isinstance(name, str) and os.path.isfile(name):
+        yield name, offset
+        return
+
+    with tempfile.NamedTemporaryFile(suffix=".jsonl") as tmp:
+        fileobj.seek(offset)
+        shutil.copyfileobj(fileobj, tmp)
+        tmp.flush()
+        yield tmp.name, 0
+
+
+def _iter_chunk_ranges(mm: mmap.mmap, offset: int) -> Iterator[Tuple[int, int]]:
+    """Yield (start, end) byte offsets of newline-aligned chunks of mm[offset:]"""
+    start = offset
+    size = len(mm)
+    while start < size:
+        end = mm.find(b"\n", min(start + PARALLEL_CHUNK_BYTES, size) - 1)
+        end = size if end == -1 else end + 1
+        yield start, end
+        start = end
+
+
+def _validate_chunk(path: str, start: int, end: int) -> Tuple[List[Dict[str, str]], List[bytes], int]:
+    """
+    Worker entry point for DatasetValidator.validate_file.
+
+    Reads bytes [start, end) of path itself and numbers lines from 1.
+
+    Returns:
+        Unique records, their dedup keys, and the chunk's line count
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        chunk = f.read(end - start)
+    records, hashes = DatasetValidator._parse_lines(chunk.split(b"\n"))
+    return records, hashes, chunk.count(b"\n")
+
+
+def _validation_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Create a validation worker pool (use as a context manager).
+
+    Workers are spawned rather than forked, since the API server calls this
+    from a thread of an already multi-threaded process. Only files of
+    PARALLEL_MIN_BYTES or more get here, so spawn cost is small next to the
+    validation work, and no idle workers linger between uploads.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
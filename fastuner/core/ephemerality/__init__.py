@@ -1,5 +1,5 @@
 """Ephemerality management for automatic resource cleanup"""
 
-from .manager import EphemeralityManager
+from .manager import EphemeralityManager, get_ephemerality_manager
 
-__all__ = ["EphemeralityManager"]
+__all__ = ["EphemeralityManager", "get_ephemerality_manager"]
@@ -7,17 +7,121 @@ This module handles:
 - Cost tracking and reporting
 """
 
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Iterator, List, Dict, Any, Optional, Set
+from sqlalchemy import and_, case, func, or_, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
 
+from fastuner.config import get_settings
 from fastuner.models.deployment import Deployment, DeploymentStatus
 from fastuner.core.inference import InferenceOrchestrator
 from fastuner.database import SessionLocal
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on endpoints torn down concurrently in one cleanup cycle
+CLEANUP_MAX_WORKERS = 16
+
+# Rows fetched per round-trip while streaming stale deployments; also the
+# number torn down per batch in a cleanup cycle
+STALE_SCAN_BATCH_SIZE = 500
+
+# Postgres advisory lock key for the cleanup cycle (any fixed 64-bit value)
+CLEANUP_LOCK_ID = 0x66746E72636C6E  # "ftnrcln"
+
+# Fallback guard for other dialects (only covers cycles in this process)
+_cleanup_lock = threading.Lock()
+
+# Instance type hourly costs (approximate); settings.instance_costs_file can
+# override or extend these, see get_instance_costs()
+INSTANCE_COSTS = {
+    "ml.t2.medium": 0.065,
+    "ml.t2.large": 0.130,
+    "ml.m5.xlarge": 0.269,
+    "ml.m5.2xlarge": 0.538,
+    "ml.g4dn.xlarge": 0.736,
+    "ml.g4dn.2xlarge": 1.044,
+    "ml.g5.xlarge": 1.408,
+    "ml.g5.2xlarge": 1.515,
+    "ml.g5.4xlarge": 2.449,
+    "ml.p3.2xlarge": 3.825,
+    "ml.p4d.24xlarge": 37.688,
+}
+
+
+@lru_cache()
+def get_instance_costs() -> Dict[str, float]:
+    """
+    Get hourly instance costs: INSTANCE_COSTS merged with the optional
+    settings.instance_costs_file (loaded once per process).
+    """
+    costs = dict(INSTANCE_COSTS)
+    path = get_settings().instance_costs_file
+    if path:
+        with open(path, "rb") as f:
+            costs.update({k: float(v) for k, v in json.load(f).items()})
+        logger.info(f"Loaded {len(costs)} instance prices from {path}")
+    return costs
+
+
+@lru_cache()
+def _hourly_cost_expr() -> ColumnElement:
+    """Hourly cost of a deployment row as a SQL expression (unknown types cost 0)"""
+    return (
+        case(get_instance_costs(), value=Deployment.instance_type, else_=0.0)
+        * Deployment.instance_count
+    )
+
+
+def _expired_clause(dialect: str, now: datetime) -> Optional[ColumnElement]:
+    """
+    SQL form of "last_used_at + ttl_seconds < now" for the given dialect.
+
+    Returns None for dialects without a known interval expression, in which
+    case the caller filters in Python only.
+    """
+    if dialect == "sqlite":
+        # Naive UTC timestamps are stored as text; julianday() parses them
+        elapsed_days = func.julianday(now) - func.julianday(Deployment.last_used_at)
+        return elapsed_days * 86400 > Deployment.ttl_seconds
+    if dialect == "postgresql":
+        ttl = func.make_interval(0, 0, 0, 0, 0, 0, Deployment.ttl_seconds)
+        return Deployment.last_used_at + ttl < now
+    return None
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Attach UTC to naive timestamps (SQLite returns last_used_at without tzinfo)"""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _acquire_cleanup_lock(db: Session) -> Optional[Callable[[], None]]:
+    """
+    Try to become the only running cleanup cycle.
+
+    On PostgreSQL this takes a transaction-scoped advisory lock, held until
+    the cycle's session commits or closes, so it also excludes cycles on
+    other hosts (e.g. overlapping scheduled Lambda runs).
+
+    Returns:
+        A release callable if acquired, otherwise None
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        acquired = db.execute(select(func.pg_try_advisory_xact_lock(CLEANUP_LOCK_ID))).scalar()
+        # Released automatically when the transaction ends
+        return (lambda: None) if acquired else None
+
+    if _cleanup_lock.acquire(blocking=False):
+        return _cleanup_lock.release
+    return None
+
 
 class EphemeralityManager:
     """Manages TTL-based cleanup of ephemeral resources"""
@@ -33,35 +137,73 @@ class EphemeralityManager:
         - Status is ACTIVE
         - (last_used_at + ttl_seconds) < now
 
+        Deployments left DELETING (e.g. a DELETE whose background teardown
+        failed or never ran) are always included, so teardown is retried.
+
         Args:
             db: Database session
 
         Returns:
             List of stale deployments
         """
-        now = datetime.utcnow()
-        stale_deployments = []
+        return list(self.iter_stale_deployments(db))
+
+    def iter_stale_deployments(
+        self,
+        db: Session,
+        batch_size: int = STALE_SCAN_BATCH_SIZE,
+        now: Optional[datetime] = None,
+    ) -> Iterator[Deployment]:
+        """
+        Stream deployments that have exceeded their TTL.
 
-        # Query all active deployments
-        active_deployments = (
-            db.query(Deployment)
-            .filter(Deployment.status == DeploymentStatus.ACTIVE)
-            .all()
+        Rows are fetched batch_size at a time (yield_per), so memory stays flat
+        however many deployments are active. On SQLite and PostgreSQL the
+        expiry test runs in SQL, so only stale rows are fetched. DELETING
+        deployments are yielded regardless of TTL.
+
+        Args:
+            db: Database session
+            batch_size: Rows fetched per round-trip
+            now: Reference time for the TTL check (default: current UTC time;
+                naive values are taken as UTC)
+
+        Yields:
+            Stale deployments
+        """
+        now = _as_utc(now) if now else datetime.now(timezone.utc)
+
+        active = Deployment.status == DeploymentStatus.ACTIVE
+
+        # Let the database drop unexpired rows so only stale ones are loaded
+        expired = _expired_clause(db.get_bind().dialect.name, now)
+        if expired is not None:
+            active = and_(
+                active,
+                Deployment.last_used_at.isnot(None),
+                Deployment.ttl_seconds.isnot(None),
+                expired,
+            )
+
+        query = db.query(Deployment).filter(
+            or_(active, Deployment.status == DeploymentStatus.DELETING)
         )
 
-        for deployment in active_deployments:
-            if deployment.last_used_at and deployment.ttl_seconds:
-                expiry_time = deployment.last_used_at + timedelta(seconds=deployment.ttl_seconds)
+        # Re-checked in Python: exact, and the only filter on other dialects
+        for deployment in query.yield_per(batch_size):
+            if deployment.status == DeploymentStatus.DELETING:
+                logger.debug(f"Retrying teardown of deleting deployment {deployment.id}")
+                yield deployment
+            elif deployment.last_used_at and deployment.ttl_seconds:
+                expiry_time = _as_utc(deployment.last_used_at) + timedelta(seconds=deployment.ttl_seconds)
                 if now > expiry_time:
-                    stale_deployments.append(deployment)
-                    logger.info(
+                    logger.debug(
                         f"Found stale deployment {deployment.id}: "
                         f"last_used_at={deployment.last_used_at}, "
                         f"ttl={deployment.ttl_seconds}s, "
                         f"expired_at={expiry_time}"
                     )
-
-        return stale_deployments
+                    yield deployment
 
     def cleanup_stale_deployment(self, deployment: Deployment, db: Session) -> Dict[str, Any]:
         """
@@ -74,40 +216,119 @@ class EphemeralityManager:
         Returns:
             Cleanup result with status and details
         """
-        result = {
-            "deployment_id": deployment.id,
-            "endpoint_name": deployment.endpoint_name,
-            "tenant_id": deployment.tenant_id,
-            "success": False,
-            "error": None,
-        }
+        error = self._teardown_endpoint(
+            deployment.id,
+            deployment.endpoint_name,
+            deployment.endpoint_config_name,
+            deployment.model_name,
+        )
+        result = self._record_cleanup(deployment, error)
+        db.commit()
+        return result
+
+    def _list_existing_endpoints(self) -> Optional[Set[str]]:
+        """
+        Names of endpoints that still exist in SageMaker.
 
+        Returns:
+            Set of endpoint names, or None if listing failed (callers then
+            attempt teardown for every deployment, as before)
+        """
         try:
-            # Delete SageMaker endpoint
-            logger.info(f"Deleting stale endpoint: {deployment.endpoint_name}")
+            return self.inference_orchestrator.list_endpoint_names()
+        except Exception as e:
+            logger.warning(f"Failed to list endpoints, tearing down without pre-check: {e}")
+            return None
+
+    def _teardown_endpoint(
+        self,
+        deployment_id: str,
+        endpoint_name: str,
+        config_name: Optional[str] = None,
+        model_name: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Delete a deployment's SageMaker endpoint, config and model.
+
+        Touches no database state, so it is safe to run from worker threads.
+        Config and model names recorded at creation time are passed through
+        so no Describe calls are needed.
+
+        Returns:
+            None on success, otherwise the error message
+        """
+        try:
+            logger.info(f"Deleting stale endpoint: {endpoint_name}")
             self.inference_orchestrator.delete_endpoint(
-                endpoint_name=deployment.endpoint_name,
+                endpoint_name=endpoint_name,
                 delete_config=True,
                 delete_model=True,
+                config_name=config_name,
+                model_name=model_name,
             )
-
-            # Update deployment status
+            return None
+        except Exception as e:
+            logger.error(f"Failed to clean up deployment {deployment_id}: {e}", exc_info=True)
+            return str(e)
+
+    def _record_cleanup(
+        self,
+        deployment: Deployment,
+        error: Optional[str],
+        now: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Update deployment status after teardown (caller commits)"""
+        if error is None:
             deployment.status = DeploymentStatus.DELETED
-            deployment.deleted_at = datetime.utcnow()
-            db.commit()
+            deployment.deleted_at = now or datetime.now(timezone.utc)
+        elif deployment.status != DeploymentStatus.DELETING:
+            # Mark as failed but don't raise; DELETING rows stay DELETING so
+            # the next cycle retries them
+            deployment.status = DeploymentStatus.FAILED
 
-            result["success"] = True
-            logger.info(f"Successfully cleaned up deployment {deployment.id}")
+        return self._cleanup_result(deployment, error)
 
-        except Exception as e:
-            logger.error(f"Failed to clean up deployment {deployment.id}: {e}", exc_info=True)
-            result["error"] = str(e)
+    @staticmethod
+    def _cleanup_result(deployment: Deployment, error: Optional[str]) -> Dict[str, Any]:
+        """Summary entry for a torn-down deployment"""
+        if error is None:
+            logger.info(f"Successfully cleaned up deployment {deployment.id}")
 
-            # Mark as failed but don't raise
-            deployment.status = DeploymentStatus.FAILED
-            db.commit()
+        return {
+            "deployment_id": deployment.id,
+            "endpoint_name": deployment.endpoint_name,
+            "tenant_id": deployment.tenant_id,
+            "success": error is None,
+            "error": error,
+        }
 
-        return result
+    @staticmethod
+    def _apply_cleanup_statuses(db: Session, cleaned_ids: List[str], failed_ids: List[str]) -> None:
+        """
+        Mark a cycle's deployments DELETED / FAILED with set-based UPDATEs
+        (caller commits).
+
+        One statement per status per STALE_SCAN_BATCH_SIZE ids (keeping IN
+        lists within bind-parameter limits), rather than a flush plus
+        eager-defaults fetch per row. Only rows still ACTIVE (or DELETING, for
+        successful teardowns) are touched, so a deployment changed by someone
+        else mid-cycle keeps its newer status. Failed DELETING rows are left
+        DELETING for the next cycle to retry.
+        """
+        for ids, status, from_statuses in (
+            (cleaned_ids, DeploymentStatus.DELETED, (DeploymentStatus.ACTIVE, DeploymentStatus.DELETING)),
+            (failed_ids, DeploymentStatus.FAILED, (DeploymentStatus.ACTIVE,)),
+        ):
+            for start in range(0, len(ids), STALE_SCAN_BATCH_SIZE):
+                db.execute(
+                    update(Deployment)
+                    .where(
+                        Deployment.id.in_(ids[start:start + STALE_SCAN_BATCH_SIZE]),
+                        Deployment.status.in_(from_statuses),
+                    )
+                    .values(status=status)
+                    .execution_options(synchronize_session=False)
+                )
 
     def run_cleanup_cycle(self, dry_run: bool = False) -> Dict[str, Any]:
         """
@@ -116,51 +337,118 @@ class EphemeralityManager:
         Args:
             dry_run: If True, only report stale deployments without deleting
 
+        Only one cycle runs at a time; an overlapping call returns at once
+        with skipped_reason="already_running" in its summary.
+
         Returns:
             Summary of cleanup cycle
         """
+        # One reference time for the whole cycle: every row is judged against
+        # the same "now" and the summary timestamp matches it
+        now = datetime.now(timezone.utc)
+        timestamp = now.isoformat()
+
         db = SessionLocal()
+        release_lock = None
         try:
-            # Find stale deployments
-            stale_deployments = self.find_stale_deployments(db)
+            # Skip rather than duplicate SageMaker deletes if a cycle is running
+            release_lock = _acquire_cleanup_lock(db)
+            if release_lock is None:
+                logger.warning("Cleanup cycle already running, skipping")
+                return {
+                    "timestamp": timestamp,
+                    "dry_run": dry_run,
+                    "stale_count": 0,
+                    "cleaned_count": 0,
+                    "failed_count": 0,
+                    "results": [],
+                    "skipped_reason": "already_running",
+                }
 
             summary = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp,
                 "dry_run": dry_run,
-                "stale_count": len(stale_deployments),
+                "stale_count": 0,
                 "cleaned_count": 0,
                 "failed_count": 0,
                 "results": [],
             }
 
-            if not stale_deployments:
+            # Stream stale deployments and handle them a batch at a time, so
+            # teardown starts before the scan finishes and memory stays flat.
+            # Nothing is committed until the scan is done: a commit would
+            # close the streaming cursor (and release the advisory lock).
+            stale = self.iter_stale_deployments(db, now=now)
+            cleaned_ids: List[str] = []
+            failed_ids: List[str] = []
+            existing_endpoints: Optional[Set[str]] = None
+            endpoints_listed = False
+            with ThreadPoolExecutor(max_workers=CLEANUP_MAX_WORKERS) as pool:
+                while batch := list(islice(stale, STALE_SCAN_BATCH_SIZE)):
+                    summary["stale_count"] += len(batch)
+
+                    if dry_run:
+                        summary["results"].extend(
+                            {
+                                "deployment_id": d.id,
+                                "endpoint_name": d.endpoint_name,
+                                "tenant_id": d.tenant_id,
+                                "last_used_at": d.last_used_at.isoformat() if d.last_used_at else None,
+                                "ttl_seconds": d.ttl_seconds,
+                            }
+                            for d in batch
+                        )
+                        continue
+
+                    # One ListEndpoints scan per cycle (on the first batch) tells
+                    # which endpoints still exist; ones already gone need no
+                    # SageMaker calls and are just marked deleted
+                    if not endpoints_listed:
+                        existing_endpoints = self._list_existing_endpoints()
+                        endpoints_listed = True
+
+                    to_teardown = [
+                        d for d in batch
+                        if existing_endpoints is None or d.endpoint_name in existing_endpoints
+                    ]
+
+                    # Teardown is several blocking SageMaker calls per endpoint, so
+                    # run endpoints in parallel; status updates stay on this
+                    # thread's session
+                    teardown_errors = dict(zip(
+                        (d.id for d in to_teardown),
+                        pool.map(
+                            self._teardown_endpoint,
+                            [d.id for d in to_teardown],
+                            [d.endpoint_name for d in to_teardown],
+                            [d.endpoint_config_name for d in to_teardown],
+                            [d.model_name for d in to_teardown],
+                        ),
+                    ))
+                    errors = [teardown_errors.get(d.id) for d in batch]
+
+                    for deployment, error in zip(batch, errors):
+                        result = self._cleanup_result(deployment, error)
+                        summary["results"].append(result)
+                        (cleaned_ids if error is None else failed_ids).append(deployment.id)
+
+                        if result["success"]:
+                            summary["cleaned_count"] += 1
+                        else:
+                            summary["failed_count"] += 1
+
+            if summary["stale_count"] == 0:
                 logger.info("No stale deployments found")
                 return summary
 
-            logger.info(f"Found {len(stale_deployments)} stale deployment(s)")
+            logger.info(f"Found {summary['stale_count']} stale deployment(s)")
 
             if dry_run:
-                summary["results"] = [
-                    {
-                        "deployment_id": d.id,
-                        "endpoint_name": d.endpoint_name,
-                        "tenant_id": d.tenant_id,
-                        "last_used_at": d.last_used_at.isoformat() if d.last_used_at else None,
-                        "ttl_seconds": d.ttl_seconds,
-                    }
-                    for d in stale_deployments
-                ]
                 return summary
 
-            # Clean up each stale deployment
-            for deployment in stale_deployments:
-                result = self.cleanup_stale_deployment(deployment, db)
-                summary["results"].append(result)
-
-                if result["success"]:
-                    summary["cleaned_count"] += 1
-                else:
-                    summary["failed_count"] += 1
+            # Status updates are applied once the scan is done (see above)
+            self._apply_cleanup_statuses(db, cleaned_ids, failed_ids)
+            db.commit()
 
             logger.info(
                 f"Cleanup cycle complete: "
@@ -171,51 +459,74 @@ class EphemeralityManager:
             return summary
 
         finally:
+            if release_lock is not None:
+                release_lock()
             db.close()
 
-    def get_cost_report(self, db: Session, tenant_id: str = None) -> Dict[str, Any]:
+    def get_cost_report(
+        self,
+        db: Session,
+        tenant_id: str = None,
+        include_details: bool = True,
+    ) -> Dict[str, Any]:
         """
         Generate a cost report for active deployments.
 
         Args:
             db: Database session
             tenant_id: Optional tenant ID to filter by
+            include_details: If False, compute only the totals with one SQL
+                aggregate and leave "deployments" empty (no rows are loaded)
 
         Returns:
             Cost report with estimated hourly costs
         """
-        # Instance type hourly costs (approximate)
-        INSTANCE_COSTS = {
-            "ml.t2.medium": 0.065,
-            "ml.t2.large": 0.130,
-            "ml.m5.xlarge": 0.269,
-            "ml.m5.2xlarge": 0.538,
-            "ml.g4dn.xlarge": 0.736,
-            "ml.g4dn.2xlarge": 1.044,
-            "ml.g5.xlarge": 1.408,
-            "ml.g5.2xlarge": 1.515,
-            "ml.g5.4xlarge": 2.449,
-            "ml.p3.2xlarge": 3.825,
-            "ml.p4d.24xlarge": 37.688,
-        }
+        now = datetime.now(timezone.utc)
+
+        if not include_details:
+            stmt = select(
+                func.count(),
+                func.coalesce(func.sum(_hourly_cost_expr()), 0.0),
+            ).where(Deployment.status == DeploymentStatus.ACTIVE)
+            if tenant_id:
+                stmt = stmt.where(Deployment.tenant_id == tenant_id)
+
+            active_count, total_hourly_cost = db.execute(stmt).one()
+            return {
+                "timestamp": now.isoformat(),
+                "tenant_id": tenant_id,
+                "active_count": active_count,
+                "total_hourly_cost": round(total_hourly_cost, 3),
+                "estimated_monthly_cost": round(total_hourly_cost * 730, 2),  # 730 hours/month average
+                "deployments": [],
+            }
 
-        query = db.query(Deployment).filter(Deployment.status == DeploymentStatus.ACTIVE)
+        # Only the columns the report shows, as plain rows (no ORM hydration)
+        query = db.query(
+            Deployment.id,
+            Deployment.endpoint_name,
+            Deployment.instance_type,
+            Deployment.instance_count,
+            Deployment.last_used_at,
+            Deployment.ttl_seconds,
+        ).filter(Deployment.status == DeploymentStatus.ACTIVE)
         if tenant_id:
             query = query.filter(Deployment.tenant_id == tenant_id)
 
         active_deployments = query.all()
+        instance_costs = get_instance_costs()
 
         total_hourly_cost = 0.0
         deployments_info = []
 
         for deployment in active_deployments:
-            cost_per_hour = INSTANCE_COSTS.get(deployment.instance_type, 0.0) * deployment.instance_count
+            cost_per_hour = instance_costs.get(deployment.instance_type, 0.0) * deployment.instance_count
             total_hourly_cost += cost_per_hour
 
             # Calculate time since last use
             time_since_use = None
             if deployment.last_used_at:
-                time_since_use = (datetime.utcnow() - deployment.last_used_at).total_seconds()
+                time_since_use = (now - _as_utc(deployment.last_used_at)).total_seconds()
 
             deployments_info.append({
                 "deployment_id": deployment.id,
@@ -229,7 +540,7 @@ class EphemeralityManager:
             })
 
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
             "tenant_id": tenant_id,
             "active_count": len(active_deployments),
             "total_hourly_cost": round(total_hourly_cost, 3),
@@ -237,7 +548,66 @@ class EphemeralityManager:
             "deployments": deployments_info,
         }
 
+    def get_status_summary(self, db: Session) -> Dict[str, Any]:
+        """
+        Summarize active deployments for `fastuner cleanup status`.
+
+        Computes the active count, stale count and hourly cost with a single
+        SQL aggregate where the dialect supports the TTL filter (one pass over
+        a column-only query otherwise), instead of running
+        find_stale_deployments and get_cost_report separately.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Dict with active_count, stale_count and total_hourly_cost
+        """
+        now = datetime.now(timezone.utc)
+
+        expired = _expired_clause(db.get_bind().dialect.name, now)
+        if expired is not None:
+            # One aggregate row; no deployment rows cross the wire
+            active_count, stale_count, total_hourly_cost = db.execute(
+                select(
+                    func.count(),
+                    func.coalesce(func.sum(case((expired, 1), else_=0)), 0),
+                    func.coalesce(func.sum(_hourly_cost_expr()), 0.0),
+                ).where(Deployment.status == DeploymentStatus.ACTIVE)
+            ).one()
+            return {
+                "active_count": active_count,
+                "stale_count": stale_count,
+                "total_hourly_cost": round(total_hourly_cost, 3),
+            }
+
+        rows = (
+            db.query(
+                Deployment.instance_type,
+                Deployment.instance_count,
+                Deployment.last_used_at,
+                Deployment.ttl_seconds,
+            )
+            .filter(Deployment.status == DeploymentStatus.ACTIVE)
+            .all()
+        )
+
+        instance_costs = get_instance_costs()
+        stale_count = 0
+        total_hourly_cost = 0.0
+        for instance_type, instance_count, last_used_at, ttl_seconds in rows:
+            total_hourly_cost += instance_costs.get(instance_type, 0.0) * instance_count
+            if last_used_at and ttl_seconds and now > _as_utc(last_used_at) + timedelta(seconds=ttl_seconds):
+                stale_count += 1
+
+        return {
+            "active_count": len(rows),
+            "stale_count": stale_count,
+            "total_hourly_cost": round(total_hourly_cost, 3),
+        }
+
 
+@lru_cache()
 def get_ephemerality_manager() -> EphemeralityManager:
-    """Get EphemeralityManager instance"""
+    """Get the process-wide EphemeralityManager (reused across CLI commands and warm Lambda invocations)"""
     return EphemeralityManager()
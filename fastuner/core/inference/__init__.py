@@ -1,5 +1,6 @@
 """Inference and deployment orchestration logic"""
 
-from .orchestrator import InferenceOrchestrator
+from .orchestrator import InferenceOrchestrator, get_inference_orchestrator
+from .usage import LastUsedTracker, last_used_tracker
 
-__all__ = ["InferenceOrchestrator"]
+__all__ = ["InferenceOrchestrator", "get_inference_orchestrator", "LastUsedTracker", "last_used_tracker"]
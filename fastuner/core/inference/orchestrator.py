@@ -9,11 +9,16 @@ This module handles:
 """
 
 import logging
-import json
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
+from functools import lru_cache
+
+import orjson
+from botocore.exceptions import ClientError
 
 from fastuner.config import get_settings
+from fastuner.utils.aws_cache import cached_describe_endpoint, invalidate_endpoint
 from fastuner.utils.sagemaker import get_sagemaker_client, get_sagemaker_runtime_client
 
 logger = logging.getLogger(__name__)
@@ -29,6 +34,8 @@ class InferenceOrchestrator:
     def __init__(self):
         self.sagemaker = get_sagemaker_client()
         self.runtime = get_sagemaker_runtime_client()
+        # Region is fixed for the process, so resolve the image URI once
+        self.image_uri = self.DEFAULT_LMI_IMAGE.format(region=settings.aws_region)
 
     def create_or_get_endpoint(
         self,
@@ -38,6 +45,7 @@ class InferenceOrchestrator:
         endpoint_name: str,
         instance_type: str = "ml.g5.2xlarge",
         instance_count: int = 1,
+        assume_new: bool = False,
     ) -> Dict[str, Any]:
         """
         Create a new SageMaker endpoint or return existing one.
@@ -52,23 +60,29 @@ class InferenceOrchestrator:
             endpoint_name: Unique endpoint name
             instance_type: SageMaker instance type
             instance_count: Number of instances
+            assume_new: Skip the existence check when the caller knows the
+                endpoint name has never been used (e.g. a fresh deployment)
 
         Returns:
             Endpoint details
         """
         try:
-            # Check if endpoint already exists
-            try:
-                existing = self.sagemaker.describe_endpoint(endpoint_name)
-                logger.info(f"Endpoint {endpoint_name} already exists")
-                return {
-                    "endpoint_name": endpoint_name,
-                    "endpoint_arn": existing["EndpointArn"],
-                    "status": existing["EndpointStatus"],
-                }
-            except:
-                # Endpoint doesn't exist, create it
-                pass
+            # Check if endpoint already exists (briefly cached, so repeated
+            # calls for a live endpoint skip the DescribeEndpoint round-trip)
+            if not assume_new:
+                try:
+                    existing = cached_describe_endpoint(endpoint_name, self.sagemaker)
+                    logger.info(f"Endpoint {endpoint_name} already exists")
+                    return {
+                        "endpoint_name": endpoint_name,
+                        "endpoint_arn": existing["EndpointArn"],
+                        "status": existing["EndpointStatus"],
+                    }
+                except ClientError as e:
+                    # SageMaker reports a missing endpoint as a ValidationException;
+                    # anything else (auth, throttling, network) is a real failure
+                    if e.response["Error"]["Code"] != "ValidationException":
+                        raise
 
             # Generate unique model and config names (max 63 chars for SageMaker)
             timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
@@ -87,14 +101,11 @@ class InferenceOrchestrator:
                 "OPTION_MAX_OUTPUT_LEN": "512",
             }
 
-            # Image URI
-            image_uri = self.DEFAULT_LMI_IMAGE.format(region=settings.aws_region)
-
             # Create model
             self.sagemaker.create_model(
                 model_name=model_name,
                 role_arn=settings.sagemaker_execution_role_arn,
-                image_uri=image_uri,
+                image_uri=self.image_uri,
                 environment=environment,
             )
 
@@ -113,6 +124,7 @@ class InferenceOrchestrator:
             )
 
             logger.info(f"Created endpoint: {endpoint_name}")
+            invalidate_endpoint(endpoint_name)
 
             return {
                 "endpoint_name": endpoint_name,
@@ -148,6 +160,18 @@ class InferenceOrchestrator:
             logger.error(f"Failed to get endpoint status: {e}")
             raise
 
+    def list_endpoint_names(self) -> Set[str]:
+        """
+        List the names of all existing endpoints.
+
+        One paginated ListEndpoints scan, for callers that would otherwise
+        describe endpoints one by one to see which still exist.
+
+        Returns:
+            Set of endpoint names
+        """
+        return self.sagemaker.list_endpoint_names()
+
     def invoke_endpoint(
         self,
         endpoint_name: str,
@@ -172,32 +196,35 @@ class InferenceOrchestrator:
                 "parameters": parameters or {},
             }
 
-            # Invoke endpoint
-            start_time = datetime.utcnow()
+            body = orjson.dumps(payload)
+
+            # Invoke endpoint, timed on the monotonic clock so latency cannot
+            # jump with wall-clock adjustments (serialisation is not counted)
+            start_ns = time.perf_counter_ns()
             response_body = self.runtime.invoke_endpoint(
                 endpoint_name=endpoint_name,
-                payload=json.dumps(payload).encode("utf-8"),
+                payload=body,
                 content_type="application/json",
             )
-            end_time = datetime.utcnow()
+            end_ns = time.perf_counter_ns()
 
-            # Parse response
-            result = json.loads(response_body.decode("utf-8"))
+            # Parse response (orjson reads the UTF-8 bytes directly)
+            result = orjson.loads(response_body)
 
-            latency_ms = (end_time - start_time).total_seconds() * 1000
+            latency_ms = (end_ns - start_ns) / 1e6
 
             # Log the raw response for debugging
             logger.info(f"Raw LMI response: {result}")
 
             # Handle different response formats from LMI
-            outputs = result.get("outputs", result.get("predictions", []))
-
             # If result is a list directly, use it
             if isinstance(result, list):
                 outputs = result
             # If result has 'generated_text' key (common in HF format)
-            elif isinstance(result, dict) and "generated_text" in result:
+            elif "generated_text" in result:
                 outputs = [result["generated_text"]]
+            else:
+                outputs = result.get("outputs", result.get("predictions", []))
 
             return {
                 "outputs": outputs,
@@ -213,30 +240,37 @@ class InferenceOrchestrator:
         endpoint_name: str,
         delete_config: bool = True,
         delete_model: bool = True,
+        config_name: Optional[str] = None,
+        model_name: Optional[str] = None,
     ) -> None:
         """
         Delete endpoint and optionally its config and model.
 
+        Callers that recorded the config and model names at creation time
+        should pass them; the Describe calls are only made to look up names
+        that were not supplied.
+
         Args:
             endpoint_name: Endpoint name
             delete_config: Whether to delete endpoint config
             delete_model: Whether to delete model
+            config_name: Endpoint config name, if known
+            model_name: Model name, if known
         """
         try:
-            # Get endpoint details before deletion
-            endpoint = self.sagemaker.describe_endpoint(endpoint_name)
-            config_name = endpoint.get("EndpointConfigName")
+            # Look up the config name only if it is needed and unknown
+            if not config_name and (delete_config or (delete_model and not model_name)):
+                endpoint = self.sagemaker.describe_endpoint(endpoint_name)
+                config_name = endpoint.get("EndpointConfigName")
 
             # Get model name from config if needed
-            model_name = None
-            if delete_model and config_name:
-                config = self.sagemaker.sagemaker.describe_endpoint_config(
-                    EndpointConfigName=config_name
-                )
+            if delete_model and not model_name and config_name:
+                config = self.sagemaker.describe_endpoint_config(config_name)
                 model_name = config["ProductionVariants"][0]["ModelName"]
 
             # Delete endpoint
             self.sagemaker.delete_endpoint(endpoint_name)
+            invalidate_endpoint(endpoint_name)
             logger.info(f"Deleted endpoint: {endpoint_name}")
 
             # Delete config
@@ -254,6 +288,7 @@ class InferenceOrchestrator:
             raise
 
 
+@lru_cache()
 def get_inference_orchestrator() -> InferenceOrchestrator:
-    """Get InferenceOrchestrator instance"""
+    """Get the process-wide InferenceOrchestrator (shares the cached AWS clients)"""
     return InferenceOrchestrator()
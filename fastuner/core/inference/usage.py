@@ -0,0 +1,90 @@
+"""
+Buffered last-used tracking for deployments.
+
+Inference requests record usage in memory; a periodic flush writes the latest
+timestamp per deployment in one bulk UPDATE instead of one UPDATE per request.
+"""
+
+import asyncio
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Dict
+
+from sqlalchemy import bindparam, update
+
+from fastuner.database import AsyncSessionLocal
+from fastuner.models.deployment import Deployment
+
+logger = logging.getLogger(__name__)
+
+# Core executemany UPDATE: ids deleted since they were touched simply match no
+# row, whereas an ORM bulk UPDATE by primary key raises StaleDataError and
+# would fail (and re-queue) the whole batch forever.
+_TOUCH_STMT = (
+    update(Deployment.__table__)
+    .where(Deployment.__table__.c.id == bindparam("b_id"))
+    .values(last_used_at=bindparam("b_last_used_at"))
+)
+
+
+class LastUsedTracker:
+    """Collects per-deployment last-used timestamps between flushes"""
+
+    def __init__(self):
+        self._pending: Dict[str, datetime] = {}
+        self._lock = threading.Lock()
+
+    def touch(self, deployment_id: str) -> None:
+        """Record that a deployment was used now"""
+        with self._lock:
+            self._pending[deployment_id] = datetime.now(timezone.utc)
+
+    def drain(self) -> Dict[str, datetime]:
+        """Return and clear the pending timestamps"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+    async def flush(self) -> int:
+        """
+        Write pending timestamps to the database.
+
+        Ids of deployments deleted since they were touched are ignored.
+
+        Returns:
+            Number of pending timestamps written
+        """
+        pending = self.drain()
+        if not pending:
+            return 0
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    _TOUCH_STMT,
+                    [{"b_id": dep_id, "b_last_used_at": ts} for dep_id, ts in pending.items()],
+                )
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to flush last_used_at for {len(pending)} deployments: {e}")
+            # Put timestamps back unless a newer touch arrived meanwhile
+            with self._lock:
+                for dep_id, ts in pending.items():
+                    self._pending.setdefault(dep_id, ts)
+            return 0
+
+        return len(pending)
+
+    async def run(self, interval_seconds: int) -> None:
+        """Flush every interval_seconds until cancelled, then flush once more"""
+        try:
+            while True:
+                await asyncio.sleep(interval_seconds)
+                await self.flush()
+        except asyncio.CancelledError:
+            await self.flush()
+            raise
+
+
+last_used_tracker = LastUsedTracker()
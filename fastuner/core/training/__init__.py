@@ -1,5 +1,5 @@
 """Training orchestration logic"""
 
-from .orchestrator import TrainingOrchestrator
+from .orchestrator import TrainingOrchestrator, get_training_orchestrator
 
-__all__ = ["TrainingOrchestrator"]
+__all__ = ["TrainingOrchestrator", "get_training_orchestrator"]
@@ -14,15 +14,54 @@ import tarfile
 from pathlib import Path
 from typing import Dict, Any
 from datetime import datetime
+from functools import lru_cache
 
 from fastuner.config import get_settings
 from fastuner.utils.sagemaker import get_sagemaker_client
 from fastuner.utils.s3 import get_s3_client
+from fastuner.utils.aws_clients import get_client
+from fastuner.utils.aws_cache import cached_describe_training_job, invalidate_training_job
 from fastuner.models.fine_tune_job import FineTuneMethod
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Tunable hyperparameters and their defaults when the job doesn't set them
+HYPERPARAMETER_DEFAULTS = {
+    "learning_rate": 0.0002,
+    "num_epochs": 3,
+    "batch_size": 4,
+    "gradient_accumulation_steps": 4,
+    "lora_rank": 16,
+    "lora_alpha": 32,
+    "lora_dropout": 0.05,
+    "lora_target_modules": "q_proj,v_proj",
+}
+
+# Hyperparameters that are the same for every job (already strings)
+STATIC_HYPERPARAMETERS = {
+    "bnb_4bit_compute_dtype": "float16",
+    "bnb_4bit_quant_type": "nf4",
+    "output_dir": "/opt/ml/model",
+}
+
+# (SageMaker channel name, dataset_s3_paths key) for each training input
+INPUT_CHANNELS = (("train", "train"), ("validation", "val"), ("test", "test"))
+
+
+def _make_input_channel(name: str, s3_uri: str) -> Dict[str, Any]:
+    """InputDataConfig entry that downloads everything under an S3 prefix"""
+    return {
+        "ChannelName": name,
+        "DataSource": {
+            "S3DataSource": {
+                "S3DataType": "S3Prefix",
+                "S3Uri": s3_uri,
+                "S3DataDistributionType": "FullyReplicated",
+            }
+        },
+    }
+
 
 class TrainingOrchestrator:
     """Orchestrates SageMaker training jobs for fine-tuning"""
@@ -34,6 +73,8 @@ class TrainingOrchestrator:
         self.sagemaker = get_sagemaker_client()
         self.s3 = get_s3_client()
         self.training_scripts_dir = Path(__file__).parent.parent.parent / "training_scripts"
+        # Region is fixed for the process, so resolve the image URI once
+        self.image_uri = self.DEFAULT_TRAINING_IMAGE.format(region=settings.aws_region)
 
     def _prepare_source_code(self, job_id: str, tenant_id: str) -> str:
         """
@@ -62,8 +103,7 @@ class TrainingOrchestrator:
             s3_key = f"{tenant_id}/source/{job_id}/sourcedir.tar.gz"
             s3_uri = f"s3://{settings.s3_adapters_bucket}/{s3_key}"
 
-            import boto3
-            s3_client = boto3.client("s3")
+            s3_client = get_client("s3")
             s3_client.upload_file(tmp_path, settings.s3_adapters_bucket, s3_key)
 
             logger.info(f"Uploaded training source code to {s3_uri}")
@@ -117,25 +157,15 @@ class TrainingOrchestrator:
             "adapter_name": adapter_name,
             "method": method.value,
 
-            # Training parameters
-            "learning_rate": str(hyperparameters.get("learning_rate", 0.0002)),
-            "num_epochs": str(hyperparameters.get("num_epochs", 3)),
-            "batch_size": str(hyperparameters.get("batch_size", 4)),
-            "gradient_accumulation_steps": str(hyperparameters.get("gradient_accumulation_steps", 4)),
-
-            # LoRA configuration
-            "lora_rank": str(hyperparameters.get("lora_rank", 16)),
-            "lora_alpha": str(hyperparameters.get("lora_alpha", 32)),
-            "lora_dropout": str(hyperparameters.get("lora_dropout", 0.05)),
-            "lora_target_modules": hyperparameters.get("lora_target_modules", "q_proj,v_proj"),
+            # Training and LoRA parameters (caller overrides, else defaults)
+            **{
+                key: str(hyperparameters.get(key, default))
+                for key, default in HYPERPARAMETER_DEFAULTS.items()
+            },
 
             # QLoRA-specific (if method is qlora)
             "use_4bit": "true" if method == FineTuneMethod.QLORA else "false",
-            "bnb_4bit_compute_dtype": "float16",
-            "bnb_4bit_quant_type": "nf4",
-
-            # Output configuration
-            "output_dir": "/opt/ml/model",
+            **STATIC_HYPERPARAMETERS,
 
             # Source code location (for SageMaker to find train.py)
             "sagemaker_submit_directory": source_code_uri,
@@ -144,63 +174,25 @@ class TrainingOrchestrator:
         # Input data configuration
         # SageMaker downloads S3 files to /opt/ml/input/data/{channel_name}/
         # For S3Prefix, it downloads all files from that prefix
-        # For a specific file like s3://bucket/path/train.jsonl, we need to use the parent directory
+        # For a specific file like s3://bucket/path/train.jsonl.gz, we need to use the parent directory
 
         # Get parent directory by removing the filename from the path
-        train_s3_dir = dataset_s3_paths["train"].rsplit("/", 1)[0] + "/"
-        val_s3_dir = dataset_s3_paths["val"].rsplit("/", 1)[0] + "/"
-        test_s3_dir = dataset_s3_paths["test"].rsplit("/", 1)[0] + "/"
-
-        logger.info(f"Train S3 dir: {train_s3_dir}")
-        logger.info(f"Val S3 dir: {val_s3_dir}")
-        logger.info(f"Test S3 dir: {test_s3_dir}")
+        input_data_config = []
+        for name, key in INPUT_CHANNELS:
+            s3_dir = dataset_s3_paths[key].rsplit("/", 1)[0] + "/"
+            logger.info(f"{name.capitalize()} S3 dir: {s3_dir}")
+            input_data_config.append(_make_input_channel(name, s3_dir))
         logger.info(f"Source code S3: {source_code_uri}")
 
-        input_data_config = [
-            {
-                "ChannelName": "train",
-                "DataSource": {
-                    "S3DataSource": {
-                        "S3DataType": "S3Prefix",
-                        "S3Uri": train_s3_dir,
-                        "S3DataDistributionType": "FullyReplicated",
-                    }
-                },
-            },
-            {
-                "ChannelName": "validation",
-                "DataSource": {
-                    "S3DataSource": {
-                        "S3DataType": "S3Prefix",
-                        "S3Uri": val_s3_dir,
-                        "S3DataDistributionType": "FullyReplicated",
-                    }
-                },
-            },
-            {
-                "ChannelName": "test",
-                "DataSource": {
-                    "S3DataSource": {
-                        "S3DataType": "S3Prefix",
-                        "S3Uri": test_s3_dir,
-                        "S3DataDistributionType": "FullyReplicated",
-                    }
-                },
-            },
-        ]
-
         # Output path for model artifacts
         output_path = f"s3://{settings.s3_adapters_bucket}/{tenant_id}/adapters/{job_id}"
 
-        # Training image URI
-        image_uri = self.DEFAULT_TRAINING_IMAGE.format(region=settings.aws_region)
-
         try:
             # Create the training job
             response = self.sagemaker.create_training_job(
                 job_name=job_name,
                 role_arn=settings.sagemaker_execution_role_arn,
-                image_uri=image_uri,
+                image_uri=self.image_uri,
                 input_data_config=input_data_config,
                 output_path=output_path,
                 hyperparameters=training_hyperparameters,
@@ -223,18 +215,22 @@ class TrainingOrchestrator:
             logger.error(f"Failed to create training job: {e}")
             raise
 
-    def get_training_job_status(self, job_name: str) -> Dict[str, Any]:
+    def get_training_job_status(self, job_name: str, use_cache: bool = False) -> Dict[str, Any]:
         """
         Get the status of a training job.
 
         Args:
             job_name: SageMaker job name
+            use_cache: Serve from the short-lived describe cache (for polled read paths)
 
         Returns:
             Job status information
         """
         try:
-            job_details = self.sagemaker.describe_training_job(job_name)
+            if use_cache:
+                job_details = cached_describe_training_job(job_name)
+            else:
+                job_details = self.sagemaker.describe_training_job(job_name)
 
             return {
                 "status": job_details["TrainingJobStatus"],
@@ -260,6 +256,7 @@ class TrainingOrchestrator:
         """
         try:
             self.sagemaker.stop_training_job(job_name)
+            invalidate_training_job(job_name)
             logger.info(f"Stopped training job: {job_name}")
         except Exception as e:
             logger.error(f"Failed to stop training job: {e}")
@@ -292,6 +289,7 @@ class TrainingOrchestrator:
         return adapter_s3_path
 
 
+@lru_cache()
 def get_training_orchestrator() -> TrainingOrchestrator:
-    """Get TrainingOrchestrator instance"""
+    """Get the process-wide TrainingOrchestrator (shares the cached AWS clients)"""
     return TrainingOrchestrator()
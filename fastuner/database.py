@@ -1,9 +1,10 @@
 """Database connection and session management"""
 
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from fastuner.config import get_settings
 from fastuner.models.base import Base
@@ -19,6 +20,20 @@ engine = create_engine(
     echo=not settings.is_production,
 )
 
+# Async engine for FastAPI handlers, so DB round-trips don't block the event
+# loop. The sync engine above stays for the CLI, cleanup jobs and Alembic.
+# aiosqlite uses NullPool, which takes no sizing arguments.
+_async_pool_kwargs = (
+    {} if "sqlite" in settings.database_url else {"pool_size": 20, "max_overflow": 40}
+)
+async_engine = create_async_engine(
+    settings.async_database_url,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    echo=not settings.is_production,
+    **_async_pool_kwargs,
+)
+
 
 # Enable foreign key constraints for SQLite
 # SQLite has foreign keys disabled by default - we need to explicitly enable them
@@ -30,9 +45,17 @@ def set_sqlite_pragma(dbapi_conn, connection_record):
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
 
+
+event.listen(async_engine.sync_engine, "connect", set_sqlite_pragma)
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Objects stay usable after commit without an implicit (async) refresh
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def create_tables():
     """Create all database tables"""
@@ -60,6 +83,20 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for FastAPI to get an async database session.
+
+    Usage in FastAPI route:
+        @app.get("/items")
+        async def read_items(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(Item))
+            ...
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 @contextmanager
 def get_db_context() -> Generator[Session, None, None]:
     """
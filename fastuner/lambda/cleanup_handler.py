@@ -12,7 +12,7 @@ Environment Variables:
 import json
 import logging
 import os
-from fastuner.core.ephemerality import EphemeralityManager
+from fastuner.core.ephemerality import get_ephemerality_manager
 
 # Configure logging
 logger = logging.getLogger()
@@ -37,7 +37,7 @@ def handler(event, context):
         logger.info(f"Starting cleanup cycle (dry_run={dry_run})")
 
         # Run cleanup
-        manager = EphemeralityManager()
+        manager = get_ephemerality_manager()
         summary = manager.run_cleanup_cycle(dry_run=dry_run)
 
         logger.info(f"Cleanup complete: {json.dumps(summary)}")
@@ -1,6 +1,6 @@
 """Adapter model for storing fine-tuned adapter artifacts"""
 
-from sqlalchemy import String, Integer, ForeignKey
+from sqlalchemy import String, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional
 
@@ -11,6 +11,10 @@ class Adapter(Base, TimestampMixin):
     """Adapter model - stores metadata about LoRA/QLoRA adapters"""
 
     __tablename__ = "adapters"
+    __table_args__ = (
+        # Serves the adapter-by-name lookup in run_inference
+        Index("ix_adapters_tenant_name_model", "tenant_id", "name", "base_model_id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     tenant_id: Mapped[str] = mapped_column(
@@ -1,6 +1,6 @@
 """Base model configuration for SQLAlchemy"""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 from sqlalchemy import DateTime, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
@@ -15,8 +15,16 @@ class Base(DeclarativeBase):
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps"""
 
+    # Fetch server-generated timestamps (e.g. updated_at's onupdate) during
+    # the flush itself, so they are never left expired for an implicit lazy
+    # refresh -- which AsyncSession cannot do
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Python-side default so SQLite stores the same format SQLAlchemy binds
+    # for comparisons (keyset cursors); server_default covers raw inserts
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
         nullable=False
     )
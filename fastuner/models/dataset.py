@@ -1,6 +1,6 @@
 """Dataset model for storing dataset metadata"""
 
-from sqlalchemy import String, Integer, JSON, ForeignKey, Enum as SQLEnum
+from sqlalchemy import String, Integer, JSON, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, Dict, Any
 import enum
@@ -19,6 +19,10 @@ class Dataset(Base, TimestampMixin):
     """Dataset model - stores metadata about uploaded datasets"""
 
     __tablename__ = "datasets"
+    __table_args__ = (
+        # Serves tenant-scoped keyset pagination ordered by (created_at, id)
+        Index("ix_datasets_tenant_created", "tenant_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     tenant_id: Mapped[str] = mapped_column(
@@ -1,6 +1,6 @@
 """Deployment model for tracking SageMaker inference endpoints"""
 
-from sqlalchemy import String, Integer, ForeignKey, Enum as SQLEnum, DateTime
+from sqlalchemy import String, Integer, ForeignKey, Index, Enum as SQLEnum, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional
 from datetime import datetime
@@ -23,6 +23,14 @@ class Deployment(Base, TimestampMixin):
     """Deployment model - tracks SageMaker inference endpoints"""
 
     __tablename__ = "deployments"
+    __table_args__ = (
+        # Serves tenant-scoped keyset pagination ordered by (created_at, id)
+        Index("ix_deployments_tenant_created", "tenant_id", "created_at", "id"),
+        # Serves the active-deployment lookup in run_inference
+        Index("ix_deployments_tenant_adapter_status", "tenant_id", "adapter_id", "status"),
+        # Serves the stale-deployment scan in the cleanup cycle
+        Index("ix_deployments_status_last_used", "status", "last_used_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     tenant_id: Mapped[str] = mapped_column(
@@ -35,6 +43,7 @@ class Deployment(Base, TimestampMixin):
     # SageMaker endpoint details
     endpoint_name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     endpoint_config_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    model_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     endpoint_arn: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
 
     # Instance configuration
@@ -1,6 +1,6 @@
 """Fine-tune job model for tracking training jobs"""
 
-from sqlalchemy import String, Integer, JSON, ForeignKey, Enum as SQLEnum, Float, Text
+from sqlalchemy import String, Integer, JSON, ForeignKey, Index, Enum as SQLEnum, Float, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, Dict, Any
 import enum
@@ -27,6 +27,10 @@ class FineTuneJob(Base, TimestampMixin):
     """Fine-tune job model - tracks SageMaker training jobs"""
 
     __tablename__ = "fine_tune_jobs"
+    __table_args__ = (
+        # Serves tenant-scoped status filters (e.g. running/pending jobs to sync)
+        Index("ix_fine_tune_jobs_tenant_status", "tenant_id", "status"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     tenant_id: Mapped[str] = mapped_column(
@@ -10,6 +10,7 @@ This script:
 
 import os
 import sys
+import gzip
 import json
 import logging
 import argparse
@@ -36,14 +37,23 @@ logger = logging.getLogger(__name__)
 
 
 def load_jsonl(file_path: str) -> List[Dict]:
-    """Load JSONL file"""
+    """Load JSONL file (plain or gzipped)"""
     data = []
-    with open(file_path, "r", encoding="utf-8") as f:
+    opener = gzip.open if str(file_path).endswith(".gz") else open
+    with opener(file_path, "rt", encoding="utf-8") as f:
         for line in f:
-            data.append(json.loads(line.strip()))
+            line = line.strip()
+            if line:
+                data.append(json.loads(line))
     return data
 
 
+def find_split_file(channel_dir: str, split: str) -> Path:
+    """Locate a split file in a channel dir, preferring the gzipped upload"""
+    gz_file = Path(channel_dir) / f"{split}.jsonl.gz"
+    return gz_file if gz_file.exists() else Path(channel_dir) / f"{split}.jsonl"
+
+
 def prepare_generation_dataset(
     records: List[Dict],
     tokenizer,
@@ -165,9 +175,9 @@ def main():
     except Exception as e:
         logger.warning(f"Could not list directory contents: {e}")
 
-    train_file = Path(train_dir) / "train.jsonl"
-    val_file = Path(val_dir) / "val.jsonl"
-    test_file = Path(test_dir) / "test.jsonl"
+    train_file = find_split_file(train_dir, "train")
+    val_file = find_split_file(val_dir, "val")
+    test_file = find_split_file(test_dir, "test")
 
     logger.info(f"Train file exists: {train_file.exists()}")
     logger.info(f"Val file exists: {val_file.exists()}")
@@ -0,0 +1,117 @@
+"""Short-lived in-process cache for SageMaker describe calls"""
+
+import logging
+import threading
+from typing import Dict, Any, Callable, Optional
+
+from cachetools import TTLCache, TLRUCache
+
+from fastuner.utils.sagemaker import SageMakerClient, get_sagemaker_client
+
+logger = logging.getLogger(__name__)
+
+# Endpoint status changes on the order of minutes, so a 20s TTL keeps
+# repeated polls (e.g. GET /v0/deployments refreshes) off the SageMaker API
+DESCRIBE_CACHE_TTL_SECONDS = 20
+DESCRIBE_CACHE_MAX_SIZE = 1024
+
+# Training jobs are polled every few seconds by list/get while running, but
+# a terminal status never changes, so those entries can live much longer
+TRAINING_JOB_ACTIVE_TTL_SECONDS = 5
+TRAINING_JOB_TERMINAL_TTL_SECONDS = 3600
+TRAINING_JOB_TERMINAL_STATUSES = {"Completed", "Failed", "Stopped"}
+
+_cache: TTLCache = TTLCache(maxsize=DESCRIBE_CACHE_MAX_SIZE, ttl=DESCRIBE_CACHE_TTL_SECONDS)
+_lock = threading.Lock()
+
+
+def _training_job_ttu(_key: tuple, value: Dict[str, Any], now: float) -> float:
+    """Expiry time for a DescribeTrainingJob result based on its status"""
+    if value.get("TrainingJobStatus") in TRAINING_JOB_TERMINAL_STATUSES:
+        return now + TRAINING_JOB_TERMINAL_TTL_SECONDS
+    return now + TRAINING_JOB_ACTIVE_TTL_SECONDS
+
+
+_training_cache: TLRUCache = TLRUCache(maxsize=DESCRIBE_CACHE_MAX_SIZE, ttu=_training_job_ttu)
+
+
+def _cached(key: tuple, fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Return cached value for key, calling fetch() on a miss"""
+    with _lock:
+        value = _cache.get(key)
+    if value is not None:
+        return value
+
+    # Fetch outside the lock so concurrent misses don't serialize on AWS
+    value = fetch()
+    with _lock:
+        _cache[key] = value
+    return value
+
+
+def cached_describe_endpoint(
+    endpoint_name: str,
+    sagemaker: Optional[SageMakerClient] = None,
+) -> Dict[str, Any]:
+    """
+    DescribeEndpoint, cached for DESCRIBE_CACHE_TTL_SECONDS.
+
+    Failures (e.g. the endpoint does not exist) are not cached.
+
+    Args:
+        endpoint_name: Endpoint name
+        sagemaker: Client to fetch with on a miss (default: the shared one)
+    """
+    return _cached(
+        ("endpoint", endpoint_name),
+        lambda: (sagemaker or get_sagemaker_client()).describe_endpoint(endpoint_name),
+    )
+
+
+def cached_describe_endpoint_config(config_name: str) -> Dict[str, Any]:
+    """DescribeEndpointConfig, cached for DESCRIBE_CACHE_TTL_SECONDS"""
+    return _cached(
+        ("endpoint_config", config_name),
+        lambda: get_sagemaker_client().describe_endpoint_config(config_name),
+    )
+
+
+def cached_describe_model(model_name: str) -> Dict[str, Any]:
+    """DescribeModel, cached for DESCRIBE_CACHE_TTL_SECONDS"""
+    return _cached(
+        ("model", model_name),
+        lambda: get_sagemaker_client().describe_model(model_name),
+    )
+
+
+def cached_describe_training_job(job_name: str) -> Dict[str, Any]:
+    """DescribeTrainingJob, cached for a few seconds while running and an hour once terminal"""
+    key = ("training_job", job_name)
+    with _lock:
+        value = _training_cache.get(key)
+    if value is not None:
+        return value
+
+    value = get_sagemaker_client().describe_training_job(job_name)
+    with _lock:
+        _training_cache[key] = value
+    return value
+
+
+def invalidate_training_job(job_name: str) -> None:
+    """Drop the cached DescribeTrainingJob result after a mutation"""
+    with _lock:
+        _training_cache.pop(("training_job", job_name), None)
+
+
+def invalidate_endpoint(endpoint_name: str) -> None:
+    """Drop the cached DescribeEndpoint result after a mutation"""
+    with _lock:
+        _cache.pop(("endpoint", endpoint_name), None)
+
+
+def clear_cache() -> None:
+    """Drop all cached describe results"""
+    with _lock:
+        _cache.clear()
+        _training_cache.clear()
@@ -0,0 +1,68 @@
+"""Shared boto3 client factory"""
+
+from functools import lru_cache
+from typing import Optional
+
+import boto3
+from botocore.config import Config
+
+from fastuner.config import get_settings
+
+# Large enough pool that concurrent to_thread fan-outs don't queue on
+# botocore's default of 10 connections; keepalive stops idle pooled
+# connections from being silently dropped between bursts
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Inference calls sit on a caller's request path: fail fast after a couple
+# of retries rather than stacking adaptive backoff onto a live request
+RUNTIME_CLIENT_CONFIG = CLIENT_CONFIG.merge(
+    Config(retries={"total_max_attempts": 3, "mode": "standard"})
+)
+
+# Per-service overrides of CLIENT_CONFIG
+SERVICE_CONFIGS = {
+    "sagemaker-runtime": RUNTIME_CLIENT_CONFIG,
+}
+
+
+@lru_cache(maxsize=None)
+def get_client(service: str, region: Optional[str] = None):
+    """
+    Get a cached boto3 client for a service.
+
+    Client construction loads and parses the service model, so clients are
+    built once per (service, region) and shared. boto3 clients are thread-safe.
+    Control-plane clients retry adaptively; sagemaker-runtime gets the
+    smaller RUNTIME_CLIENT_CONFIG retry budget.
+    Reusing a client also keeps botocore's per-client endpoint-resolution
+    LRU warm, which is dropped (it is weakly keyed) when a client is discarded.
+
+    Args:
+        service: AWS service name (e.g. "sagemaker", "s3", "logs")
+        region: AWS region, defaults to settings.aws_region
+
+    Returns:
+        boto3 client
+    """
+    return boto3.client(
+        service,
+        region_name=region or get_settings().aws_region,
+        config=SERVICE_CONFIGS.get(service, CLIENT_CONFIG),
+    )
+
+
+# Services the API server calls on hot paths
+API_SERVICES = ("s3", "sagemaker", "sagemaker-runtime")
+
+
+def warm_clients(services=API_SERVICES) -> None:
+    """
+    Build shared clients up front (e.g. at app startup) so the first requests
+    don't pay for service-model loading and endpoint-ruleset setup.
+    """
+    for service in services:
+        get_client(service)
@@ -0,0 +1,102 @@
+"""CloudWatch Logs utility functions"""
+
+import heapq
+import logging
+from collections import deque
+from typing import List, Dict, Any, Optional
+
+from fastuner.utils.aws_clients import get_client
+
+logger = logging.getLogger(__name__)
+
+# FilterLogEvents returns at most 10,000 events or 1 MB per page
+LOG_EVENTS_PAGE_SIZE = 10000
+
+
+def fetch_log_events(
+    log_group: str,
+    log_stream: str,
+    tail: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch all events from a log stream, oldest first.
+
+    Uses the FilterLogEvents paginator, which follows nextToken until the
+    stream is exhausted (unlike GetLogEvents, whose tokens never run out).
+    Throttled pages are retried with backoff by the shared client's
+    adaptive retry mode.
+
+    Args:
+        log_group: CloudWatch log group name
+        log_stream: Log stream name
+        tail: If set, keep only the last N events
+
+    Returns:
+        List of log events
+    """
+    paginator = get_client("logs").get_paginator("filter_log_events")
+    events = deque(maxlen=tail)
+
+    for page in paginator.paginate(
+        logGroupName=log_group,
+        logStreamNames=[log_stream],
+        PaginationConfig={"PageSize": LOG_EVENTS_PAGE_SIZE},
+    ):
+        # Pages can be empty while the scan is still in progress, so rely on
+        # the paginator for termination rather than breaking on no events
+        events.extend(page.get("events", []))
+
+    logger.debug(f"Fetched {len(events)} events from {log_group}/{log_stream}")
+    return list(events)
+
+
+def fetch_log_events_by_prefix(
+    log_group: str,
+    log_stream_prefix: str,
+    tail: Optional[int] = None,
+    start_time: Optional[int] = None,
+    filter_pattern: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch events from every log stream matching a prefix, oldest first.
+
+    One paginated FilterLogEvents scan replaces listing the streams and then
+    reading one of them, and covers every instance of a multi-node job.
+    Events from different streams can interleave out of order, so they are
+    ordered by timestamp before the tail is taken.
+
+    Args:
+        log_group: CloudWatch log group name
+        log_stream_prefix: Log stream name prefix (e.g. a training job name)
+        tail: If set, keep only the last N events
+        start_time: If set, skip events before this time (epoch milliseconds)
+        filter_pattern: CloudWatch filter pattern, applied server-side so
+            non-matching events are never transferred
+
+    Returns:
+        List of log events
+    """
+    paginator = get_client("logs").get_paginator("filter_log_events")
+
+    params = {
+        "logGroupName": log_group,
+        "logStreamNamePrefix": log_stream_prefix,
+        "PaginationConfig": {"PageSize": LOG_EVENTS_PAGE_SIZE},
+    }
+    if start_time is not None:
+        params["startTime"] = start_time
+    if filter_pattern:
+        params["filterPattern"] = filter_pattern
+
+    pages = paginator.paginate(**params)
+    all_events = (event for page in pages for event in page.get("events", []))
+
+    if tail is None:
+        events = sorted(all_events, key=lambda e: e["timestamp"])
+    else:
+        # Bounded heap keeps memory at O(tail) however long the job ran
+        events = heapq.nlargest(tail, all_events, key=lambda e: e["timestamp"])
+        events.reverse()
+
+    logger.debug(f"Fetched {len(events)} events from {log_group}/{log_stream_prefix}*")
+    return events
@@ -0,0 +1,107 @@
+"""Keyset pagination cursors for list endpoints"""
+
+import base64
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy import DateTime, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class _sortable_timestamp(FunctionElement):
+    """
+    A timestamp column in a form that compares consistently with bound values.
+
+    Plain column everywhere except SQLite, which stores datetimes as text:
+    CURRENT_TIMESTAMP (server default) writes 'YYYY-MM-DD HH:MM:SS' while
+    SQLAlchemy writes and binds 'YYYY-MM-DD HH:MM:SS.ffffff', so rows from
+    the server default compare as less than a cursor from the same second.
+    There the value is padded to the bound format before comparing/sorting.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(_sortable_timestamp)
+def _compile_sortable_timestamp(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(_sortable_timestamp, "sqlite")
+def _compile_sortable_timestamp_sqlite(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    return f"substr({column} || '.000000', 1, 26)"
+
+
+def encode_cursor(created_at: datetime, id: str) -> str:
+    """
+    Encode the (created_at, id) of the last row of a page as an opaque cursor.
+
+    Args:
+        created_at: Creation timestamp of the last row
+        id: ID of the last row
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (created_at, id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), id
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def apply_keyset(query: Any, model: Any, cursor: Optional[str], limit: int) -> Any:
+    """
+    Restrict a query to the page after cursor, newest first.
+
+    Works on both ORM Query and Select objects for models with created_at
+    and id columns.
+
+    Args:
+        query: Query or Select already filtered by tenant
+        model: Model class being listed
+        cursor: Cursor from the previous page, or None for the first page
+        limit: Page size
+
+    Returns:
+        Query ordered by (created_at, id) descending and limited to one page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    created_at_key = _sortable_timestamp(model.created_at)
+    if cursor:
+        created_at, last_id = decode_cursor(cursor)
+        query = query.filter(tuple_(created_at_key, model.id) < (created_at, last_id))
+    return query.order_by(created_at_key.desc(), model.id.desc()).limit(limit)
+
+
+def next_cursor(rows: Sequence[Any], limit: int) -> Optional[str]:
+    """Cursor for the page after rows, or None if this was the last page"""
+    if len(rows) < limit or not rows:
+        return None
+    return encode_cursor(rows[-1].created_at, rows[-1].id)
@@ -1,54 +1,142 @@
 """S3 utility functions for dataset and model storage"""
 
-import boto3
+import asyncio
+import gzip
+import io
 import logging
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, BinaryIO, Iterable
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
-import json
+import orjson
 
 from fastuner.config import get_settings
+from fastuner.utils.aws_clients import get_client
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Bodies above the threshold are sent as parallel multipart uploads
+MULTIPART_THRESHOLD_BYTES = 8 * 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD_BYTES,
+    max_concurrency=10,
+    use_threads=True,
+)
+
 
 class S3Client:
     """Wrapper for S3 operations"""
 
     def __init__(self):
-        self.s3 = boto3.client("s3", region_name=settings.aws_region)
+        self.s3 = get_client("s3")
 
     def upload_jsonl(
         self,
         bucket: str,
         key: str,
-        records: List[Dict[str, Any]],
+        records: Iterable[Dict[str, Any]],
+        compress: bool = False,
     ) -> str:
         """
         Upload JSONL records to S3.
 
+        Args:
+            bucket: S3 bucket name
+            key: S3 object key (use a .jsonl.gz key when compressing)
+            records: Dict records to write as JSONL (any iterable, consumed once)
+            compress: Gzip the body and store it with ContentEncoding=gzip
+
+        Returns:
+            S3 URI (s3://bucket/key)
+        """
+        try:
+            # Convert records to JSONL (each record is encoded exactly once).
+            # records may be a one-shot iterator, so count while serializing
+            lines = [orjson.dumps(record) for record in records]
+            record_count = len(lines)
+            jsonl_content = b"\n".join(lines)
+            del lines
+
+            extra_args = {"ContentType": "application/x-ndjson"}
+            if compress:
+                # Text JSONL typically shrinks 5-10x; level 6 is zlib's default trade-off
+                jsonl_content = gzip.compress(jsonl_content, compresslevel=6)
+                extra_args["ContentEncoding"] = "gzip"
+
+            # Upload to S3, switching to multipart for large bodies
+            if len(jsonl_content) > MULTIPART_THRESHOLD_BYTES:
+                self.s3.upload_fileobj(
+                    io.BytesIO(jsonl_content),
+                    bucket,
+                    key,
+                    ExtraArgs=extra_args,
+                    Config=TRANSFER_CONFIG,
+                )
+            else:
+                self.s3.put_object(
+                    Bucket=bucket,
+                    Key=key,
+                    Body=jsonl_content,
+                    **extra_args,
+                )
+
+            s3_uri = f"s3://{bucket}/{key}"
+            logger.info(f"Uploaded {record_count} records to {s3_uri}")
+            return s3_uri
+
+        except ClientError as e:
+            logger.error(f"S3 upload failed: {e}")
+            raise
+
+    async def upload_jsonl_async(
+        self,
+        bucket: str,
+        key: str,
+        records: Iterable[Dict[str, Any]],
+        compress: bool = False,
+    ) -> str:
+        """
+        Upload JSONL records to S3 without blocking the event loop.
+
+        The blocking boto3 call runs in a worker thread, so several uploads
+        can be awaited concurrently with asyncio.gather().
+
+        Returns:
+            S3 URI (s3://bucket/key)
+        """
+        return await asyncio.to_thread(self.upload_jsonl, bucket, key, records, compress)
+
+    def upload_fileobj(
+        self,
+        bucket: str,
+        key: str,
+        fileobj: BinaryIO,
+        content_type: str = "application/x-ndjson",
+    ) -> str:
+        """
+        Stream a binary file object to S3 (multipart for large files).
+
         Args:
             bucket: S3 bucket name
             key: S3 object key
-            records: List of dict records to write as JSONL
+            fileobj: Readable binary file object, positioned at the start
+            content_type: Content type stored with the object
 
         Returns:
             S3 URI (s3://bucket/key)
         """
         try:
-            # Convert records to JSONL
-            jsonl_content = "\n".join(json.dumps(record) for record in records)
-
-            # Upload to S3
-            self.s3.put_object(
-                Bucket=bucket,
-                Key=key,
-                Body=jsonl_content.encode("utf-8"),
-                ContentType="application/x-ndjson",
+            self.s3.upload_fileobj(
+                fileobj,
+                bucket,
+                key,
+                ExtraArgs={"ContentType": content_type},
+                Config=TRANSFER_CONFIG,
             )
 
             s3_uri = f"s3://{bucket}/{key}"
-            logger.info(f"Uploaded {len(records)} records to {s3_uri}")
+            logger.info(f"Uploaded file to {s3_uri}")
             return s3_uri
 
         except ClientError as e:
@@ -57,7 +145,7 @@ class S3Client:
 
     def download_jsonl(self, bucket: str, key: str) -> List[Dict[str, Any]]:
         """
-        Download JSONL file from S3.
+        Download JSONL file from S3 (gzipped objects are decompressed).
 
         Args:
             bucket: S3 bucket name
@@ -68,13 +156,15 @@ class S3Client:
         """
         try:
             response = self.s3.get_object(Bucket=bucket, Key=key)
-            content = response["Body"].read().decode("utf-8")
+            content = response["Body"].read()
+            if key.endswith(".gz") or response.get("ContentEncoding") == "gzip":
+                content = gzip.decompress(content)
 
             # Parse JSONL
             records = []
-            for line in content.strip().split("\n"):
+            for line in content.strip().split(b"\n"):
                 if line:
-                    records.append(json.loads(line))
+                    records.append(orjson.loads(line))
 
             logger.info(f"Downloaded {len(records)} records from s3://{bucket}/{key}")
             return records
@@ -95,25 +185,22 @@ class S3Client:
     def delete_prefix(self, bucket: str, prefix: str) -> None:
         """Delete all objects with a given prefix"""
         try:
-            # List objects
+            # List pages hold at most 1000 keys, matching the DeleteObjects
+            # limit, so each page is deleted as it arrives
             paginator = self.s3.get_paginator("list_objects_v2")
             pages = paginator.paginate(Bucket=bucket, Prefix=prefix)
 
-            delete_keys = []
+            deleted = 0
             for page in pages:
-                if "Contents" in page:
-                    for obj in page["Contents"]:
-                        delete_keys.append({"Key": obj["Key"]})
-
-            # Delete in batches of 1000 (S3 limit)
-            if delete_keys:
-                for i in range(0, len(delete_keys), 1000):
-                    batch = delete_keys[i : i + 1000]
+                keys = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+                for i in range(0, len(keys), 1000):
                     self.s3.delete_objects(
-                        Bucket=bucket, Delete={"Objects": batch}
+                        Bucket=bucket, Delete={"Objects": keys[i : i + 1000], "Quiet": True}
                     )
+                deleted += len(keys)
 
-                logger.info(f"Deleted {len(delete_keys)} objects with prefix s3://{bucket}/{prefix}")
+            if deleted:
+                logger.info(f"Deleted {deleted} objects with prefix s3://{bucket}/{prefix}")
 
         except ClientError as e:
             logger.error(f"S3 delete prefix failed: {e}")
@@ -128,6 +215,7 @@ class S3Client:
             return False
 
 
+@lru_cache()
 def get_s3_client() -> S3Client:
-    """Get S3 client instance"""
+    """Get cached S3 client instance (boto3 clients are thread-safe)"""
     return S3Client()
@@ -1,21 +1,20 @@
 """SageMaker utility functions for training and inference"""
 
-import boto3
 import logging
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Set
 from botocore.exceptions import ClientError
 
-from fastuner.config import get_settings
+from fastuner.utils.aws_clients import get_client
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 
 class SageMakerClient:
     """Wrapper for SageMaker operations"""
 
     def __init__(self):
-        self.sagemaker = boto3.client("sagemaker", region_name=settings.aws_region)
+        self.sagemaker = get_client("sagemaker")
 
     def create_training_job(
         self,
@@ -179,6 +178,15 @@ class SageMakerClient:
             logger.error(f"Failed to create endpoint config: {e}")
             raise
 
+    def describe_endpoint_config(self, config_name: str) -> Dict[str, Any]:
+        """Get endpoint configuration details"""
+        try:
+            response = self.sagemaker.describe_endpoint_config(EndpointConfigName=config_name)
+            return response
+        except ClientError as e:
+            logger.error(f"Failed to describe endpoint config {config_name}: {e}")
+            raise
+
     def create_endpoint(
         self,
         endpoint_name: str,
@@ -207,6 +215,19 @@ class SageMakerClient:
             logger.error(f"Failed to describe endpoint {endpoint_name}: {e}")
             raise
 
+    def list_endpoint_names(self) -> Set[str]:
+        """Names of all endpoints in the account/region (one paginated scan)"""
+        try:
+            paginator = self.sagemaker.get_paginator("list_endpoints")
+            return {
+                endpoint["EndpointName"]
+                for page in paginator.paginate(PaginationConfig={"PageSize": 100})
+                for endpoint in page["Endpoints"]
+            }
+        except ClientError as e:
+            logger.error(f"Failed to list endpoints: {e}")
+            raise
+
     def delete_endpoint(self, endpoint_name: str) -> None:
         """Delete an endpoint"""
         try:
@@ -225,6 +246,15 @@ class SageMakerClient:
             logger.error(f"Failed to delete endpoint config {config_name}: {e}")
             raise
 
+    def describe_model(self, model_name: str) -> Dict[str, Any]:
+        """Get model details"""
+        try:
+            response = self.sagemaker.describe_model(ModelName=model_name)
+            return response
+        except ClientError as e:
+            logger.error(f"Failed to describe model {model_name}: {e}")
+            raise
+
     def delete_model(self, model_name: str) -> None:
         """Delete a model"""
         try:
@@ -239,7 +269,7 @@ class SageMakerRuntimeClient:
     """Wrapper for SageMaker Runtime (inference) operations"""
 
     def __init__(self):
-        self.runtime = boto3.client("sagemaker-runtime", region_name=settings.aws_region)
+        self.runtime = get_client("sagemaker-runtime")
 
     def invoke_endpoint(
         self,
@@ -272,11 +302,13 @@ class SageMakerRuntimeClient:
             raise
 
 
+@lru_cache()
 def get_sagemaker_client() -> SageMakerClient:
-    """Get SageMaker client instance"""
+    """Get cached SageMaker client instance"""
     return SageMakerClient()
 
 
+@lru_cache()
 def get_sagemaker_runtime_client() -> SageMakerRuntimeClient:
-    """Get SageMaker Runtime client instance"""
+    """Get cached SageMaker Runtime client instance"""
     return SageMakerRuntimeClient()
@@ -0,0 +1,129 @@
+"""Tests for the TTL cleanup cycle against an in-memory database"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from fastuner.models.base import Base
+from fastuner.models.deployment import Deployment, DeploymentStatus
+
+
+@pytest.fixture
+def session_factory():
+    """Sessionmaker bound to a fresh in-memory SQLite database"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def manager(session_factory):
+    """EphemeralityManager with a mocked orchestrator, using session_factory"""
+    from fastuner.core.ephemerality import EphemeralityManager
+
+    with patch("fastuner.core.ephemerality.manager.InferenceOrchestrator"), \
+            patch("fastuner.core.ephemerality.manager.SessionLocal", session_factory):
+        yield EphemeralityManager()
+
+
+def _add_deployment(db, deployment_id, status, last_used_at, ttl_seconds=3600):
+    db.add(
+        Deployment(
+            id=deployment_id,
+            tenant_id="tenant_abc",
+            adapter_id="adp_1",
+            endpoint_name=f"ep-{deployment_id}",
+            instance_type="ml.g5.xlarge",
+            instance_count=1,
+            status=status,
+            last_used_at=last_used_at,
+            ttl_seconds=ttl_seconds,
+        )
+    )
+
+
+def _statuses(session_factory):
+    with session_factory() as db:
+        return {d.id: d.status for d in db.query(Deployment)}
+
+
+class TestStaleDeployments:
+    """Tests for TTL checks on timezone-aware last_used_at values"""
+
+    def test_aware_last_used_at(self, manager, session_factory):
+        """Test stale detection, status summary and cost report with aware timestamps"""
+        now = datetime.now(timezone.utc)
+        with session_factory() as db:
+            _add_deployment(db, "dep_stale", DeploymentStatus.ACTIVE, now - timedelta(hours=2))
+            _add_deployment(db, "dep_fresh", DeploymentStatus.ACTIVE, now - timedelta(minutes=10))
+            db.commit()
+
+        # SQLite hands last_used_at back naive; it must be read as UTC
+        with session_factory() as db:
+            assert [d.id for d in manager.find_stale_deployments(db)] == ["dep_stale"]
+            assert manager.get_status_summary(db)["stale_count"] == 1
+
+            report = manager.get_cost_report(db)
+            since_use = {d["deployment_id"]: d["time_since_use_seconds"] for d in report["deployments"]}
+            assert since_use["dep_stale"] == pytest.approx(7200, abs=60)
+            assert since_use["dep_fresh"] == pytest.approx(600, abs=60)
+
+    def test_aware_rows_from_other_dialects(self, manager):
+        """Test the Python TTL re-check accepts aware last_used_at (as PostgreSQL returns it)"""
+        now = datetime.now(timezone.utc)
+        stale = Mock(spec=Deployment, id="dep_stale", status=DeploymentStatus.ACTIVE)
+        stale.last_used_at = now - timedelta(hours=2)
+        stale.ttl_seconds = 3600
+        fresh = Mock(spec=Deployment, id="dep_fresh", status=DeploymentStatus.ACTIVE)
+        fresh.last_used_at = now - timedelta(minutes=10)
+        fresh.ttl_seconds = 3600
+
+        db = Mock()
+        db.query.return_value.filter.return_value.yield_per.return_value = [stale, fresh]
+
+        assert [d.id for d in manager.find_stale_deployments(db)] == ["dep_stale"]
+
+
+class TestCleanupCycle:
+    """Tests for EphemeralityManager.run_cleanup_cycle"""
+
+    def test_deleting_deployments_are_retried(self, manager, session_factory):
+        """Test DELETING rows are torn down regardless of TTL, and stay DELETING on failure"""
+        recent = datetime.now(timezone.utc)
+        with session_factory() as db:
+            _add_deployment(db, "dep_ok", DeploymentStatus.DELETING, recent)
+            _add_deployment(db, "dep_err", DeploymentStatus.DELETING, recent)
+            _add_deployment(db, "dep_live", DeploymentStatus.ACTIVE, recent)
+            db.commit()
+
+        orchestrator = manager.inference_orchestrator
+        orchestrator.list_endpoint_names.return_value = {"ep-dep_ok", "ep-dep_err", "ep-dep_live"}
+
+        def delete_endpoint(endpoint_name, **kwargs):
+            if endpoint_name == "ep-dep_err":
+                raise RuntimeError("throttled")
+
+        orchestrator.delete_endpoint.side_effect = delete_endpoint
+
+        summary = manager.run_cleanup_cycle()
+
+        assert summary["stale_count"] == 2
+        assert _statuses(session_factory) == {
+            "dep_ok": DeploymentStatus.DELETED,
+            "dep_err": DeploymentStatus.DELETING,
+            "dep_live": DeploymentStatus.ACTIVE,
+        }
+
+        # The failed teardown is picked up again next cycle
+        orchestrator.delete_endpoint.side_effect = None
+        manager.run_cleanup_cycle()
+        assert _statuses(session_factory)["dep_err"] == DeploymentStatus.DELETED
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
+from botocore.exceptions import ClientError
 from fastuner.core.training import TrainingOrchestrator
 from fastuner.core.inference import InferenceOrchestrator
 from fastuner.models.fine_tune_job import FineTuneMethod
@@ -104,7 +105,10 @@ class TestInferenceOrchestrator:
         """Test creating a SageMaker endpoint"""
         # Mock SageMaker client
         mock_client = Mock()
-        mock_client.describe_endpoint.side_effect = Exception("Endpoint doesn't exist")
+        mock_client.describe_endpoint.side_effect = ClientError(
+            {"Error": {"Code": "ValidationException", "Message": "Could not find endpoint"}},
+            "DescribeEndpoint",
+        )
         mock_client.create_model.return_value = {}
         mock_client.create_endpoint_config.return_value = {}
         mock_client.create_endpoint.return_value = {
@@ -133,6 +137,28 @@ class TestInferenceOrchestrator:
         mock_client.create_endpoint_config.assert_called_once()
         mock_client.create_endpoint.assert_called_once()
 
+    @patch("fastuner.core.inference.orchestrator.get_sagemaker_client")
+    def test_create_endpoint_describe_error_propagates(self, mock_sagemaker_client):
+        """Test that non-"not found" describe errors are not treated as a missing endpoint"""
+        mock_client = Mock()
+        mock_client.describe_endpoint.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException", "Message": "Not authorized"}},
+            "DescribeEndpoint",
+        )
+        mock_sagemaker_client.return_value = mock_client
+
+        orchestrator = InferenceOrchestrator()
+
+        with pytest.raises(ClientError):
+            orchestrator.create_or_get_endpoint(
+                tenant_id="tenant_abc",
+                base_model_id="meta-llama/Llama-2-7b-hf",
+                adapter_s3_path="s3://bucket/adapter",
+                endpoint_name="test-endpoint-denied",
+            )
+
+        mock_client.create_model.assert_not_called()
+
     @patch("fastuner.core.inference.orchestrator.get_sagemaker_client")
     def test_get_existing_endpoint(self, mock_sagemaker_client):
         """Test getting an existing endpoint"""
@@ -197,7 +223,7 @@ class TestInferenceOrchestrator:
         mock_client.describe_endpoint.return_value = {
             "EndpointConfigName": "test-config"
         }
-        mock_client.sagemaker.describe_endpoint_config.return_value = {
+        mock_client.describe_endpoint_config.return_value = {
             "ProductionVariants": [{"ModelName": "test-model"}]
         }
         mock_client.delete_endpoint.return_value = {}
@@ -219,6 +245,26 @@ class TestInferenceOrchestrator:
         mock_client.delete_endpoint_config.assert_called_once_with("test-config")
         mock_client.delete_model.assert_called_once_with("test-model")
 
+    @patch("fastuner.core.inference.orchestrator.get_sagemaker_client")
+    def test_delete_endpoint_with_known_names(self, mock_sagemaker_client):
+        """Test that known config and model names skip the describe calls"""
+        mock_client = Mock()
+        mock_sagemaker_client.return_value = mock_client
+
+        orchestrator = InferenceOrchestrator()
+
+        orchestrator.delete_endpoint(
+            endpoint_name="test-endpoint",
+            config_name="test-config",
+            model_name="test-model",
+        )
+
+        mock_client.describe_endpoint.assert_not_called()
+        mock_client.describe_endpoint_config.assert_not_called()
+        mock_client.delete_endpoint.assert_called_once_with("test-endpoint")
+        mock_client.delete_endpoint_config.assert_called_once_with("test-config")
+        mock_client.delete_model.assert_called_once_with("test-model")
+
 
 class TestEphemeralityManager:
     """Integration tests for ephemerality management"""
@@ -249,7 +295,7 @@ class TestEphemeralityManager:
         active_deployment.last_used_at = now - timedelta(minutes=30)  # 30 mins ago
         active_deployment.ttl_seconds = 3600  # 1 hour TTL
 
-        mock_db.query.return_value.filter.return_value.all.return_value = [
+        mock_db.query.return_value.filter.return_value.yield_per.return_value = [
             stale_deployment,
             active_deployment,
         ]
@@ -306,6 +352,27 @@ class TestEphemeralityManager:
         assert len(report["deployments"]) == 2
 
 
+
+class TestAPIRoutes:
+    """Sanity checks for the assembled API app"""
+
+    def test_no_duplicate_routes(self):
+        """Test each (method, path) is registered exactly once"""
+        from fastuner.api.main import app
+
+        seen = set()
+        for route in app.routes:
+            for method in getattr(route, "methods", None) or ():
+                key = (method, route.path)
+                assert key not in seen, f"Duplicate route: {method} {route.path}"
+                seen.add(key)
+
+        assert ("POST", "/v0/datasets/") in seen
+        assert ("POST", "/v0/deployments/") in seen
+        assert ("POST", "/v0/fine-tune-jobs/") in seen
+        assert ("POST", "/v0/inference/") in seen
+
+
 # Pytest configuration
 @pytest.fixture(autouse=True)
 def reset_mocks():
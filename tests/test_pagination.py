@@ -0,0 +1,94 @@
+"""Tests for keyset pagination cursors on SQLite"""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session
+
+import fastuner.models  # noqa: F401  (registers all tables on Base.metadata)
+from fastuner.models.base import Base
+from fastuner.models.dataset import Dataset, TaskType
+from fastuner.utils.pagination import apply_keyset, decode_cursor, encode_cursor, next_cursor
+
+
+def _dataset_row(i):
+    return {
+        "id": f"ds_{i:03d}",
+        "tenant_id": "tenant_abc",
+        "name": f"ds {i}",
+        "task_type": TaskType.TEXT_GENERATION,
+        "schema_version": "v0_text",
+        "raw_s3_path": "s3://b/raw",
+        "train_s3_path": "s3://b/train",
+        "val_s3_path": "s3://b/val",
+        "test_s3_path": "s3://b/test",
+        "total_samples": 100,
+        "train_samples": 80,
+        "val_samples": 10,
+        "test_samples": 10,
+        "split_seed": 1,
+        "split_ratios": {"train": 0.8, "val": 0.1, "test": 0.1},
+    }
+
+
+def _page_all(db, limit):
+    """Follow cursors until the last page, returning ids in page order"""
+    ids, cursor = [], None
+    for _ in range(100):
+        query = apply_keyset(select(Dataset), Dataset, cursor, limit)
+        rows = db.execute(query).scalars().all()
+        ids.extend(row.id for row in rows)
+        cursor = next_cursor(rows, limit)
+        if cursor is None:
+            return ids
+    raise AssertionError("pagination did not terminate")
+
+
+class TestKeysetPagination:
+    """Keyset pagination over rows sharing a timestamp"""
+
+    @pytest.fixture
+    def db(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            yield session
+        engine.dispose()
+
+    def test_cursor_round_trip(self):
+        """Test decode_cursor inverts encode_cursor"""
+        created_at = datetime(2026, 10, 15, 22, 30, 48, 123456)
+        assert decode_cursor(encode_cursor(created_at, "ds_001")) == (created_at, "ds_001")
+
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+    def test_same_second_rows_via_orm(self, db):
+        """Test paging rows inserted through the ORM with one shared timestamp"""
+        created_at = datetime(2026, 10, 15, 22, 30, 48, tzinfo=timezone.utc)
+        for i in range(7):
+            db.add(Dataset(**_dataset_row(i), created_at=created_at))
+        db.commit()
+
+        ids = _page_all(db, limit=3)
+
+        assert len(ids) == len(set(ids)) == 7
+        assert ids == sorted(ids, reverse=True)
+
+    def test_same_second_rows_with_server_default(self, db):
+        """Test paging rows stamped by the server default ('YYYY-MM-DD HH:MM:SS')"""
+        for i in range(7):
+            db.add(Dataset(**_dataset_row(i)))
+        db.commit()
+
+        # Rows written before created_at had a Python-side default hold
+        # SQLite's CURRENT_TIMESTAMP text, without fractional seconds
+        db.execute(text("UPDATE datasets SET created_at = '2026-10-15 22:30:48'"))
+        db.commit()
+        db.expire_all()
+
+        ids = _page_all(db, limit=3)
+
+        assert len(ids) == len(set(ids)) == 7
+        assert ids == sorted(ids, reverse=True)
@@ -0,0 +1,89 @@
+"""Tests for list-response serialization"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import orjson
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from fastuner.api.responses import orm_list_response
+from fastuner.models.deployment import DeploymentStatus
+from fastuner.schemas.deployment import DeploymentResponse
+
+
+def _deployment_fields(**overrides):
+    fields = dict(
+        id="dep_1",
+        tenant_id="tenant_abc",
+        adapter_id="adp_1",
+        endpoint_name="ep-1",
+        endpoint_config_name=None,
+        endpoint_arn=None,
+        instance_type="ml.g5.xlarge",
+        instance_count=1,
+        status=DeploymentStatus.ACTIVE,
+        ttl_seconds=3600,
+        last_used_at=datetime(2026, 10, 15, 22, 30, 48, 123456, tzinfo=timezone.utc),
+    )
+    fields.update(overrides)
+    return fields
+
+
+class TestOrmListResponse:
+    """Tests for orm_list_response"""
+
+    def test_matches_pydantic_serialization(self):
+        """Test each item is exactly what the response model would emit"""
+        stamp = datetime(2026, 10, 15, 22, 30, 48, tzinfo=timezone.utc)
+        row = SimpleNamespace(**_deployment_fields(), created_at=stamp, updated_at=stamp)
+
+        response = orm_list_response(DeploymentResponse, [row])
+
+        expected = DeploymentResponse.model_validate(row).model_dump(mode="json")
+        assert orjson.loads(response.body) == [expected]
+        assert expected["last_used_at"] == "2026-10-15T22:30:48.123456Z"
+
+    def test_list_and_get_payloads_match(self):
+        """Test GET /v0/deployments/ items equal GET /v0/deployments/{id}"""
+        from fastapi.testclient import TestClient
+
+        from fastuner.api.main import app
+        from fastuner.database import get_async_db
+        from fastuner.models.base import Base
+        from fastuner.models.deployment import Deployment
+
+        engine = create_async_engine(
+            "sqlite+aiosqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        async def setup():
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            async with session_factory() as db:
+                db.add(Deployment(**_deployment_fields()))
+                await db.commit()
+
+        asyncio.run(setup())
+
+        async def override_db():
+            async with session_factory() as session:
+                yield session
+
+        app.dependency_overrides[get_async_db] = override_db
+        try:
+            client = TestClient(app)
+            params = {"tenant_id": "tenant_abc"}
+            listed = client.get("/v0/deployments/", params=params)
+            single = client.get("/v0/deployments/dep_1", params=params)
+        finally:
+            app.dependency_overrides.pop(get_async_db, None)
+            asyncio.run(engine.dispose())
+
+        assert listed.status_code == 200, listed.text
+        assert single.status_code == 200, single.text
+        assert listed.json() == [single.json()]
@@ -0,0 +1,135 @@
+"""Tests for S3 JSONL uploads and dataset upload fan-out with a stubbed S3 client"""
+
+import asyncio
+import gzip
+import io
+from unittest.mock import Mock, patch
+
+import orjson
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from fastuner.utils.s3 import S3Client
+
+
+class StubS3:
+    """Minimal in-memory stand-in for the boto3 S3 client"""
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body, **extra):
+        self.objects[(Bucket, Key)] = (Body, extra)
+        return {}
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None):
+        self.objects[(bucket, key)] = (fileobj.read(), ExtraArgs or {})
+
+    def get_object(self, Bucket, Key):
+        body, extra = self.objects[(Bucket, Key)]
+        response = {"Body": io.BytesIO(body)}
+        if "ContentEncoding" in extra:
+            response["ContentEncoding"] = extra["ContentEncoding"]
+        return response
+
+
+@pytest.fixture
+def s3_client():
+    """S3Client backed by StubS3"""
+    with patch("fastuner.utils.s3.get_client", return_value=StubS3()):
+        yield S3Client()
+
+
+def _records(n):
+    return [{"input_text": f"Input {i}", "target_text": f"Output {i}"} for i in range(n)]
+
+
+class TestS3Client:
+    """Tests for S3Client JSONL helpers"""
+
+    def test_upload_jsonl_generator(self, s3_client):
+        """Test uploading from a one-shot generator writes every record"""
+        records = _records(5)
+
+        uri = s3_client.upload_jsonl("bucket", "data.jsonl", (r for r in records))
+
+        assert uri == "s3://bucket/data.jsonl"
+        body, extra = s3_client.s3.objects[("bucket", "data.jsonl")]
+        assert [orjson.loads(line) for line in body.split(b"\n")] == records
+        assert "ContentEncoding" not in extra
+
+    def test_upload_jsonl_gzip_round_trip(self, s3_client):
+        """Test compressed uploads are gzip on the wire and read back by download_jsonl"""
+        records = _records(50)
+
+        s3_client.upload_jsonl("bucket", "data.jsonl.gz", iter(records), compress=True)
+
+        body, extra = s3_client.s3.objects[("bucket", "data.jsonl.gz")]
+        assert extra["ContentEncoding"] == "gzip"
+        assert gzip.decompress(body).count(b"\n") == len(records) - 1
+        assert s3_client.download_jsonl("bucket", "data.jsonl.gz") == records
+
+
+class TestCreateDataset:
+    """Tests for POST /v0/datasets/ against a stubbed S3 client"""
+
+    def test_create_dataset_uploads_splits(self, s3_client):
+        """Test the upload fan-out writes raw + three gzipped splits covering every record"""
+        from fastapi.testclient import TestClient
+
+        from fastuner.api.main import app
+        from fastuner.database import get_async_db
+        from fastuner.models.base import Base
+
+        engine = create_async_engine(
+            "sqlite+aiosqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+        async def create_schema():
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+        asyncio.run(create_schema())
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        async def override_db():
+            async with session_factory() as session:
+                yield session
+
+        records = _records(120)
+        payload = b"\n".join(orjson.dumps(r) for r in records)
+
+        app.dependency_overrides[get_async_db] = override_db
+        try:
+            with patch("fastuner.api.v0.datasets.get_s3_client", return_value=s3_client):
+                response = TestClient(app).post(
+                    "/v0/datasets/",
+                    files={"file": ("data.jsonl", payload, "application/x-ndjson")},
+                    data={"name": "ds", "task_type": "text_generation", "tenant_id": "tenant_abc"},
+                )
+        finally:
+            app.dependency_overrides.pop(get_async_db, None)
+            asyncio.run(engine.dispose())
+
+        assert response.status_code == 201, response.text
+        dataset = response.json()
+        assert dataset["total_samples"] == 120
+        assert (
+            dataset["train_samples"] + dataset["val_samples"] + dataset["test_samples"] == 120
+        )
+
+        bucket, prefix = dataset["train_s3_path"][len("s3://"):].split("/", 1)
+        prefix = prefix.rsplit("/", 1)[0]
+        uploaded = []
+        for split in ("train", "val", "test"):
+            split_records = s3_client.download_jsonl(bucket, f"{prefix}/{split}.jsonl.gz")
+            assert len(split_records) == dataset[f"{split}_samples"]
+            uploaded.extend(split_records)
+
+        assert sorted(uploaded, key=lambda r: r["input_text"]) == sorted(
+            records, key=lambda r: r["input_text"]
+        )
+        assert s3_client.s3.objects[(bucket, f"{prefix}/raw.jsonl")][0] == payload
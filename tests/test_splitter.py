@@ -1,7 +1,7 @@
 """Unit tests for DatasetSplitter"""
 
 import pytest
-from fastuner.core.dataset.splitter import DatasetSplitter, SplitValidationError
+from fastuner.core.dataset.splitter import DatasetSplitter, SplitValidationError, iter_split
 from fastuner.models.dataset import TaskType
 
 
@@ -179,6 +179,66 @@ class TestDatasetSplitter:
         # Should work like random split
         assert len(splits["train"]) == pytest.approx(120 * 0.8, abs=2)
 
+    def test_split_indices_partition(self):
+        """Test index splits are disjoint and together cover every record"""
+        splits = DatasetSplitter.split_indices(120, seed=42)
+
+        train, val, test = (set(splits[name].tolist()) for name in ("train", "val", "test"))
+
+        assert not train & val
+        assert not train & test
+        assert not val & test
+        assert train | val | test == set(range(120))
+        assert len(splits["train"]) == pytest.approx(120 * 0.8, abs=2)
+
+    def test_split_indices_deterministic(self):
+        """Test the same seed gives the same index splits"""
+        splits1 = DatasetSplitter.split_indices(120, seed=7)
+        splits2 = DatasetSplitter.split_indices(120, seed=7)
+        splits3 = DatasetSplitter.split_indices(120, seed=8)
+
+        for name in ("train", "val", "test"):
+            assert splits1[name].tolist() == splits2[name].tolist()
+        assert splits1["train"].tolist() != splits3["train"].tolist()
+
+    def test_iter_split_matches_split(self, generation_records):
+        """Test iter_split yields the records split() returns for the same seed"""
+        indices = DatasetSplitter.split_indices(len(generation_records), seed=42)
+        splits = DatasetSplitter.split(
+            records=generation_records,
+            task_type=TaskType.TEXT_GENERATION,
+            seed=42,
+        )
+
+        for name in ("train", "val", "test"):
+            gathered = list(iter_split(generation_records, indices[name]))
+            assert gathered == splits[name]
+            assert gathered == [generation_records[i] for i in indices[name]]
+
+    def test_split_matches_original_shuffle(self, generation_records):
+        """Test splits for a seed match the original random.seed + random.shuffle split"""
+        import random
+
+        state = random.getstate()
+        try:
+            random.seed(42)
+            shuffled = generation_records.copy()
+            random.shuffle(shuffled)
+        finally:
+            random.setstate(state)
+
+        splits = DatasetSplitter.split(
+            records=generation_records,
+            task_type=TaskType.TEXT_GENERATION,
+            seed=42,
+        )
+
+        train_end = len(splits["train"])
+        val_end = train_end + len(splits["val"])
+        assert splits["train"] == shuffled[:train_end]
+        assert splits["val"] == shuffled[train_end:val_end]
+        assert splits["test"] == shuffled[val_end:]
+
     @pytest.mark.skip(reason="Ratio validation not implemented in V0")
     def test_invalid_ratios_sum(self, generation_records):
         """Test validation fails with invalid ratio sum"""
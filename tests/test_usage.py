@@ -0,0 +1,65 @@
+"""Tests for buffered last-used tracking"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from fastuner.core.inference.usage import LastUsedTracker
+from fastuner.models.base import Base
+from fastuner.models.deployment import Deployment, DeploymentStatus
+
+
+class TestLastUsedTracker:
+    """Tests for LastUsedTracker.flush against an in-memory database"""
+
+    def test_flush_ignores_deleted_deployments(self):
+        """Test a touched-then-deleted id neither fails the batch nor is re-queued"""
+        engine = create_async_engine(
+            "sqlite+aiosqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        stale = datetime(2026, 1, 1)
+
+        async def scenario():
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            async with session_factory() as db:
+                db.add(
+                    Deployment(
+                        id="dep_live",
+                        tenant_id="tenant_abc",
+                        adapter_id="adp_1",
+                        endpoint_name="ep-live",
+                        instance_type="ml.g5.xlarge",
+                        instance_count=1,
+                        status=DeploymentStatus.ACTIVE,
+                        last_used_at=stale,
+                        ttl_seconds=3600,
+                    )
+                )
+                await db.commit()
+
+            tracker = LastUsedTracker()
+            tracker.touch("dep_live")
+            tracker.touch("dep_deleted")
+            with patch("fastuner.core.inference.usage.AsyncSessionLocal", session_factory):
+                written = await tracker.flush()
+
+            async with session_factory() as db:
+                last_used = await db.scalar(
+                    select(Deployment.last_used_at).where(Deployment.id == "dep_live")
+                )
+            await engine.dispose()
+            return tracker, written, last_used
+
+        tracker, written, last_used = asyncio.run(scenario())
+
+        assert written == 2
+        assert tracker.drain() == {}
+        assert last_used.replace(tzinfo=None) > stale + timedelta(days=1)
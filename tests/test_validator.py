@@ -104,6 +104,16 @@ class TestDatasetValidator:
         records = DatasetValidator.validate_jsonl(jsonl, skip_min_samples=True)
         assert len(records) == 2  # Duplicate removed
 
+    def test_duplicate_detection_field_boundaries(self):
+        """Test records whose fields concatenate to the same text are kept"""
+        jsonl = '\n'.join([
+            '{"input_text": "ab", "target_text": "c"}',
+            '{"input_text": "a", "target_text": "bc"}',
+        ])
+
+        records = DatasetValidator.validate_jsonl(jsonl, skip_min_samples=True)
+        assert len(records) == 2
+
     def test_minimum_samples_check(self):
         """Test validation fails with insufficient samples"""
         # Create only 50 samples (below MIN_UNIQUE_SAMPLES = 100)
@@ -180,3 +190,75 @@ class TestDatasetValidator:
 
         records = DatasetValidator.validate_jsonl(jsonl, skip_min_samples=True)
         assert len(records) == 3
+
+    def test_validate_lines_from_binary_stream(self):
+        """Test validation of raw bytes lines from a binary file object"""
+        from io import BytesIO
+
+        stream = BytesIO(
+            b'{"input_text": "Hello", "target_text": "Bonjour"}\n'
+            b'\n'
+            b'{"input_text": "Hi", "target_text": "Salut"}\n'
+        )
+
+        records = DatasetValidator.validate_lines(stream, skip_min_samples=True)
+        assert len(records) == 2
+        assert records[1]["target_text"] == "Salut"
+
+    def test_validate_lines_non_utf8_bytes(self):
+        """Test validation fails with non-UTF-8 bytes"""
+        lines = [b'{"input_text": "Hello \xff", "target_text": "Bonjour"}']
+
+        with pytest.raises(ValidationError) as exc_info:
+            DatasetValidator.validate_lines(lines, skip_min_samples=True)
+
+        assert "non-utf-8" in str(exc_info.value).lower()
+
+    def test_validate_file_parallel_matches_sequential(self, tmp_path, monkeypatch):
+        """Test chunked multi-process validation keeps order, dedup and line numbers"""
+        from fastuner.core.dataset import validator
+
+        lines = [f'{{"input_text": "Q{i % 40}", "target_text": "A{i % 40}"}}' for i in range(120)]
+        lines.insert(50, "")
+        path = tmp_path / "data.jsonl"
+        path.write_text("\n".join(lines) + "\n")
+
+        # Force the parallel path with several small chunks
+        monkeypatch.setattr(validator, "PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(validator, "PARALLEL_CHUNK_BYTES", 512)
+
+        with open(path, "rb") as f:
+            records = DatasetValidator.validate_file(f, skip_min_samples=True, max_workers=2)
+
+        assert records == DatasetValidator.validate_jsonl(path.read_text(), skip_min_samples=True)
+        assert len(records) == 40
+
+        with open(path, "ab") as f:
+            f.write(b'{"input_text": "late"}\n')
+
+        with open(path, "rb") as f:
+            with pytest.raises(ValidationError) as exc_info:
+                DatasetValidator.validate_file(f, skip_min_samples=True, max_workers=2)
+
+        assert "Line 122" in str(exc_info.value)
+
+    def test_validate_file_parallel_anonymous_file(self, monkeypatch):
+        """Test the parallel path reads an unnamed spooled file from its current position"""
+        import tempfile
+
+        from fastuner.core.dataset import validator
+
+        payload = "".join(
+            f'{{"input_text": "Q{i}", "target_text": "A{i}"}}\n' for i in range(60)
+        ).encode()
+
+        monkeypatch.setattr(validator, "PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(validator, "PARALLEL_CHUNK_BYTES", 256)
+
+        with tempfile.SpooledTemporaryFile() as f:
+            f.write(b"ignored header\n" + payload)
+            f.seek(len(b"ignored header\n"))
+            records = DatasetValidator.validate_file(f, skip_min_samples=True, max_workers=2)
+
+        assert records == DatasetValidator.validate_lines(payload.splitlines(), skip_min_samples=True)
+        assert len(records) == 60